@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Fingerprinted, precompressed static assets for the viewer's images
+
+`build` copies every file the viewer can show (static/images with its derivatives, the blob
+store and the logo atlases) into static/assets/ under content-hash names, writes .gz and .br
+(brotli, from requirements.txt) next to each SVG, and records source path -> asset name in
+static/assets/manifest.json. Files whose mtime and size are unchanged are not re-hashed.
+`serve` serves that directory with immutable cache headers, strong ETags, Accept-Encoding
+negotiation and byte ranges:
+    python asset_server.py build
+    python asset_server.py serve --port 8502
+    VIEWER_ASSET_URL=http://localhost:8502 streamlit run app.py
+With VIEWER_ASSET_URL set the viewer references these URLs instead of sending image bytes
+through Streamlit's media manager, so a browser downloads each image once, ever.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # in requirements.txt; a bare install without it just skips .br files
+    brotli = None
+
+from blob_store import OBJECTS_DIR
+from logo_atlas import ATLAS_DIR
+
+BASE_DIR = Path(__file__).parent
+IMAGES_DIR = BASE_DIR / "static" / "images"
+ASSETS_DIR = BASE_DIR / "static" / "assets"
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 2
+
+ASSET_ROOTS = (IMAGES_DIR, OBJECTS_DIR, ATLAS_DIR)
+ASSET_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg')
+# Raster formats are already compressed; only SVG gets .gz/.br siblings
+COMPRESSIBLE_SUFFIXES = ('.svg',)
+FINGERPRINT_CHARS = 10
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+# Preferred first when the client accepts several
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8502
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+CHUNK_SIZE = 64 * 1024
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/svg+xml", ".svg")
+
+def manifest_path(out_dir=ASSETS_DIR):
+    return Path(out_dir) / MANIFEST_FILENAME
+
+def load_manifest(out_dir=ASSETS_DIR):
+    """{repo-relative source path: {name, mtime_ns, size, encodings}}"""
+    try:
+        with open(manifest_path(out_dir), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('files', {}) if manifest.get('version') == MANIFEST_VERSION else {}
+
+def save_manifest(files, out_dir=ASSETS_DIR):
+    path = manifest_path(out_dir)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'files': files}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def write_once(path, data):
+    """Write ``data`` atomically unless ``path`` exists (its name already pins its content)"""
+    if path.exists():
+        return
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+def publish(path, out_dir):
+    """Copy one file in under its fingerprinted name; returns its manifest entry"""
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:FINGERPRINT_CHARS]
+    # Logo atlases already carry their fingerprint
+    stem = path.stem if path.stem.endswith(f".{digest}") else f"{path.stem}.{digest}"
+    name = f"{stem}{path.suffix.lower()}"
+    target = out_dir / name
+    if target.exists() and os.path.samefile(path, target):
+        # Version 1 manifests hardlinked assets to their sources; detach them
+        target.unlink()
+    # A copy of the bytes just hashed, so the asset can never drift from its fingerprint
+    write_once(target, data)
+    encodings = {}
+    if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+        # mtime=0 keeps the .gz byte-identical across builds of the same content
+        variants = {'gzip': gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            variants['br'] = brotli.compress(data, quality=BROTLI_QUALITY)
+        for encoding, suffix in ENCODINGS:
+            compressed = variants.get(encoding)
+            if compressed is not None and len(compressed) < len(data):
+                write_once(out_dir / f"{name}{suffix}", compressed)
+                encodings[encoding] = len(compressed)
+    return {'name': name, 'size': len(data), 'encodings': encodings}
+
+def build_assets(roots=ASSET_ROOTS, out_dir=ASSETS_DIR, rebuild=False):
+    """Bring ``out_dir`` up to date with the asset roots; returns (manifest, published, removed)"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = {} if rebuild else load_manifest(out_dir)
+    files = {}
+    published = 0
+    for root in map(Path, roots):
+        if not root.is_dir():
+            continue
+        for path in sorted(root.rglob("*")):
+            if path.suffix.lower() not in ASSET_SUFFIXES or not path.is_file():
+                continue
+            key = path.relative_to(BASE_DIR).as_posix()
+            stat = path.stat()
+            old = previous.get(key)
+            if (old and (old['mtime_ns'], old['size']) == (stat.st_mtime_ns, stat.st_size)
+                    and (out_dir / old['name']).exists()):
+                files[key] = old
+                continue
+            if not stat.st_size:
+                continue
+            files[key] = dict(publish(path, out_dir), mtime_ns=stat.st_mtime_ns)
+            published += 1
+    # Anything no source maps to any more (old fingerprints, deleted files) is removed
+    keep = {MANIFEST_FILENAME}
+    for entry in files.values():
+        keep.add(entry['name'])
+        keep.update(entry['name'] + suffix for encoding, suffix in ENCODINGS if encoding in entry['encodings'])
+    removed = 0
+    for path in out_dir.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+            removed += 1
+    save_manifest(files, out_dir)
+    return files, published, removed
+
+def parse_range(header, size):
+    """(start, end) inclusive for a single 'bytes=' range; None to ignore it, ValueError if unsatisfiable"""
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if not length:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError(header)
+    return start, end
+
+def accepted_encodings(header):
+    """Content codings a client accepts (q=0 means refused)"""
+    accepted = set()
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token.strip().lower())
+    return accepted
+
+class AssetHandler(BaseHTTPRequestHandler):
+    """Serves fingerprinted files: immutable caching, ETag/If-None-Match, precompressed variants, ranges"""
+
+    protocol_version = "HTTP/1.1"
+    directory = ASSETS_DIR
+
+    def do_GET(self):
+        self.send_asset(head=False)
+
+    def do_HEAD(self):
+        self.send_asset(head=True)
+
+    def send_asset(self, head):
+        name = unquote(urlsplit(self.path).path).lstrip("/")
+        path = self.directory / name
+        # Flat directory: no subpaths, no dotfiles, and the manifest is not an asset
+        if not name or "/" in name or name.startswith(".") or name == MANIFEST_FILENAME or not path.is_file():
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        encoding = None
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        for candidate, suffix in ENCODINGS:
+            if candidate in accepted and path.with_name(path.name + suffix).is_file():
+                encoding, path = candidate, path.with_name(path.name + suffix)
+                break
+        # The fingerprint identifies the content; the coding distinguishes its representations
+        etag = f'"{name.rsplit(".", 2)[-2]}{"-" + encoding if encoding else ""}"'
+        size = path.stat().st_size
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_common_headers(etag, encoding)
+            self.end_headers()
+            return
+        span = None
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and (not if_range or if_range.strip() == etag):
+            try:
+                span = parse_range(range_header, size)
+            except ValueError:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_common_headers(etag, encoding)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        start, end = span or (0, size - 1)
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if span else HTTPStatus.OK)
+        self.send_common_headers(etag, encoding)
+        self.send_header("Content-Type", mimetypes.guess_type(name)[0] or "application/octet-stream")
+        if span:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if head:
+            return
+        with open(path, 'rb') as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def send_common_headers(self, etag, encoding):
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("X-Content-Type-Options", "nosniff")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, directory=ASSETS_DIR):
+    handler = type("Handler", (AssetHandler,), {'directory': Path(directory)})
+    return ThreadingHTTPServer((host, port), handler)
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Fingerprinted, precompressed image assets for the viewer")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="copy images into static/assets under content-hash names")
+    build_cmd.add_argument("--rebuild", action="store_true", help="re-hash every file, ignoring the manifest")
+    serve_cmd = sub.add_parser("serve", help="serve static/assets with immutable cache headers")
+    serve_cmd.add_argument("--host", default=DEFAULT_HOST, help=f"interface to bind (default: {DEFAULT_HOST})")
+    serve_cmd.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to listen on (default: {DEFAULT_PORT})")
+    serve_cmd.add_argument("--no-build", action="store_true", help="serve the existing assets without updating them")
+    return parser.parse_args(argv)
+
+def report_build(rebuild=False):
+    started = time.perf_counter()
+    files, published, removed = build_assets(rebuild=rebuild)
+    compressed = sum(1 for entry in files.values() if entry['encodings'])
+    print(f"📦 {len(files)} assets in {ASSETS_DIR} ({published} published, {removed} stale files removed, "
+          f"{compressed} precompressed{'' if brotli else ', no brotli'}) in {time.perf_counter() - started:.2f}s")
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "build":
+        report_build(args.rebuild)
+        return
+    if not args.no_build:
+        report_build()
+    server = make_server(args.host, args.port)
+    print(f"🚀 Serving {ASSETS_DIR} at http://{args.host}:{server.server_address[1]}")
+    print(f"   Start the viewer with VIEWER_ASSET_URL=http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
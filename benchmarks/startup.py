@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Startup and rerun benchmark for the Streamlit viewer
+
+Cold start runs the app once in a fresh interpreter (after Streamlit itself is imported), so
+module imports and first-render work are included. Reruns navigate to each page and then
+time repeated reruns on it, which is what every widget interaction costs:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --app /tmp/old-checkout/app.py --runs 10 --json before.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_APP = BASE_DIR / "app.py"
+APP_TIMEOUT = 120
+
+COLD_START_SNIPPET = """
+import logging, sys, time
+logging.disable(logging.CRITICAL)
+from streamlit.testing.v1 import AppTest
+started = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout={timeout}).run()
+elapsed = time.perf_counter() - started
+assert not at.exception, [e.message for e in at.exception]
+print(elapsed)
+"""
+
+def cold_start(app, runs):
+    """Seconds for the first run of the app in a fresh interpreter, one sample per run"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", COLD_START_SNIPPET.format(timeout=APP_TIMEOUT), str(app)],
+            cwd=Path(app).parent, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return samples
+
+def page_reruns(app, runs, measure=None):
+    """{page: {'first': seconds, 'reruns': [seconds, ...]}} measured in one session
+
+    ``measure(at)``, when given, runs on each page after its reruns and its return value is
+    stored under 'measured' (benchmarks/suite.py uses it for memory and payload size).
+    """
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(Path(app).parent)
+    at = AppTest.from_file(str(app), default_timeout=APP_TIMEOUT).run()
+    results = {}
+    for label in at.sidebar.radio[0].options:
+        started = time.perf_counter()
+        at.sidebar.radio[0].set_value(label).run()
+        first = time.perf_counter() - started
+        if at.exception:
+            raise RuntimeError(f"{label}: {[e.message for e in at.exception]}")
+        reruns = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            at.run()
+            reruns.append(time.perf_counter() - started)
+        results[label] = {'first': first, 'reruns': reruns}
+        if measure is not None:
+            results[label]['measured'] = measure(at)
+    return results
+
+def summarize(cold, pages):
+    """Medians in milliseconds"""
+    return {
+        'cold_start_ms': statistics.median(cold) * 1000,
+        'pages': {
+            label: {
+                'first_ms': result['first'] * 1000,
+                'rerun_ms': statistics.median(result['reruns']) * 1000,
+            }
+            for label, result in pages.items()
+        },
+    }
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark viewer cold start and per-page rerun time")
+    parser.add_argument("--app", type=Path, default=DEFAULT_APP, help="app script to benchmark (default: app.py)")
+    parser.add_argument("--runs", type=int, default=5, help="samples per measurement (default: 5)")
+    parser.add_argument("--json", type=Path, default=None, help="also write the summary here")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.disable(logging.CRITICAL)
+    app = args.app.resolve()
+    print(f"⏱️  Benchmarking {app} ({args.runs} runs each)")
+    print("=" * 60)
+    summary = summarize(cold_start(app, args.runs), page_reruns(app, args.runs))
+    print(f"🚀 Cold start: {summary['cold_start_ms']:.0f}ms (median)")
+    print(f"\n{'Page':<24} {'first visit':>12} {'rerun':>10}")
+    for label, page in summary['pages'].items():
+        print(f"{label:<24} {page['first_ms']:>10.0f}ms {page['rerun_ms']:>8.0f}ms")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
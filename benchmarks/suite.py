@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the viewer's render paths and the image download pipeline
+
+Pages are driven through Streamlit's AppTest runner: each page is visited, then rerun
+repeatedly for wall time (the fastest run is kept, being the least noisy), once under tracemalloc for peak Python memory, and its element tree
+is measured for the bytes the rerun sends to the browser. download_and_resize_image is timed
+against a local HTTP server, once on a generated fixture set and once on the scraped corpus.
+Results are written as JSON and compared against a stored baseline:
+    python benchmarks/suite.py                                   # compare with benchmarks/baseline.json
+    python benchmarks/suite.py --save-baseline                   # record a new baseline
+    python benchmarks/suite.py --only pages --runs 10 --json after.json --threshold 0.15
+Exits with status 1 when any metric is more than --threshold worse than the baseline.
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import warnings
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+from startup import page_reruns
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+DEFAULT_APP = BASE_DIR / "app.py"
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+CORPUS_DIR = BASE_DIR / "data" / "images"
+DEFAULT_THRESHOLD = 0.2
+SUITES = ('pages', 'download')
+
+# Generated fixture: (width, height, format) per image; seeded noise keeps it identical across runs
+FIXTURE_IMAGES = [(1600, 1200, 'JPEG')] * 6 + [(1200, 1200, 'PNG')] * 4 + [(400, 300, 'JPEG')] * 6
+FIXTURE_SEED = 20250903
+CORPUS_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp')
+
+def element_bytes(node):
+    """(serialized delta bytes, media file count) for an AppTest element tree
+
+    Raster images travel as media URLs whose payloads live in AppTest's per-run mock storage,
+    so they are counted rather than sized; inline data: URLs (SVGs) are part of the deltas.
+    """
+    size = media = 0
+    proto = getattr(node, 'proto', None)
+    if proto is not None and hasattr(proto, 'ByteSize'):
+        size += proto.ByteSize()
+        media += sum(1 for image in getattr(proto, 'imgs', ()) if not image.url.startswith('data:'))
+    for child in getattr(node, 'children', {}).values():
+        child_size, child_media = element_bytes(child)
+        size += child_size
+        media += child_media
+    return size, media
+
+def measure_page(at):
+    """Peak Python memory of one more rerun, plus the size of what it emitted"""
+    # Traced separately: tracemalloc slows allocation-heavy code down several times
+    tracemalloc.start()
+    at.run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    emitted, media = element_bytes(at._tree)
+    return {'peak_kb': peak / 1024, 'emitted_bytes': emitted, 'media_files': media}
+
+def bench_pages(app, runs):
+    """{page: {rerun_ms, first_ms, peak_kb, emitted_bytes, media_files}}"""
+    return {
+        label: {
+            'first_ms': result['first'] * 1000,
+            # Fastest of the reruns: on shared machines the median mostly measures the neighbours
+            'rerun_ms': min(result['reruns']) * 1000,
+            **result['measured'],
+        }
+        for label, result in page_reruns(app, runs, measure_page).items()
+    }
+
+def write_fixture(directory):
+    """Generate the fixture images; returns their filenames"""
+    from PIL import Image
+
+    rng = np.random.default_rng(FIXTURE_SEED)
+    names = []
+    for number, (width, height, fmt) in enumerate(FIXTURE_IMAGES, 1):
+        # Smooth gradients plus noise compress like photos rather than like flat colour
+        gradient = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+        pixels = np.clip(gradient + rng.normal(0, 40, (height, width, 3)), 0, 255).astype(np.uint8)
+        name = f"fixture-{number:02d}.{'jpg' if fmt == 'JPEG' else 'png'}"
+        Image.fromarray(pixels).save(Path(directory) / name, fmt)
+        names.append(name)
+    return names
+
+@contextlib.contextmanager
+def serve_directory(directory):
+    """Serve a directory over HTTP on localhost for the duration of the block; yields the base URL"""
+    handler = functools.partial(QuietHandler, directory=str(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+def output_name(name):
+    return Path(name).with_suffix(".jpg").as_posix().replace("/", "__")
+
+def time_downloads(base_url, names, runs):
+    """Best-of-``runs`` timings of download_and_resize_image over ``names``, fresh output dir per run"""
+    from download_images import build_session, download_and_resize_image
+
+    totals = []
+    per_file = []
+    source_bytes = output_bytes = 0
+    session = build_session()
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as out_dir, contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            # Corpus names repeat across site folders, so the output name keeps the folder
+            results = [download_and_resize_image(f"{base_url}/{name}", output_name(name),
+                                                 session=session, output_dir=out_dir)
+                       for name in names]
+            totals.append(time.perf_counter() - started)
+        failed = [r['filename'] for r in results if not r['ok']]
+        if failed:
+            raise RuntimeError(f"download failed for {failed}")
+        per_file.extend(r['seconds'] for r in results)
+        source_bytes = sum(r['bytes'] for r in results)
+        output_bytes = sum(r['manifest']['output_bytes'] for r in results)
+    total = min(totals)
+    return {
+        'files': len(names),
+        'total_ms': total * 1000,
+        'per_file_ms': statistics.median(per_file) * 1000,
+        'source_mb_per_s': source_bytes / total / 1e6,
+        'output_bytes': output_bytes,
+    }
+
+def bench_download(runs, corpus_dir=CORPUS_DIR):
+    """{'fixture': {...}, 'corpus': {...}} timings for download_and_resize_image over local HTTP"""
+    results = {}
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        names = write_fixture(fixture_dir)
+        with serve_directory(fixture_dir) as base_url:
+            results['fixture'] = time_downloads(base_url, names, runs)
+    corpus = sorted(
+        path.relative_to(corpus_dir).as_posix() for path in Path(corpus_dir).rglob("*")
+        if path.suffix.lower() in CORPUS_SUFFIXES and path.stat().st_size > 0
+    )
+    if corpus:
+        with serve_directory(corpus_dir) as base_url:
+            results['corpus'] = time_downloads(base_url, corpus, runs)
+    return results
+
+def flatten(results, prefix=''):
+    """{'pages.📊 Overview.rerun_ms': 12.3, ...} for every numeric metric"""
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            flat[prefix + key] = value
+    return flat
+
+# Metrics where a larger number is an improvement; everything else is lower-is-better
+HIGHER_IS_BETTER = ('mb_per_s',)
+# Counts describe the workload rather than its speed, and a first visit is a single sample
+NOT_COMPARED = ('files', 'media_files', 'first_ms')
+# Timing differences below this are scheduler noise, whatever the percentage
+NOISE_FLOOR_MS = 2.0
+
+def compare(current, baseline, threshold):
+    """[(metric, baseline, current, change)] for metrics more than ``threshold`` worse"""
+    regressions = []
+    old = flatten(baseline.get('results', {}))
+    for metric, value in flatten(current['results']).items():
+        name = metric.rsplit('.', 1)[-1]
+        if metric not in old or not old[metric] or name in NOT_COMPARED:
+            continue
+        change = (value - old[metric]) / old[metric]
+        if name.endswith(HIGHER_IS_BETTER):
+            change = -change
+        if name.endswith('_ms') and abs(value - old[metric]) < NOISE_FLOOR_MS:
+            continue
+        if change > threshold:
+            regressions.append((metric, old[metric], value, change))
+    return regressions
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark page reruns and the image download pipeline")
+    parser.add_argument("--app", type=Path, default=DEFAULT_APP, help="app script to benchmark (default: app.py)")
+    parser.add_argument("--runs", type=int, default=5, help="samples per measurement (default: 5)")
+    parser.add_argument("--only", choices=SUITES, action="append", help="run only this suite (repeatable)")
+    parser.add_argument("--json", type=Path, default=None, help="also write the results here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH,
+                        help="baseline to compare against (default: benchmarks/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before a metric counts as a regression (default: {DEFAULT_THRESHOLD})")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.disable(logging.CRITICAL)
+    warnings.filterwarnings("ignore", module="PIL")
+    suites = args.only or SUITES
+    print(f"⏱️  Running {', '.join(suites)} benchmarks ({args.runs} runs each)")
+    print("=" * 60)
+    results = {}
+    if 'pages' in suites:
+        results['pages'] = bench_pages(args.app.resolve(), args.runs)
+        print(f"{'Page':<24} {'rerun':>9} {'peak mem':>10} {'emitted':>10} {'media':>6}")
+        for label, page in results['pages'].items():
+            print(f"{label:<24} {page['rerun_ms']:>7.1f}ms {page['peak_kb']:>8.0f}KB "
+                  f"{page['emitted_bytes'] / 1024:>8.1f}KB {page['media_files']:>6}")
+    if 'download' in suites:
+        results['download'] = bench_download(args.runs)
+        print(f"\n{'Download set':<24} {'files':>6} {'total':>10} {'per file':>10} {'source MB/s':>12}")
+        for name, run in results['download'].items():
+            print(f"{name:<24} {run['files']:>6} {run['total_ms']:>8.0f}ms {run['per_file_ms']:>8.1f}ms "
+                  f"{run['source_mb_per_s']:>12.1f}")
+    current = {'environment': environment(), 'results': results}
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Results written to {args.json}")
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+        print(f"💾 Baseline written to {args.baseline}")
+        return
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"⚠️  No baseline at {args.baseline}; run with --save-baseline to record one")
+        return
+    regressions = compare(current, baseline, args.threshold)
+    if not regressions:
+        print(f"\n✅ No metric regressed by more than {args.threshold:.0%} against {args.baseline.name}")
+        return
+    print(f"\n❌ {len(regressions)} regressions over {args.threshold:.0%}:")
+    for metric, old, new, change in regressions:
+        print(f"  {metric}: {old:.1f} → {new:.1f} (+{change:.0%})")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
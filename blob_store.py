@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Content-addressed image store shared by data/images and static/images
+
+Every file is stored once under data/blobs/objects/<sha256[:2]>/<sha256><suffix>, and a logical-name
+index (repo-relative paths such as "static/images/cert_ai.jpg") maps names to blobs. Both
+download_images.py and app.py resolve images through the index.
+
+    python blob_store.py dedupe            # report duplicate bytes across the image trees
+    python blob_store.py dedupe --apply    # store each blob once and hardlink the copies to it
+    python blob_store.py ingest            # index every image without touching the files
+    python blob_store.py resolve static/images/cert_ai.jpg
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+BLOBS_DIR = BASE_DIR / "data" / "blobs"
+OBJECTS_DIR = BLOBS_DIR / "objects"
+BLOB_INDEX_PATH = BLOBS_DIR / "index.json"
+CONTENT_DIR = BASE_DIR / "data" / "content"
+
+# Trees scanned by ingest/dedupe; generated derivatives and partial downloads are not stored
+IMAGE_ROOTS = (BASE_DIR / "data" / "images", BASE_DIR / "static" / "images")
+EXCLUDED_DIRS = ("_derivatives", ".partial")
+CHUNK_SIZE = 1024 * 1024
+
+def file_digest(path):
+    """sha256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def blob_path(digest, suffix='', objects_dir=OBJECTS_DIR):
+    """Location of a blob in the store
+
+    The suffix is kept so consumers (st.image, browsers) can still infer the media type;
+    the same bytes under two suffixes are hardlinked, so they still occupy one copy.
+    """
+    return Path(objects_dir) / digest[:2] / f"{digest}{suffix.lower()}"
+
+def logical_name(path, base_dir=BASE_DIR):
+    """Repo-relative POSIX name used as the index key"""
+    return Path(path).resolve().relative_to(Path(base_dir).resolve()).as_posix()
+
+def load_blob_index(index_path=BLOB_INDEX_PATH):
+    """Load the logical name → {sha256, bytes} index"""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_blob_index(index, index_path=BLOB_INDEX_PATH):
+    """Atomically write the logical name index"""
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, copying when the filesystem cannot link"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def store_file(path, name, index, objects_dir=OBJECTS_DIR, digest=None):
+    """Add a file's bytes to the store (once) and point ``name`` at them; returns the blob path"""
+    path = Path(path)
+    digest = digest or file_digest(path)
+    target = blob_path(digest, path.suffix, objects_dir)
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Reuse the bytes of an existing blob with the same digest but another suffix (not a leftover .tmp)
+        existing = next((p for p in target.parent.glob(f"{digest}*") if p.stem == digest), None)
+        # Unique per process: parallel ingest workers may store the same digest at once
+        tmp_target = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        link_or_copy(existing or path, tmp_target)
+        os.replace(tmp_target, target)
+    index[name] = {
+        'sha256': digest,
+        'bytes': path.stat().st_size,
+        'blob': target.relative_to(objects_dir).as_posix(),
+    }
+    return target
+
+def resolve_blob(index, name, objects_dir=OBJECTS_DIR):
+    """Blob path for a logical name, or None when it is not indexed or the blob is missing"""
+    entry = index.get(name)
+    if not entry:
+        return None
+    target = Path(objects_dir) / entry['blob']
+    return target if target.exists() else None
+
+def iter_image_files(roots=IMAGE_ROOTS):
+    """Every non-empty file under the image trees, skipping generated directories"""
+    for root in map(Path, roots):
+        if not root.exists():
+            continue
+        for path in sorted(root.rglob("*")):
+            if not path.is_file() or path.stat().st_size == 0:
+                continue
+            if any(part in EXCLUDED_DIRS for part in path.relative_to(root).parts):
+                continue
+            yield path
+
+def find_duplicates(paths):
+    """Group files by content: {sha256: [paths]} for groups with more than one file
+
+    Files are bucketed by size first so only same-size candidates are hashed.
+    """
+    by_size = {}
+    for path in paths:
+        by_size.setdefault(path.stat().st_size, []).append(path)
+    groups = {}
+    for candidates in by_size.values():
+        if len(candidates) < 2:
+            continue
+        for path in candidates:
+            groups.setdefault(file_digest(path), []).append(path)
+    return {digest: files for digest, files in groups.items() if len(files) > 1}
+
+def inventory_duplicates(inventory):
+    """Repeated (category, filename) entries in images_inventory.json"""
+    repeats = []
+    for category, entries in (inventory or {}).items():
+        counts = {}
+        for entry in entries:
+            counts[entry['filename']] = counts.get(entry['filename'], 0) + 1
+        repeats.extend((category, filename, count) for filename, count in counts.items() if count > 1)
+    return repeats
+
+def replace_with_link(path, target):
+    """Swap a file for a hardlink to ``target`` without a window where it is missing"""
+    tmp_path = path.with_name(path.name + '.dedupe-tmp')
+    os.link(target, tmp_path)
+    os.replace(tmp_path, path)
+
+def ingest(roots=IMAGE_ROOTS, index_path=BLOB_INDEX_PATH, objects_dir=OBJECTS_DIR):
+    """Index every image under ``roots`` into the store"""
+    index = load_blob_index(index_path)
+    for path in iter_image_files(roots):
+        store_file(path, logical_name(path), index, objects_dir)
+    save_blob_index(index, index_path)
+    return index
+
+def dedupe(roots=IMAGE_ROOTS, apply=False, index_path=BLOB_INDEX_PATH, objects_dir=OBJECTS_DIR):
+    """Report duplicated bytes and, with ``apply``, collapse every copy onto one blob"""
+    groups = find_duplicates(list(iter_image_files(roots)))
+    wasted = sum(files[0].stat().st_size * (len(files) - 1) for files in groups.values())
+    reclaimed = 0
+    index = load_blob_index(index_path)
+    for digest, files in sorted(groups.items(), key=lambda g: -g[1][0].stat().st_size):
+        size = files[0].stat().st_size
+        print(f"🔁 {len(files)}x {size:>10,} bytes  {digest[:12]}")
+        for path in files:
+            print(f"     - {logical_name(path)}")
+        if not apply:
+            continue
+        for path in files:
+            target = store_file(path, logical_name(path), index, objects_dir, digest)
+            if os.path.samefile(path, target):
+                continue
+            try:
+                replace_with_link(path, target)
+                reclaimed += size
+            except OSError as e:
+                print(f"❌ Could not link {logical_name(path)}: {str(e)}")
+    if apply:
+        save_blob_index(index, index_path)
+    return {'groups': len(groups), 'wasted_bytes': wasted, 'reclaimed_bytes': max(reclaimed, 0)}
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Content-addressed store for scraped images")
+    sub = parser.add_subparsers(dest="command", required=True)
+    dedupe_cmd = sub.add_parser("dedupe", help="report (and optionally reclaim) duplicated image bytes")
+    dedupe_cmd.add_argument("--apply", action="store_true",
+                            help="hardlink duplicate files to a single blob")
+    sub.add_parser("ingest", help="index every image into the store")
+    resolve_cmd = sub.add_parser("resolve", help="print the blob path for a logical name")
+    resolve_cmd.add_argument("name")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "ingest":
+        index = ingest()
+        blobs = len({entry['sha256'] for entry in index.values()})
+        print(f"📦 Indexed {len(index)} names onto {blobs} blobs in {BLOBS_DIR}")
+    elif args.command == "resolve":
+        target = resolve_blob(load_blob_index(), args.name)
+        if not target:
+            print(f"❌ {args.name} is not in the store")
+            sys.exit(1)
+        print(target)
+    else:
+        print("🧹 Scanning image trees for duplicate content")
+        print("=" * 60)
+        report = dedupe(apply=args.apply)
+        try:
+            with open(CONTENT_DIR / 'images_inventory.json', 'r', encoding='utf-8') as f:
+                repeats = inventory_duplicates(json.load(f))
+        except (OSError, ValueError):
+            repeats = []
+        if repeats:
+            print("\n📋 Repeated images_inventory.json entries:")
+            for category, filename, count in repeats:
+                print(f"  - {category}/{filename} x{count}")
+        print(f"\n📊 {report['groups']} duplicate groups, {report['wasted_bytes']:,} bytes wasted")
+        if args.apply:
+            print(f"✅ Reclaimed {report['reclaimed_bytes']:,} bytes")
+        else:
+            print("Run with --apply to hardlink duplicates onto a single blob")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Typed content store for courses, services, testimonials and FAQs
+
+Records live in data/content/catalog.json and are loaded once per process into compact
+slotted dataclasses, validated, and indexed by id, category and certification:
+    python content_store.py            # validate catalog.json and print a summary
+"""
+
+import json
+import sys
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+CATALOG_PATH = BASE_DIR / "data" / "content" / "catalog.json"
+CATALOG_VERSION = 1
+
+class ContentValidationError(ValueError):
+    """Raised when catalog.json has missing, unknown or duplicate fields"""
+
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__("; ".join(problems))
+
+@dataclass(frozen=True, slots=True)
+class Course:
+    id: str
+    title: str
+    category: str
+    certification: str
+    price: str
+    description: str
+    image: str
+
+@dataclass(frozen=True, slots=True)
+class Service:
+    id: str
+    number: str
+    name: str
+    description: str
+    icon: str
+
+@dataclass(frozen=True, slots=True)
+class Testimonial:
+    id: str
+    client: str
+    author: str
+    position: str
+    project: str
+    quote: str
+
+@dataclass(frozen=True, slots=True)
+class Faq:
+    id: str
+    question: str
+    answer: str
+
+# catalog.json section -> record type
+RECORD_TYPES = {
+    'courses': Course,
+    'services': Service,
+    'testimonials': Testimonial,
+    'faqs': Faq,
+}
+
+def build_records(section, rows, problems):
+    """Validate one catalog section and turn its rows into records"""
+    record_type = RECORD_TYPES[section]
+    names = [f.name for f in fields(record_type)]
+    records = []
+    seen = set()
+    for position, row in enumerate(rows):
+        where = f"{section}[{position}]"
+        if not isinstance(row, dict):
+            problems.append(f"{where}: expected an object")
+            continue
+        missing = [n for n in names if not isinstance(row.get(n), str) or not row[n].strip()]
+        unknown = sorted(set(row) - set(names))
+        if missing:
+            problems.append(f"{where}: missing or empty {', '.join(missing)}")
+        if unknown:
+            problems.append(f"{where}: unknown field(s) {', '.join(unknown)}")
+        if missing or unknown:
+            continue
+        if row['id'] in seen:
+            problems.append(f"{where}: duplicate id {row['id']!r}")
+            continue
+        seen.add(row['id'])
+        records.append(record_type(**{n: row[n] for n in names}))
+    return tuple(records)
+
+def group_by(records, attribute):
+    """{value: (records...)} preserving catalogue order"""
+    groups = {}
+    for record in records:
+        groups.setdefault(getattr(record, attribute), []).append(record)
+    return {key: tuple(items) for key, items in groups.items()}
+
+class ContentStore:
+    """Immutable, indexed view over catalog.json"""
+
+    __slots__ = ('courses', 'services', 'testimonials', 'faqs',
+                 '_by_id', 'courses_by_category', 'courses_by_certification')
+
+    def __init__(self, courses=(), services=(), testimonials=(), faqs=()):
+        self.courses = tuple(courses)
+        self.services = tuple(services)
+        self.testimonials = tuple(testimonials)
+        self.faqs = tuple(faqs)
+        self._by_id = {
+            section: {record.id: record for record in getattr(self, section)}
+            for section in RECORD_TYPES
+        }
+        self.courses_by_category = group_by(self.courses, 'category')
+        self.courses_by_certification = group_by(self.courses, 'certification')
+
+    def get(self, section, record_id):
+        """Record by id within a section, or None"""
+        return self._by_id[section].get(record_id)
+
+    def course(self, course_id):
+        return self._by_id['courses'].get(course_id)
+
+    def courses_in_category(self, category):
+        return self.courses_by_category.get(category, ())
+
+    def courses_for_certification(self, certification):
+        return self.courses_by_certification.get(certification, ())
+
+    def categories(self):
+        return sorted(self.courses_by_category)
+
+    def summary(self):
+        return {section: len(getattr(self, section)) for section in RECORD_TYPES}
+
+def parse_catalog(data):
+    """Validate a decoded catalog document and build a ContentStore"""
+    problems = []
+    if not isinstance(data, dict):
+        raise ContentValidationError(["catalog must be a JSON object"])
+    if data.get('version') != CATALOG_VERSION:
+        problems.append(f"unsupported catalog version {data.get('version')!r}")
+    sections = {}
+    for section in RECORD_TYPES:
+        rows = data.get(section, [])
+        if not isinstance(rows, list):
+            problems.append(f"{section}: expected a list")
+            rows = []
+        sections[section] = build_records(section, rows, problems)
+    if problems:
+        raise ContentValidationError(problems)
+    return ContentStore(**sections)
+
+def load_content_store(path=CATALOG_PATH):
+    """Load and validate catalog.json"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_catalog(json.load(f))
+
+def main():
+    try:
+        store = load_content_store()
+    except ContentValidationError as e:
+        print(f"❌ {CATALOG_PATH.name} is invalid:")
+        for problem in e.problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print(f"✅ {CATALOG_PATH.name} is valid")
+    for section, count in store.summary().items():
+        print(f"  - {section}: {count}")
+    print(f"  - course categories: {', '.join(store.categories())}")
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,68 @@
 #!/usr/bin/env python3
 """
 Download and organize images from Tharwah Academy website for Streamlit app
+
+Downloads run on a bounded thread pool over one pooled keep-alive session and feed a
+process pool that does the decode/resize/encode work (see image_pipeline.py). Bodies are
+streamed to .partial/<name>.part next to the output, resumed with Range/If-Range after a
+dropped connection (or an interrupted run), size-capped and hash-verified before use:
+    python download_images.py --workers 8 --per-host 4 --processes 4
+    python download_images.py --base-url http://127.0.0.1:8000 --output-dir /tmp/images
+    python download_images.py --max-kbps 512 --max-file-mb 20 --documents   # also fetch links.json documents
 """
 
+import argparse
+import base64
+import hashlib
+import json
 import requests
 import os
-from pathlib import Path
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+from urllib.parse import unquote, urlsplit, urlunsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
-import io
+from blob_store import load_blob_index, logical_name, save_blob_index, store_file
+from image_pipeline import (
+    add_stage_timings,
+    build_derivatives,
+    new_stage_totals,
+    print_stage_timings,
+    process_pool,
+    transcode_image,
+)
 
 # Create directories
 BASE_DIR = Path(__file__).parent
 STATIC_DIR = BASE_DIR / "static"
 IMAGES_DIR = STATIC_DIR / "images"
 IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+DOCUMENTS_DIR = STATIC_DIR / "documents"
+CONTENT_DIR = BASE_DIR / "data" / "content"
+
+# Download engine defaults
+DEFAULT_WORKERS = 8
+PER_HOST_CONNECTIONS = 4
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+REQUEST_TIMEOUT = 30
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Streaming: bodies go to PARTIAL_DIRNAME/<name>.part in CHUNK_SIZE pieces, never whole into memory
+CHUNK_SIZE = 64 * 1024
+PARTIAL_DIRNAME = ".partial"
+MAX_FILE_MB = 50
+
+# Links in links.json with these suffixes are downloadable documents (company profile, calendar)
+DOCUMENT_SUFFIXES = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx')
+
+# Incremental refresh manifest (ETag / Last-Modified / content hashes per file)
+MANIFEST_FILENAME = "download_manifest.json"
+MANIFEST_VERSION = 1
 
 # Key images from Tharwah Academy website
 IMAGES_TO_DOWNLOAD = {
@@ -29,36 +78,538 @@ IMAGES_TO_DOWNLOAD = {
     "about_us.jpg": "https://academy.tharwah.net/wp-content/uploads/2024/06/about-tharwah.jpg"
 }
 
-def download_and_resize_image(url, filename, max_width=800, max_height=600):
-    """Download image and resize it for web use"""
+def build_session(workers=DEFAULT_WORKERS, per_host=PER_HOST_CONNECTIONS,
+                  retries=MAX_RETRIES, backoff=BACKOFF_FACTOR):
+    """Create a keep-alive session with per-host connection limits and retry backoff"""
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False,
+    )
+    # urllib3 keeps one pool per host; blocking pools cap concurrent connections per host
+    adapter = HTTPAdapter(
+        pool_connections=max(workers, 1),
+        pool_maxsize=max(per_host, 1),
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = 'i-solutions-content-viewer/1.0'
+    return session
+
+def rebase_url(url, base_url):
+    """Point a URL at another scheme/host, keeping its path (used for local stand-in servers)"""
+    if not base_url:
+        return url
+    base = urlsplit(base_url)
+    parts = urlsplit(url)
+    path = base.path.rstrip('/') + parts.path
+    return urlunsplit((base.scheme, base.netloc, path, parts.query, ''))
+
+def load_manifest(output_dir=None):
+    """Load the download manifest for an output directory"""
+    path = (Path(output_dir) if output_dir else IMAGES_DIR) / MANIFEST_FILENAME
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == MANIFEST_VERSION:
+            return data.get('files', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_manifest(entries, output_dir=None):
+    """Atomically write the download manifest for an output directory"""
+    path = (Path(output_dir) if output_dir else IMAGES_DIR) / MANIFEST_FILENAME
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'files': entries}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def conditional_headers(entry):
+    """Build If-None-Match / If-Modified-Since headers from a manifest entry"""
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+class DownloadError(ValueError):
+    """A body that was too large, truncated or failed hash verification"""
+
+class BandwidthBudget:
+    """Token bucket shared by every download thread, capping their combined transfer rate"""
+
+    def __init__(self, bytes_per_second):
+        self.rate = bytes_per_second
+        # One second of burst, but never less than a chunk so a single read can always proceed
+        self.capacity = max(bytes_per_second, CHUNK_SIZE)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_kbps(cls, kbps):
+        """Budget for a KiB/s cap, or None for no cap"""
+        return cls(kbps * 1024) if kbps else None
+
+    def consume(self, amount):
+        """Charge ``amount`` bytes, sleeping for as long as the bucket is in debt"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+def partial_path(output_dir, filename):
+    """Where an in-progress download of ``filename`` is streamed to"""
+    return Path(output_dir) / PARTIAL_DIRNAME / f"{filename}.part"
+
+def discard_partial(part_path):
+    """Remove a partial download and its resume metadata"""
+    part_path = Path(part_path)
+    for path in (part_path, part_path.with_name(f"{part_path.name}.json")):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+def load_resume_state(part_path, url):
+    """Validators and expected digests saved when ``part_path`` was started, if it is resumable"""
+    try:
+        with open(part_path.with_name(f"{part_path.name}.json"), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get('url') == url and part_path.exists() else None
+
+def save_resume_state(part_path, state):
+    meta_path = part_path.with_name(f"{part_path.name}.json")
+    tmp_path = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, meta_path)
+
+def if_range_validator(state):
+    """A strong ETag (weak ones may not be used with If-Range), else Last-Modified"""
+    etag = state.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return state.get('last_modified')
+
+def expected_digests(headers, whole_body):
+    """{algorithm: hex} the server vouches for, from Repr-Digest / Digest / Content-MD5
+
+    Content-MD5 covers the message body, so it is only used for a complete 200 response.
+    """
+    digests = {}
+    for field in (headers.get('Repr-Digest', ''), headers.get('Digest', '')):
+        for item in filter(None, (part.strip() for part in field.split(','))):
+            algorithm, _, value = item.partition('=')
+            algorithm = algorithm.strip().lower().replace('-', '')
+            if algorithm in ('sha256', 'md5') and algorithm not in digests:
+                try:
+                    digests[algorithm] = base64.b64decode(value.strip().strip(':')).hex()
+                except ValueError:
+                    continue
+    if whole_body and headers.get('Content-MD5') and 'md5' not in digests:
+        try:
+            digests['md5'] = base64.b64decode(headers['Content-MD5']).hex()
+        except ValueError:
+            pass
+    return digests
+
+def content_range(headers):
+    """(first byte, complete length or None) from a 206's Content-Range, or None"""
+    unit, _, spec = headers.get('Content-Range', '').partition(' ')
+    span, _, total = spec.partition('/')
+    first, _, _ = span.partition('-')
+    if unit != 'bytes' or not first.isdigit():
+        return None
+    return int(first), int(total) if total.isdigit() else None
+
+def file_digests(path, algorithms):
+    """{algorithm: hex} of a file, read in chunks"""
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+def stream_download(http, url, part_path, headers=None, budget=None,
+                    max_bytes=MAX_FILE_MB * 1024 * 1024, retries=MAX_RETRIES):
+    """Stream ``url`` into ``part_path``, resuming from whatever is already there
+
+    A connection dropped mid-body is retried from the bytes already on disk with
+    Range/If-Range, so a large file never restarts from zero unless the server's copy changed.
+    Returns None for a 304, else {'etag', 'last_modified', 'sha256', 'size', 'transferred'}
+    once the file is complete and matches its declared length and any digest headers.
+    """
+    part_path = Path(part_path)
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    state = load_resume_state(part_path, url)
+    transferred = 0
+    attempt = 0
+    while True:
+        received = transferred
+        request_headers = {'Accept-Encoding': 'identity', **(headers or {})}
+        offset = part_path.stat().st_size if state and if_range_validator(state) else 0
+        if offset:
+            request_headers['Range'] = f"bytes={offset}-"
+            request_headers['If-Range'] = if_range_validator(state)
+        try:
+            with http.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                if response.status_code == 304:
+                    discard_partial(part_path)
+                    return None
+                if response.status_code == 416 and offset:
+                    # The partial file does not fit the current representation; start over
+                    discard_partial(part_path)
+                    state = None
+                    continue
+                response.raise_for_status()
+                resumed = content_range(response.headers) if response.status_code == 206 else None
+                if response.status_code == 206 and (not resumed or resumed[0] != offset):
+                    if not offset:
+                        raise DownloadError("server sent a partial response to a full request")
+                    # A range we did not ask for; fetch the whole body instead
+                    discard_partial(part_path)
+                    state = None
+                    continue
+                if resumed:
+                    total = resumed[1]
+                    state['digests'] = {**expected_digests(response.headers, False), **state['digests']}
+                    mode = 'ab'
+                else:
+                    length = response.headers.get('Content-Length', '')
+                    total = int(length) if length.isdigit() else None
+                    offset = 0
+                    state = {'url': url, 'etag': response.headers.get('ETag'),
+                             'last_modified': response.headers.get('Last-Modified'),
+                             'digests': expected_digests(response.headers, True), 'total': total}
+                    save_resume_state(part_path, state)
+                    mode = 'wb'
+                total = total or state.get('total')
+                if total and total > max_bytes:
+                    discard_partial(part_path)
+                    raise DownloadError(f"{total:,} bytes exceeds the {max_bytes:,} byte limit")
+                size = offset
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > max_bytes:
+                            raise DownloadError(f"body exceeds the {max_bytes:,} byte limit")
+                        if budget:
+                            budget.consume(len(chunk))
+                        f.write(chunk)
+                        transferred += len(chunk)
+            break
+        except DownloadError:
+            discard_partial(part_path)
+            raise
+        except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout):
+            # Connect failures are already retried by the session; resume only a body cut short
+            attempt += 1
+            if attempt > retries or transferred == received:
+                raise
+            time.sleep(BACKOFF_FACTOR * 2 ** (attempt - 1))
+    if total is not None and size != total:
+        discard_partial(part_path)
+        raise DownloadError(f"truncated: got {size:,} of {total:,} bytes")
+    digests = file_digests(part_path, {'sha256', *state['digests']})
+    for algorithm, expected in state['digests'].items():
+        if digests[algorithm] != expected:
+            discard_partial(part_path)
+            raise DownloadError(f"{algorithm} mismatch: expected {expected}, got {digests[algorithm]}")
+    return {'etag': state['etag'], 'last_modified': state['last_modified'],
+            'sha256': digests['sha256'], 'size': size, 'transferred': transferred}
+
+def fetch_file(url, filename, params=None, session=None, output_dir=None, previous=None,
+               budget=None, max_bytes=MAX_FILE_MB * 1024 * 1024):
+    """Stream one file to a verified partial, honouring the manifest entry from the last run
+
+    Returns a result dict whose ``status`` is ``fetched`` (the verified body is at ``source``
+    and the caller must consume and discard_partial() it), ``unchanged`` (existing output is
+    still valid) or ``failed``.
+    """
+    output_dir = Path(output_dir) if output_dir else IMAGES_DIR
+    output_path = output_dir / filename
+    part_path = partial_path(output_dir, filename)
+    result = {'filename': filename, 'url': url, 'ok': False, 'status': 'failed',
+              'bytes': 0, 'seconds': 0.0, 'error': None, 'manifest': previous,
+              'source': None, 'timings': {}, 'started_at': time.perf_counter()}
+    started = result['started_at']
+    # Only trust the previous entry if its output is still on disk and was made with the same settings
+    reusable = bool(previous) and output_path.exists() and previous.get('params') == params \
+        and previous.get('url') == url
     try:
         print(f"Downloading {filename}...")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        # Open image with PIL
-        image = Image.open(io.BytesIO(response.content))
+        http = session or requests
+        headers = conditional_headers(previous) if reusable else {}
+        download = stream_download(http, url, part_path, headers, budget, max_bytes)
+        if download is None:
+            result.update(ok=True, status='unchanged')
+            print(f"⏭️  {filename} not modified upstream")
+            return result
+        result['bytes'] = download['transferred']
+        entry = {
+            'url': url,
+            'etag': download['etag'],
+            'last_modified': download['last_modified'],
+            'sha256': download['sha256'],
+            'source_bytes': download['size'],
+            'params': params,
+        }
         
-        # Convert to RGB if necessary
-        if image.mode in ('RGBA', 'LA', 'P'):
-            image = image.convert('RGB')
+        if reusable and previous.get('sha256') == entry['sha256']:
+            # Server ignored the validators but the bytes are the same; keep the existing output
+            discard_partial(part_path)
+            entry['output_bytes'] = previous.get('output_bytes', output_path.stat().st_size)
+            result.update(ok=True, status='unchanged', manifest=entry)
+            print(f"⏭️  {filename} content unchanged, skipping resize")
+            return result
         
-        # Resize while maintaining aspect ratio
-        image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-        
-        # Save optimized image
-        output_path = IMAGES_DIR / filename
-        image.save(output_path, 'JPEG', quality=85, optimize=True)
-        
-        print(f"✅ Saved {filename} ({image.size[0]}x{image.size[1]})")
-        return True
+        result.update(status='fetched', manifest=entry, source=str(part_path))
         
     except Exception as e:
+        result['error'] = str(e)
         print(f"❌ Failed to download {filename}: {str(e)}")
-        return False
+    finally:
+        result['timings']['fetch'] = time.perf_counter() - started
+        result['seconds'] = result['timings']['fetch']
+    return result
+
+def fetch_image(url, filename, max_width=800, max_height=600, session=None, output_dir=None,
+                previous=None, budget=None, max_bytes=MAX_FILE_MB * 1024 * 1024):
+    """fetch_file() for an image that will be transcoded to fit ``max_width`` x ``max_height``"""
+    return fetch_file(url, filename, [max_width, max_height], session, output_dir, previous,
+                      budget, max_bytes)
+
+def finish_transcode(result, transcoded):
+    """Fold a transcode_image outcome into a fetch result"""
+    result['manifest']['output_bytes'] = transcoded['output_bytes']
+    result['timings'].update(transcoded['timings'])
+    result.update(ok=True, status='downloaded', seconds=time.perf_counter() - result['started_at'])
+    print(f"✅ Saved {result['filename']} ({transcoded['width']}x{transcoded['height']}) "
+          f"in {result['seconds']:.2f}s")
+    return result
+
+def download_and_resize_image(url, filename, max_width=800, max_height=600,
+                              session=None, output_dir=None, previous=None,
+                              budget=None, max_bytes=MAX_FILE_MB * 1024 * 1024):
+    """Download image and resize it for web use
+
+    ``previous`` is this file's manifest entry from the last run; when given, the request is
+    conditional and the resize is skipped if the upstream bytes did not change. This is the
+    serial path; download_all() runs the same stages on separate pools.
+    """
+    output_dir = Path(output_dir) if output_dir else IMAGES_DIR
+    result = fetch_image(url, filename, max_width, max_height, session, output_dir, previous,
+                         budget, max_bytes)
+    if result['status'] != 'fetched':
+        return result
+    source = result.pop('source')
+    try:
+        transcoded = transcode_image(source, output_dir / filename, max_width, max_height, 'JPEG')
+        return finish_transcode(result, transcoded)
+    except Exception as e:
+        result.update(status='failed', error=str(e), seconds=time.perf_counter() - result['started_at'])
+        print(f"❌ Failed to process {filename}: {str(e)}")
+        return result
+    finally:
+        discard_partial(source)
+
+def download_all(images, workers=DEFAULT_WORKERS, per_host=PER_HOST_CONNECTIONS,
+                 base_url=None, output_dir=None, session=None, incremental=True,
+                 processes=None, max_width=800, max_height=600,
+                 budget=None, max_bytes=MAX_FILE_MB * 1024 * 1024):
+    """Download a {filename: url} mapping and transcode it, returning per-file results
+
+    Fetches run on a bounded thread pool and feed a bounded queue; the main thread drains the
+    queue into a process pool so decoding and encoding use every core while downloads continue.
+    With ``incremental`` the manifest next to the images drives conditional requests, and is
+    rewritten once all workers finish so threads never share it. Every fetch thread draws on
+    the same ``budget``, so a bandwidth cap holds for the run as a whole.
+    """
+    output_dir = Path(output_dir) if output_dir else IMAGES_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(output_dir) if incremental else {}
+    owns_session = session is None
+    session = session or build_session(workers, per_host)
+    fetched = queue.Queue(maxsize=max(workers, 1) * 2)
+    results = []
+    
+    def fetch_into_queue(filename, url):
+        result = fetch_image(rebase_url(url, base_url), filename, max_width, max_height,
+                             session, output_dir, manifest.get(filename), budget, max_bytes)
+        result['fetched_at'] = time.perf_counter()
+        fetched.put(result)
+    
+    try:
+        # The transcode pool never forks this process (see POOL_START_METHOD), so it is safe to
+        # start workers while fetch threads are mid-request
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as fetchers, process_pool(processes) as transcoders:
+            for filename, url in images.items():
+                fetchers.submit(fetch_into_queue, filename, url)
+            pending = {}
+            for _ in range(len(images)):
+                result = fetched.get()
+                if result['status'] != 'fetched':
+                    results.append(result)
+                    continue
+                future = transcoders.submit(transcode_image, result['source'],
+                                            output_dir / result['filename'],
+                                            max_width, max_height, 'JPEG')
+                pending[future] = result
+            for future in as_completed(pending):
+                result = pending[future]
+                discard_partial(result.pop('source'))
+                try:
+                    transcoded = future.result()
+                    # Whatever the job did not spend transcoding, it spent waiting for a core
+                    waited = time.perf_counter() - result['fetched_at'] - sum(transcoded['timings'].values())
+                    result['timings']['queue'] = max(waited, 0.0)
+                    results.append(finish_transcode(result, transcoded))
+                except Exception as e:
+                    result.update(status='failed', error=str(e),
+                                  seconds=time.perf_counter() - result['started_at'])
+                    print(f"❌ Failed to process {result['filename']}: {str(e)}")
+                    results.append(result)
+    finally:
+        if owns_session:
+            session.close()
+    for r in results:
+        if r['ok'] and r['manifest']:
+            manifest[r['filename']] = r['manifest']
+    save_manifest(manifest, output_dir)
+    return sorted(results, key=lambda r: r['filename'])
+
+def document_links(links):
+    """{filename: url} for the downloadable documents (PDFs, decks, sheets) in a links.json
+
+    Only absolute http(s) links are used. Names come from the URL path; a name taken by a
+    different URL gets a numeric suffix.
+    """
+    documents = {}
+    seen = set()
+    for items in (links or {}).values():
+        for item in items:
+            url = item.get('url', '')
+            parts = urlsplit(url)
+            name = unquote(PurePosixPath(parts.path).name)
+            if parts.scheme not in ('http', 'https') or url in seen \
+                    or PurePosixPath(name).suffix.lower() not in DOCUMENT_SUFFIXES:
+                continue
+            seen.add(url)
+            stem, suffix = PurePosixPath(name).stem, PurePosixPath(name).suffix
+            filename, n = name, 1
+            while filename in documents:
+                n += 1
+                filename = f"{stem}-{n}{suffix}"
+            documents[filename] = url
+    return documents
 
-def create_placeholder_images():
+def load_document_links(content_dir=CONTENT_DIR):
+    """document_links() of a content directory's links.json ({} if it has none)"""
+    try:
+        with open(Path(content_dir) / "links.json", 'r', encoding='utf-8') as f:
+            return document_links(json.load(f))
+    except (OSError, ValueError):
+        return {}
+
+def download_document(url, filename, session=None, output_dir=None, previous=None,
+                      budget=None, max_bytes=MAX_FILE_MB * 1024 * 1024):
+    """Download one document as-is; the verified partial is renamed into place"""
+    output_dir = Path(output_dir) if output_dir else DOCUMENTS_DIR
+    result = fetch_file(url, filename, None, session, output_dir, previous, budget, max_bytes)
+    if result['status'] != 'fetched':
+        return result
+    source = result.pop('source')
+    try:
+        os.replace(source, output_dir / filename)
+    except OSError as e:
+        result.update(status='failed', error=str(e))
+        print(f"❌ Failed to save {filename}: {str(e)}")
+        return result
+    finally:
+        discard_partial(source)
+    result['manifest']['output_bytes'] = result['manifest']['source_bytes']
+    result.update(ok=True, status='downloaded', seconds=time.perf_counter() - result['started_at'])
+    print(f"✅ Saved {filename} ({result['manifest']['source_bytes']:,} bytes) in {result['seconds']:.2f}s")
+    return result
+
+def download_documents(documents, workers=DEFAULT_WORKERS, per_host=PER_HOST_CONNECTIONS,
+                       base_url=None, output_dir=None, session=None, incremental=True,
+                       budget=None, max_bytes=MAX_FILE_MB * 1024 * 1024):
+    """Download a {filename: url} mapping of documents, returning per-file results
+
+    Same manifest, resume and budget rules as download_all(), without the transcode stage.
+    """
+    output_dir = Path(output_dir) if output_dir else DOCUMENTS_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(output_dir) if incremental else {}
+    owns_session = session is None
+    session = session or build_session(workers, per_host)
+    try:
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as fetchers:
+            futures = [fetchers.submit(download_document, rebase_url(url, base_url), filename, session,
+                                       output_dir, manifest.get(filename), budget, max_bytes)
+                       for filename, url in documents.items()]
+            results = [future.result() for future in futures]
+    finally:
+        if owns_session:
+            session.close()
+    for r in results:
+        if r['ok'] and r['manifest']:
+            manifest[r['filename']] = r['manifest']
+    save_manifest(manifest, output_dir)
+    return sorted(results, key=lambda r: r['filename'])
+
+def register_in_blob_store(paths):
+    """Point the content-addressed store's logical names at freshly written images"""
+    index = load_blob_index()
+    registered = 0
+    for path in paths:
+        try:
+            store_file(path, logical_name(path), index)
+            registered += 1
+        except ValueError:
+            # Output outside the repo (e.g. --output-dir /tmp/...) has no logical name
+            continue
+    if registered:
+        save_blob_index(index)
+        print(f"📦 Registered {registered} images in the blob store")
+
+def print_timings(results, elapsed, stages=True):
+    """Print per-file timings and overall throughput, plus the pipeline stage breakdown"""
+    print("\n⏱️  Per-file timings:")
+    for r in results:
+        status = {"downloaded": "✅", "unchanged": "⏭️ "}.get(r['status'], "❌")
+        print(f"  {status} {r['filename']:<28} {r['seconds']:6.2f}s {r['bytes']:>10,} bytes")
+    total_bytes = sum(r['bytes'] for r in results)
+    rate = total_bytes / elapsed if elapsed > 0 else 0.0
+    print(f"\n🚀 Throughput: {len(results)} files, {total_bytes:,} bytes in {elapsed:.2f}s "
+          f"({rate / 1024:,.1f} KiB/s, {len(results) / elapsed if elapsed > 0 else 0.0:.1f} files/s)")
+    if not stages:
+        return
+    totals = new_stage_totals()
+    for r in results:
+        add_stage_timings(totals, r['timings'])
+    print_stage_timings(totals, len(results), elapsed)
+
+def create_placeholder_images(output_dir=None):
     """Create placeholder images if downloads fail"""
+    output_dir = Path(output_dir) if output_dir else IMAGES_DIR
     placeholder_images = {
         "hero_bg.jpg": "Create a gradient background",
         "logo.png": "Create Tharwah Academy logo",
@@ -73,42 +624,107 @@ def create_placeholder_images():
     }
     
     for filename, description in placeholder_images.items():
-        if not (IMAGES_DIR / filename).exists():
+        if not (output_dir / filename).exists():
             print(f"Creating placeholder for {filename} - {description}")
             # Create a simple colored placeholder
             img = Image.new('RGB', (400, 300), color='#f0f0f0')
             try:
-                img.save(IMAGES_DIR / filename)
+                # Temp file + rename, like every image writer, so a hardlinked name is never written through
+                tmp_path = output_dir / f"{filename}.{os.getpid()}.tmp"
+                img.save(tmp_path, Image.registered_extensions()[Path(filename).suffix.lower()])
+                os.replace(tmp_path, output_dir / filename)
                 print(f"✅ Created placeholder {filename}")
             except Exception as e:
                 print(f"❌ Failed to create placeholder {filename}: {str(e)}")
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Download Tharwah Academy images for the Streamlit app")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"concurrent downloads (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="transcoding processes (default: all cores)")
+    parser.add_argument("--per-host", type=int, default=PER_HOST_CONNECTIONS,
+                        help=f"max open connections per host (default: {PER_HOST_CONNECTIONS})")
+    parser.add_argument("--base-url", default=None,
+                        help="rewrite every URL onto this scheme/host, e.g. a local stand-in server")
+    parser.add_argument("--output-dir", type=Path, default=IMAGES_DIR,
+                        help="where to write images (default: static/images)")
+    parser.add_argument("--force", action="store_true",
+                        help=f"ignore {MANIFEST_FILENAME} and re-download/re-encode everything")
+    parser.add_argument("--max-kbps", type=float, default=None,
+                        help="cap the combined download rate of all workers, in KiB/s (default: no cap)")
+    parser.add_argument("--max-file-mb", type=float, default=MAX_FILE_MB,
+                        help=f"reject any file larger than this (default: {MAX_FILE_MB} MB)")
+    parser.add_argument("--documents", action="store_true",
+                        help="also download the documents (PDFs etc.) linked from links.json")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR,
+                        help="content directory whose links.json lists the documents (default: data/content)")
+    parser.add_argument("--documents-dir", type=Path, default=DOCUMENTS_DIR,
+                        help="where to write documents (default: static/documents)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    output_dir = args.output_dir
+    
     print("🖼️  Downloading Tharwah Academy Images for Streamlit App")
     print("=" * 60)
     
+    # One budget for images and documents alike, so --max-kbps caps the whole run
+    budget = BandwidthBudget.from_kbps(args.max_kbps)
+    max_bytes = int(args.max_file_mb * 1024 * 1024)
+    
     # Download images
-    success_count = 0
-    for filename, url in IMAGES_TO_DOWNLOAD.items():
-        if download_and_resize_image(url, filename):
-            success_count += 1
+    started = time.perf_counter()
+    results = download_all(IMAGES_TO_DOWNLOAD, workers=args.workers, per_host=args.per_host,
+                           base_url=args.base_url, output_dir=output_dir,
+                           incremental=not args.force, processes=args.processes,
+                           budget=budget, max_bytes=max_bytes)
+    elapsed = time.perf_counter() - started
+    success_count = sum(1 for r in results if r['ok'])
+    unchanged_count = sum(1 for r in results if r['status'] == 'unchanged')
+    
+    print_timings(results, elapsed)
     
     print(f"\n📊 Download Summary:")
     print(f"✅ Successfully downloaded: {success_count}/{len(IMAGES_TO_DOWNLOAD)} images")
+    print(f"⏭️  Unchanged since last run: {unchanged_count}")
     
     # Create placeholders for failed downloads
     print(f"\n🔄 Creating placeholder images for missing files...")
-    create_placeholder_images()
+    create_placeholder_images(output_dir)
+    
+    # Refresh responsive derivatives for whatever was re-encoded this run
+    changed = [output_dir / r['filename'] for r in results if r['status'] == 'downloaded']
+    register_in_blob_store(changed)
+    if changed:
+        print(f"\n🧩 Building responsive derivatives for {len(changed)} changed images...")
+        build_derivatives(sources=changed, root=output_dir, out_dir=output_dir / "_derivatives",
+                          processes=args.processes)
     
     # List all images
-    print(f"\n📁 Images available in {IMAGES_DIR}:")
-    for img_file in sorted(IMAGES_DIR.glob("*")):
-        if img_file.is_file():
+    print(f"\n📁 Images available in {output_dir}:")
+    for img_file in sorted(output_dir.glob("*")):
+        if img_file.is_file() and img_file.name != MANIFEST_FILENAME:
             size = img_file.stat().st_size
             print(f"  - {img_file.name} ({size:,} bytes)")
     
+    if args.documents:
+        documents = load_document_links(args.content_dir)
+        print(f"\n📄 Downloading {len(documents)} documents linked from {args.content_dir / 'links.json'}...")
+        started = time.perf_counter()
+        document_results = download_documents(documents, workers=args.workers, per_host=args.per_host,
+                                              base_url=args.base_url, output_dir=args.documents_dir,
+                                              incremental=not args.force, budget=budget,
+                                              max_bytes=max_bytes)
+        if document_results:
+            print_timings(document_results, time.perf_counter() - started, stages=False)
+        print(f"✅ Documents available: {sum(1 for r in document_results if r['ok'])}/{len(documents)} "
+              f"in {args.documents_dir}/")
+    
     print(f"\n🎉 Image setup complete!")
-    print(f"Images are ready to use in the Streamlit app at: static/images/")
+    print(f"Images are ready to use in the Streamlit app at: {output_dir}/")
 
 if __name__ == "__main__":
     main()
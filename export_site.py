@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Export the viewer as a static site
+
+Renders every page to HTML with the app's stylesheet, copies each image once under a
+content-hash filename (using the responsive derivative that fits its display width), and
+writes .gz and .br (brotli, from requirements.txt) next to every text file, so nginx
+or a CDN can serve the demo without a Python process per visitor:
+    python export_site.py                                   # -> dist/
+    python export_site.py --output-dir /srv/demo --content-dir data/sites/<host>/<epoch ms>
+
+Everything under assets/ is immutable (the hash changes with the content); only the HTML
+pages need revalidating.
+"""
+
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import math
+import shutil
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # in requirements.txt; a bare install without it just skips .br files
+    brotli = None
+
+from blob_store import BLOB_INDEX_PATH, load_blob_index, resolve_blob
+from content_store import CATALOG_PATH, load_content_store
+from image_pipeline import DERIVATIVES_DIR, load_derivative_index, select_derivative
+from lazy_json import open_document
+from validate_images import is_displayable, open_image_report
+from views import PAGES
+from views.common import BASE_DIR, CONTENT_DIR, CSS_PATH, GALLERY_CARD_WIDTH, IMAGES_DIR, minify_css
+from views.fragments import (
+    ABOUT_TEXT,
+    FOOTER_CTA_HTML,
+    HERO_HTML,
+    MISSION_TEXT,
+    NAV_BAR_HTML,
+    SITE_FOOTER_HTML,
+    STATS_HTML,
+    course_card_html,
+    main_header_html,
+    service_card_html,
+    testimonial_card_html,
+)
+from views.gallery import STATUS_LABELS, collect_gallery_items
+from views.overview import partner_logos
+
+DIST_DIR = BASE_DIR / "dist"
+EXPORT_CSS_PATH = BASE_DIR / "static" / "css" / "export.css"
+ASSETS_DIRNAME = "assets"
+FINGERPRINT_CHARS = 10
+COMPRESSIBLE_SUFFIXES = ('.html', '.css', '.json', '.svg', '.js')
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+GALLERY_EXPORT_PAGE_SIZE = 48
+# Raw Data trees show this many children per container; the full file is linked
+RAW_TREE_CHILDREN = 100
+
+# label -> output file, in sidebar order
+PAGE_FILES = dict(zip(PAGES, (
+    "index.html",
+    "services.html",
+    "testimonials.html",
+    "faqs.html",
+    "gallery.html",
+    "contact.html",
+    "raw-data.html",
+)))
+
+def fingerprint(data):
+    return hashlib.sha256(data).hexdigest()[:FINGERPRINT_CHARS]
+
+def info_html(text):
+    return f'<div class="st-info">{text}</div>'
+
+def odoo_note(text):
+    return info_html(f"💡 <strong>For Odoo Integration</strong>: {text}")
+
+class SiteBuilder:
+    """Writes pages and content-addressed assets into the output directory"""
+
+    def __init__(self, out_dir, content_dir):
+        self.out_dir = Path(out_dir)
+        self.content_dir = Path(content_dir)
+        self.assets = {}    # (source, variant) -> relative URL
+        self.derivatives = load_derivative_index(DERIVATIVES_DIR)
+        self.blob_index = load_blob_index(BLOB_INDEX_PATH)
+        self.stylesheets = [
+            self.asset(minify_css(path.read_text(encoding='utf-8')).encode('utf-8'), path.stem, '.css')
+            for path in (CSS_PATH, EXPORT_CSS_PATH)
+        ]
+
+    def asset(self, data, stem, suffix):
+        """Write bytes once under a fingerprinted name; returns the URL relative to the site root"""
+        name = f"{stem}.{fingerprint(data)}{suffix}"
+        path = self.out_dir / ASSETS_DIRNAME / name
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        return f"{ASSETS_DIRNAME}/{name}"
+
+    def file_asset(self, path, variant=''):
+        """Fingerprinted copy of a file (memoised per source); None if it is missing or empty"""
+        key = (str(path), variant)
+        if key not in self.assets:
+            try:
+                data = Path(path).read_bytes()
+            except OSError:
+                data = b''
+            self.assets[key] = self.asset(data, Path(path).stem, Path(path).suffix.lower()) if data else None
+        return self.assets[key]
+
+    def resolve(self, image_path):
+        """Resolve a logical image path through the blob store, falling back to the file itself"""
+        try:
+            name = Path(image_path).relative_to(BASE_DIR).as_posix()
+        except ValueError:
+            return Path(image_path)
+        return resolve_blob(self.blob_index, name) or Path(image_path)
+
+    def image_html(self, image_path, width, alt='', caption=None):
+        """<figure> with a WebP derivative and a JPEG/PNG fallback at ``width``; None if unavailable"""
+        image_path = Path(image_path)
+        sources = ''
+        try:
+            rel_path = image_path.relative_to(IMAGES_DIR).as_posix()
+        except ValueError:
+            rel_path = None
+        webp = rel_path and select_derivative(self.derivatives, rel_path, width)
+        if webp:
+            fallback = DERIVATIVES_DIR / select_derivative(self.derivatives, rel_path, width, prefer_webp=False)
+            sources = f'<source type="image/webp" srcset="{self.file_asset(DERIVATIVES_DIR / webp)}">'
+            src = self.file_asset(fallback)
+        else:
+            src = self.file_asset(self.resolve(image_path))
+        if not src:
+            return None
+        alt = html.escape(alt or image_path.stem, quote=True)
+        figcaption = f"<figcaption>{html.escape(caption)}</figcaption>" if caption else ''
+        return (f'<figure><picture>{sources}<img src="{src}" alt="{alt}" width="{width}" '
+                f'loading="lazy" decoding="async"></picture>{figcaption}</figure>')
+
+    def write_page(self, filename, label, body):
+        """Wrap a page body in the site chrome and write it"""
+        nav = ''.join(
+            f'<a href="{PAGE_FILES[page]}"{" class=active" if page == label else ""}>{html.escape(page)}</a>'
+            for page in PAGES
+        )
+        links = ''.join(f'<link rel="stylesheet" href="{href}">' for href in self.stylesheets)
+        document = (
+            '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f'<title>{html.escape(label)} · I-Solutions - Content Viewer</title>{links}</head>'
+            f'<body><nav class="site-nav"><strong>🎓 I-Solutions</strong>{nav}</nav>'
+            f'<main>{body}<hr>{SITE_FOOTER_HTML}</main></body></html>'
+        )
+        (self.out_dir / filename).write_text(document, encoding='utf-8')
+
+def columns_html(cells, count):
+    rows = []
+    for start in range(0, len(cells), count):
+        row = ''.join(f'<div class="st-column">{cell}</div>' for cell in cells[start:start + count])
+        rows.append(f'<div class="st-columns cols-{count}">{row}</div>')
+    return ''.join(rows)
+
+def render_overview(builder, data):
+    parts = [HERO_HTML]
+    logo = builder.image_html(IMAGES_DIR / "logos" / "shrm-logo.svg", 200)
+    if logo:
+        parts.append(logo)
+    parts += [NAV_BAR_HTML, "<h3>🏆 Featured Programs &amp; Certifications</h3><hr>"]
+    cards = []
+    for course in data['content'].courses:
+        check = data['image_report'].get('catalog', {}).get(course.image)
+        image = builder.image_html(BASE_DIR / check['path'], 300, course.title, course.title) if is_displayable(check) else None
+        cards.append((image or info_html(f"📚 {course.title}")) + course_card_html(course))
+    parts.append(f'<div class="course-grid">{columns_html(cards, 3)}</div>')
+    parts += [STATS_HTML, "<h3>🤝 Our Partners &amp; Certifications</h3><hr>"]
+    logos = [builder.image_html(BASE_DIR / path, 120) for path in partner_logos(data['image_report'])]
+    parts.append(columns_html([logo for logo in logos if logo], 4))
+    parts += [
+        "<h3>About I-Solutions</h3>", f"<p>{ABOUT_TEXT}</p>",
+        "<h3>🎯 Our Mission</h3>", f"<blockquote>{MISSION_TEXT}</blockquote>",
+        FOOTER_CTA_HTML,
+        odoo_note("This homepage layout will be recreated in Odoo using website templates, course catalogs, "
+                  "and e-commerce integration for I-Solutions"),
+    ]
+    return ''.join(parts)
+
+def render_services(builder, data):
+    cards = ''.join(service_card_html(service) for service in data['content'].services)
+    return (main_header_html("Our Services") + "<hr>" + cards
+            + odoo_note("Each service will become a <code>slide.tag</code> (course category) for I-Solutions"))
+
+def render_testimonials(builder, data):
+    cards = ''.join(testimonial_card_html(testimonial) for testimonial in data['content'].testimonials)
+    return (main_header_html("Client Testimonials") + "<hr>" + cards
+            + odoo_note("Testimonials will be created as <code>blog.post</code> records for I-Solutions"))
+
+def render_faqs(builder, data):
+    items = ''.join(
+        f'<details class="st-expander"><summary><strong>{idx}. {faq.question}</strong></summary><p>{faq.answer}</p></details>'
+        for idx, faq in enumerate(data['content'].faqs, 1)
+    )
+    return (main_header_html("Frequently Asked Questions") + "<hr>" + items
+            + odoo_note("FAQs can be added to website pages or help content"))
+
+def gallery_page_name(number):
+    return "gallery.html" if number == 1 else f"gallery-{number}.html"
+
+def render_gallery(builder, data):
+    """First gallery page; later pages are written directly as gallery-<n>.html"""
+    inventory = data['images_inventory'] or {}
+    items = collect_gallery_items(data['image_report'])
+    page_count = max(1, math.ceil(len(items) / GALLERY_EXPORT_PAGE_SIZE))
+    counts = {category: len(entries) for category, entries in inventory.items()}
+    stats = (
+        "<h3>📊 Image Statistics</h3>"
+        + columns_html([f'<div class="stat-box"><div>{label}</div><strong>{value}</strong></div>'
+                        for label, value in (("Total Images", sum(counts.values())),
+                                             ("Logos", counts.get('logos', 0)),
+                                             ("Miscellaneous", counts.get('misc', 0)))], 3)
+        + "<p><strong>Category Breakdown:</strong></p><ul>"
+        + ''.join(f"<li><strong>{category.capitalize()}</strong>: {count} images</li>"
+                  for category, count in counts.items() if count)
+        + "</ul>"
+    )
+    first_page = None
+    for number in range(1, page_count + 1):
+        start = (number - 1) * GALLERY_EXPORT_PAGE_SIZE
+        cells = []
+        for item in items[start:start + GALLERY_EXPORT_PAGE_SIZE]:
+            image = (builder.image_html(BASE_DIR / item['path'], GALLERY_CARD_WIDTH, item['alt'], item['filename'])
+                     if is_displayable(item) else None)
+            alt = f'<p class="st-caption">Alt: {html.escape(item["alt"])}</p>' if image and item['alt'] else ''
+            label = STATUS_LABELS.get(item['status'], "Missing")
+            cells.append((image + alt) if image else f'<div class="st-warning">{label}: {html.escape(item["filename"])}</div>')
+        pager = ' '.join(
+            f'<a href="{gallery_page_name(n)}"{" class=active" if n == number else ""}>{n}</a>'
+            for n in range(1, page_count + 1)
+        )
+        body = (main_header_html("Images Gallery") + "<hr>"
+                + f'<p class="st-caption">{len(items)} images · page {number}/{page_count}</p>'
+                + columns_html(cells, 4) + f'<nav class="pager">{pager}</nav>' + stats)
+        if number == 1:
+            first_page = body
+        else:
+            builder.write_page(gallery_page_name(number), "🖼️ Images Gallery", body)
+    return first_page
+
+SOCIAL_LABELS = {
+    'linkedin': ("LinkedIn", "View Profile"),
+    'twitter': ("Twitter/X", "View Profile"),
+    'instagram': ("Instagram", "View Profile"),
+    'youtube': ("YouTube", "View Channel"),
+}
+
+def render_contact(builder, data):
+    links = data['links'] or {}
+    social = {entry['platform']: entry['url'] for entry in links.get('social_media', [])}
+    social_html = ''.join(
+        f'<p><strong>{SOCIAL_LABELS[platform][0]}</strong>: '
+        f'<a href="{html.escape(url, quote=True)}">{SOCIAL_LABELS[platform][1]}</a></p>'
+        for platform, url in social.items() if platform in SOCIAL_LABELS
+    )
+    contact = (
+        "<h3>📞 Contact Information</h3>"
+        "<p><strong>Phone:</strong></p>" + info_html("9200-19-590")
+        + "<p><strong>Registration Number:</strong></p>" + info_html("1010929460")
+        + "<p><strong>Messaging:</strong></p><ul><li>WhatsApp</li><li>Instagram DM</li><li>Telegram</li></ul>"
+    )
+    return (main_header_html("Contact &amp; Social Media") + "<hr>"
+            + columns_html([contact, "<h3>🌐 Social Media Links</h3>" + social_html], 2) + "<hr>"
+            + '<div class="st-success">✅ All contact and social media information extracted successfully!</div>')
+
+def json_tree_html(key, value, depth=0):
+    """Collapsible <details> tree for a JSON value; long containers are truncated"""
+    label = f"<strong>{html.escape(str(key))}</strong>" if key is not None else "$"
+    if isinstance(value, (Mapping, list)):
+        items = list(value.items() if isinstance(value, Mapping) else enumerate(value))
+        children = ''.join(json_tree_html(k, v, depth + 1) for k, v in items[:RAW_TREE_CHILDREN])
+        if len(items) > RAW_TREE_CHILDREN:
+            children += f'<p class="st-caption">… {len(items) - RAW_TREE_CHILDREN} more in the full file</p>'
+        kind = f"{{{len(items)} keys}}" if isinstance(value, Mapping) else f"[{len(items)} items]"
+        return f'<details{" open" if depth == 0 else ""}><summary>{label}: {kind}</summary>{children}</details>'
+    return f'<div class="json-leaf">{label}: <code>{html.escape(json.dumps(value, ensure_ascii=False))}</code></div>'
+
+def render_raw_data(builder, data):
+    sections = []
+    for name, title in (('homepage_content', "📄 Homepage Content"), ('links', "🔗 Links"),
+                        ('images_inventory', "🖼️ Images Inventory")):
+        document = data[name]
+        if not document:
+            sections.append(f'<div class="st-error">Failed to load {name}.json</div>')
+            continue
+        plain = dict(document)
+        url = builder.asset(json.dumps(plain, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), name, '.json')
+        sections.append(f'<h3>{title}</h3><p><a href="{url}">Download {name}.json</a></p>{json_tree_html(None, plain)}')
+    return main_header_html("Raw Scraped Data") + "<hr>" + ''.join(sections)
+
+RENDERERS = {
+    "📊 Overview": render_overview,
+    "📝 Services": render_services,
+    "⭐ Testimonials": render_testimonials,
+    "❓ FAQs": render_faqs,
+    "🖼️ Images Gallery": render_gallery,
+    "📞 Contact & Social": render_contact,
+    "📋 Raw Data": render_raw_data,
+}
+
+def load_export_data(content_dir):
+    """Everything the pages read, loaded once"""
+    data = {'content': load_content_store(CATALOG_PATH)}
+    for name in ('homepage_content', 'links', 'images_inventory'):
+        path = Path(content_dir) / f"{name}.json"
+        data[name] = open_document(path) if path.exists() else None
+    data['image_report'] = open_image_report(content_dir)
+    return data
+
+def precompress(out_dir):
+    """Write .gz (and .br) siblings for text files; returns (files, raw bytes, gzip bytes)"""
+    files = raw_total = gz_total = 0
+    for path in sorted(Path(out_dir).rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        raw = path.read_bytes()
+        # mtime=0 keeps the .gz byte-identical across exports of the same content
+        gz = gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+        files += 1
+        raw_total += len(raw)
+        if len(gz) < len(raw):
+            path.with_name(path.name + ".gz").write_bytes(gz)
+            gz_total += len(gz)
+        else:
+            gz_total += len(raw)
+        if brotli is not None:
+            br = brotli.compress(raw, quality=BROTLI_QUALITY)
+            if len(br) < len(raw):
+                path.with_name(path.name + ".br").write_bytes(br)
+    return files, raw_total, gz_total
+
+def clean_output(out_dir):
+    """Remove a previous export (only the files this exporter writes)"""
+    shutil.rmtree(out_dir / ASSETS_DIRNAME, ignore_errors=True)
+    for pattern in ("*.html", "*.html.gz", "*.html.br"):
+        for path in out_dir.glob(pattern):
+            path.unlink()
+
+def export_site(out_dir=DIST_DIR, content_dir=CONTENT_DIR):
+    """Render every page into ``out_dir``; returns the list of page files written"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    clean_output(out_dir)
+    builder = SiteBuilder(out_dir, content_dir)
+    data = load_export_data(content_dir)
+    for label, filename in PAGE_FILES.items():
+        builder.write_page(filename, label, RENDERERS[label](builder, data))
+        print(f"✅ {label} → {filename}")
+    return sorted(p.name for p in out_dir.glob("*.html"))
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Export the content viewer as a static site")
+    parser.add_argument("--output-dir", type=Path, default=DIST_DIR, help="where to write the site (default: dist/)")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR,
+                        help="content directory or site partition to export (default: data/content)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"📦 Exporting static site to {args.output_dir}")
+    print("=" * 60)
+    started = time.perf_counter()
+    pages = export_site(args.output_dir, args.content_dir)
+    files, raw_bytes, gz_bytes = precompress(args.output_dir)
+    assets = list((args.output_dir / ASSETS_DIRNAME).iterdir())
+    print(f"\n🎉 {len(pages)} pages and {len(assets)} assets in {time.perf_counter() - started:.2f}s")
+    print(f"🗜️  {files} text files precompressed: {raw_bytes / 1024:.0f} KB → {gz_bytes / 1024:.0f} KB gzip"
+          + ("" if brotli is not None else " (install brotli for .br files)"))
+
+if __name__ == "__main__":
+    main()
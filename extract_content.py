@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Extract homepage_content.json, links.json and images_inventory.json from scraped HTML
+
+Pages are parsed in a single streaming pass with html.parser's incremental parser, fed in
+fixed-size chunks, so memory stays bounded by the extracted content rather than the page size:
+    python extract_content.py data/raw/homepage.html --output-dir data/content
+    python extract_content.py pages/*.html --output-dir /tmp/extracted --workers 4
+    python extract_content.py data/raw/homepage.html --benchmark 20
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+BASE_DIR = Path(__file__).parent
+RAW_DIR = BASE_DIR / "data" / "raw"
+CONTENT_DIR = BASE_DIR / "data" / "content"
+DEFAULT_BASE_URL = "https://academy.tharwah.net/"
+
+CHUNK_SIZE = 64 * 1024
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+# Text inside these never reaches the visitor
+SKIPPED_TAGS = ('script', 'style', 'noscript', 'template', 'svg')
+# Tags whose boundaries separate words ("Company<br>Profile" → "Company Profile")
+BREAKING_TAGS = ('br', 'p', 'div', 'li', 'span', 'strong', 'em', 'b', 'i')
+MIN_TEXT_BLOCK = 20
+
+SOCIAL_PLATFORMS = {
+    'linkedin.com': 'linkedin',
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'instagram.com': 'instagram',
+    'youtube.com': 'youtube',
+    'facebook.com': 'facebook',
+    'tiktok.com': 'tiktok',
+    'snapchat.com': 'snapchat',
+}
+IMAGE_CATEGORIES = ('logos', 'services', 'clients', 'accreditation', 'banners', 'misc')
+PHONE_RE = re.compile(r'\b\d{4}-\d{2}-\d{3}\b|\+?\b966[\s-]?\d{2}[\s-]?\d{3}[\s-]?\d{4}\b')
+EMAIL_RE = re.compile(r'\b[\w.+-]+@[\w-]+\.[\w.-]+\b')
+WHITESPACE_RE = re.compile(r'\s+')
+
+def clean_text(text):
+    """Collapse whitespace the way a browser renders it"""
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+def image_category(url, alt, classes):
+    """Bucket an image for images_inventory.json"""
+    name = url.lower()
+    if 'logo' in name:
+        return 'logos'
+    if 'client' in name:
+        return 'clients'
+    if 'accredit' in name or 'certif' in name:
+        return 'accreditation'
+    if 'banner' in classes.lower():
+        return 'banners'
+    if 'service' in alt.lower() or 'service' in name:
+        return 'services'
+    return 'misc'
+
+def image_filename(url):
+    """Local filename for an image URL (lowercased like the downloaded tree, Unicode kept)"""
+    return unquote(urlsplit(url).path.rsplit('/', 1)[-1]).lower()
+
+class ContentExtractor(HTMLParser):
+    """Incremental parser that emits the three content documents as it goes"""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.host = urlsplit(base_url).netloc
+        self.page_title = ""
+        self.meta_description = ""
+        self.headings = []
+        self.text_blocks = []
+        self.phones = []
+        self.emails = []
+        self.social_media = []
+        self.internal = []
+        self.external = []
+        self.images = {category: [] for category in IMAGE_CATEGORIES}
+        # Dedup keys so repeated headers/footers and <noscript> copies are emitted once
+        self._seen = set()
+        self._skip_depth = 0
+        self._capture = []      # stack of [tag, parts, extra]
+
+    def _once(self, *key):
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        attrs = dict(attrs)
+        if tag in BREAKING_TAGS and self._capture:
+            self._capture[-1][1].append(' ')
+        if tag == 'title' or tag in HEADING_TAGS or tag == 'p':
+            self._capture.append([tag, [], None])
+        elif tag == 'a':
+            self._capture.append([tag, [], attrs.get('href') or ''])
+        elif tag == 'meta' and (attrs.get('name') or '').lower() == 'description':
+            self.meta_description = self.meta_description or clean_text(attrs.get('content') or '')
+        elif tag == 'img':
+            self._add_image(attrs)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag in SKIPPED_TAGS:
+            self._skip_depth -= 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if self._skip_depth:
+            return
+        if tag in BREAKING_TAGS and self._capture:
+            self._capture[-1][1].append(' ')
+        # Close the innermost matching capture; tolerate unclosed inner tags
+        for depth in range(len(self._capture) - 1, -1, -1):
+            if self._capture[depth][0] == tag:
+                captured = self._capture[depth:]
+                del self._capture[depth:]
+                name, parts, extra = captured[0]
+                text = clean_text(''.join(parts))
+                if self._capture:
+                    # Nested captures (a link inside a heading) also feed their parent
+                    self._capture[-1][1].append(' ' + text + ' ')
+                self._finish(name, text, extra)
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        for entry in self._capture:
+            entry[1].append(data)
+        for phone in PHONE_RE.findall(data):
+            if self._once('phone', phone):
+                self.phones.append(phone)
+        for email in EMAIL_RE.findall(data):
+            if self._once('email', email.lower()):
+                self.emails.append(email)
+
+    def _finish(self, tag, text, extra):
+        if tag == 'title':
+            self.page_title = self.page_title or text
+        elif tag in HEADING_TAGS:
+            if text and self._once('heading', tag, text):
+                self.headings.append({'level': tag, 'text': text})
+        elif tag == 'p':
+            if len(text) >= MIN_TEXT_BLOCK and self._once('text', text):
+                self.text_blocks.append(text)
+        elif tag == 'a':
+            self._add_link(extra, text)
+
+    def _add_link(self, href, text):
+        href = href.strip()
+        if not href or href.startswith('#') or href.startswith('javascript:'):
+            return
+        if href.startswith('tel:'):
+            phone = unquote(href[4:]).strip()
+            if self._once('phone', phone):
+                self.phones.append(phone)
+            return
+        if href.startswith('mailto:'):
+            email = unquote(href[7:]).split('?', 1)[0].strip()
+            if self._once('email', email.lower()):
+                self.emails.append(email)
+            return
+        absolute = urljoin(self.base_url, href)
+        host = urlsplit(absolute).netloc.lower()
+        bare_host = host[4:] if host.startswith('www.') else host
+        platform = SOCIAL_PLATFORMS.get(bare_host)
+        if platform:
+            if self._once('social', absolute):
+                self.social_media.append({'platform': platform, 'url': absolute, 'text': text})
+        elif host == self.host:
+            if self._once('internal', href):
+                self.internal.append({'url': href, 'text': text})
+        elif self._once('external', absolute):
+            self.external.append({'url': absolute, 'text': text})
+
+    def _add_image(self, attrs):
+        # Lazy-loaded images keep the real URL in data-src and a data: placeholder in src
+        url = attrs.get('data-src') or attrs.get('data-lazy-src') or attrs.get('src') or ''
+        if not url or url.startswith('data:'):
+            return
+        url = urljoin(self.base_url, url)
+        alt = clean_text(attrs.get('alt') or '')
+        classes = attrs.get('class') or ''
+        category = image_category(url, alt, classes)
+        filename = image_filename(url)
+        if filename and self._once('image', category, filename):
+            self.images[category].append({
+                'filename': filename,
+                'alt': alt,
+                'original_url': url,
+                'classes': classes,
+            })
+
+    def documents(self):
+        """(homepage_content, links, images_inventory) in the viewer's JSON layout"""
+        homepage_content = {
+            'page_title': self.page_title,
+            'meta_description': self.meta_description,
+            'headings': self.headings,
+            'services': [],
+            'testimonials': [],
+            'faqs': [],
+            'contact_info': {'phones': self.phones, 'emails': self.emails},
+            'all_text_blocks': self.text_blocks,
+        }
+        links = {'social_media': self.social_media, 'internal': self.internal, 'external': self.external}
+        return homepage_content, links, self.images
+
+def extract_file(path, base_url=DEFAULT_BASE_URL, chunk_size=CHUNK_SIZE):
+    """Stream one HTML file through the extractor"""
+    parser = ContentExtractor(base_url)
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            parser.feed(chunk)
+    parser.close()
+    return parser.documents()
+
+def write_documents(documents, output_dir):
+    """Write the three content files into ``output_dir``"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    names = ('homepage_content.json', 'links.json', 'images_inventory.json')
+    for name, document in zip(names, documents):
+        tmp_path = output_dir / (name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, output_dir / name)
+
+def extract_to_dir(path, output_dir, base_url=DEFAULT_BASE_URL):
+    """Extract one page and write its documents; runs inside a worker process"""
+    documents = extract_file(path, base_url)
+    write_documents(documents, output_dir)
+    homepage_content, links, images = documents
+    return {
+        'headings': len(homepage_content['headings']),
+        'links': sum(len(v) for v in links.values()),
+        'images': sum(len(v) for v in images.values()),
+    }
+
+def batch_output_names(paths):
+    """{path: output directory name}, from each page's path relative to the pages' common folder
+
+    Folders are joined with '__' (pages/ar/index.html -> ar__index), so pages sharing a stem in
+    different folders get separate directories; the suffix is kept only where stems still clash.
+    """
+    paths = [Path(p) for p in paths]
+    resolved = [p.resolve() for p in paths]
+    common = Path(os.path.commonpath([p.parent for p in resolved]))
+    relative = [p.relative_to(common) for p in resolved]
+    stems = [r.with_suffix('').as_posix().replace('/', '__') for r in relative]
+    clashes = {stem for stem in stems if stems.count(stem) > 1}
+    return {path: r.as_posix().replace('/', '__') if stem in clashes else stem
+            for path, r, stem in zip(paths, relative, stems)}
+
+def extract_batch(paths, output_root, base_url=DEFAULT_BASE_URL, workers=None):
+    """Extract many pages in parallel, one output directory per page (see batch_output_names)
+
+    Each worker holds only the page it is parsing, and results are written as they finish,
+    so memory is bounded by ``workers`` pages regardless of batch size.
+    """
+    output_root = Path(output_root)
+    results = {}
+    names = batch_output_names(paths)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = {pool.submit(extract_to_dir, str(p), str(output_root / name), base_url): p
+                   for p, name in names.items()}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results[str(path)] = future.result()
+                print(f"✅ {path.name}: {results[str(path)]}")
+            except Exception as e:
+                print(f"❌ Failed to extract {path.name}: {str(e)}")
+    return results
+
+def benchmark(path, runs=10, base_url=DEFAULT_BASE_URL):
+    """Time the streaming extractor on one file and report throughput and peak memory"""
+    size = Path(path).stat().st_size
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        extract_file(path, base_url)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    extract_file(path, base_url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timings.sort()
+    median = timings[len(timings) // 2]
+    return {
+        'file': str(path),
+        'bytes': size,
+        'runs': runs,
+        'best_ms': timings[0] * 1000,
+        'median_ms': median * 1000,
+        'mb_per_s': size / median / 1e6 if median else 0.0,
+        'peak_kib': peak / 1024,
+    }
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Extract viewer content JSON from scraped HTML")
+    parser.add_argument("pages", nargs="*", type=Path, default=[RAW_DIR / "homepage.html"],
+                        help="HTML files to extract (default: data/raw/homepage.html)")
+    parser.add_argument("--output-dir", type=Path, default=CONTENT_DIR,
+                        help="output directory; with several pages, one subdirectory per page")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL,
+                        help="site URL used to classify internal/external links")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for batches (default: all cores)")
+    parser.add_argument("--benchmark", type=int, metavar="RUNS", default=0,
+                        help="time extraction of the first page over RUNS runs instead of writing output")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.benchmark:
+        result = benchmark(args.pages[0], args.benchmark, args.base_url)
+        print(f"⏱️  {Path(result['file']).name} ({result['bytes']:,} bytes, {result['runs']} runs)")
+        print(f"  - best:   {result['best_ms']:.1f} ms")
+        print(f"  - median: {result['median_ms']:.1f} ms ({result['mb_per_s']:.1f} MB/s)")
+        print(f"  - peak traced memory: {result['peak_kib']:,.0f} KiB")
+        return
+    if len(args.pages) == 1:
+        counts = extract_to_dir(args.pages[0], args.output_dir, args.base_url)
+        print(f"✅ Extracted {args.pages[0].name} into {args.output_dir}: {counts}")
+    else:
+        results = extract_batch(args.pages, args.output_dir, args.base_url, args.workers)
+        print(f"\n🎉 Extracted {len(results)}/{len(args.pages)} pages into {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
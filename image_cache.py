@@ -0,0 +1,160 @@
+"""
+Process-wide cache of ready-to-serve image bytes for the Streamlit app
+
+Entries are keyed by (path, mtime, size, target width) and evicted least-recently-used once the
+byte budget is exceeded. app.py holds a single instance through st.cache_resource, so every
+visitor session shares the decode/encode work.
+"""
+
+import io
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# How long a validated entry is trusted before its file is stat()ed again
+DEFAULT_REVALIDATE_SECONDS = 2.0
+
+# Formats served as-is; anything else is re-encoded as PNG
+PASSTHROUGH_FORMATS = {'JPEG': 'image/jpeg', 'PNG': 'image/png', 'WEBP': 'image/webp'}
+VECTOR_SUFFIXES = ('.svg',)
+
+class CachedImage(NamedTuple):
+    """Encoded bytes for one (path, width); ``data`` is None for vector files served by path"""
+    path: str
+    data: Optional[bytes]
+    mimetype: str
+    width: int
+    height: int
+    source_bytes: int
+
+def encode_for_width(path, width=None):
+    """Read an image and, if it is wider than ``width``, downscale and re-encode it"""
+    path = Path(path)
+    raw = path.read_bytes()
+    if path.suffix.lower() in VECTOR_SUFFIXES:
+        return CachedImage(str(path), None, 'image/svg+xml', 0, 0, len(raw))
+    # Imported here so pages that never decode an image never load PIL
+    from PIL import Image
+
+    with Image.open(io.BytesIO(raw)) as image:
+        fmt = image.format
+        size = image.size
+        if (not width or size[0] <= width) and fmt in PASSTHROUGH_FORMATS:
+            return CachedImage(str(path), raw, PASSTHROUGH_FORMATS[fmt], size[0], size[1], len(raw))
+        if fmt == 'JPEG' and width:
+            image.draft('RGB', (width, size[1]))
+        image.load()
+        if width and image.size[0] > width:
+            image.thumbnail((width, max(1, round(size[1] * width / size[0]))), Image.Resampling.LANCZOS)
+        out_fmt = fmt if fmt in PASSTHROUGH_FORMATS else 'PNG'
+        if out_fmt == 'JPEG' and image.mode != 'RGB':
+            image = image.convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, out_fmt, quality=85, optimize=True)
+    data = buffer.getvalue()
+    return CachedImage(str(path), data, PASSTHROUGH_FORMATS[out_fmt], image.size[0], image.size[1], len(raw))
+
+class ImageCache:
+    """Thread-safe LRU of encoded image bytes with a byte budget"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, revalidate_seconds=DEFAULT_REVALIDATE_SECONDS):
+        self.max_bytes = max_bytes
+        self.revalidate_seconds = revalidate_seconds
+        self._entries = OrderedDict()   # (path, mtime_ns, size, width) -> CachedImage
+        self._current = {}              # (path, width) -> (key, validated_at)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _entry_size(self, entry):
+        return len(entry.data) if entry.data is not None else 0
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= self._entry_size(entry)
+
+    def _lookup(self, slot, now):
+        """Entry for (path, width) if it was validated recently enough to skip stat()"""
+        current = self._current.get(slot)
+        if current and now - current[1] < self.revalidate_seconds and current[0] in self._entries:
+            self._entries.move_to_end(current[0])
+            return self._entries[current[0]]
+        return None
+
+    def get(self, path, width=None):
+        """Cached image for ``path`` at ``width``; None if the file is missing or empty
+
+        Decode errors propagate so callers can tell corrupt files from missing ones.
+        """
+        path = str(path)
+        slot = (path, width)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._lookup(slot, now)
+            if entry is not None:
+                self.hits += 1
+                return entry
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        if stat.st_size == 0:
+            # Failed scrapes leave zero-byte placeholders behind
+            return None
+        key = (path, stat.st_mtime_ns, stat.st_size, width)
+        with self._lock:
+            current = self._current.get(slot)
+            if current and current[0] != key:
+                # The file changed on disk; the old rendition can never be hit again
+                self._drop(current[0])
+                self.invalidations += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._current[slot] = (key, now)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        entry = encode_for_width(path, width)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self.bytes += self._entry_size(entry)
+            self._current[slot] = (key, now)
+            # Never evict the entry just inserted, even if it alone exceeds the budget
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, old_entry = self._entries.popitem(last=False)
+                self.bytes -= self._entry_size(old_entry)
+                self.evictions += 1
+                old_slot = (old_key[0], old_key[3])
+                if self._current.get(old_slot, (None,))[0] == old_key:
+                    del self._current[old_slot]
+        return entry
+
+    def stats(self):
+        """Counters for monitoring and the performance panel"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._current.clear()
+            self.bytes = 0
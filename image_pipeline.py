@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Image transcoding pipeline for the Streamlit app
+
+CPU-bound decode/resize/encode work runs in a process pool so it never serialises with
+network I/O. The same pool can re-process an already-scraped local corpus offline:
+    python image_pipeline.py data/images --output-dir /tmp/processed --processes 4
+
+It also builds the responsive derivatives (thumb / card / full, WebP plus a JPEG or PNG
+fallback) that app.py serves instead of full-size originals:
+    python image_pipeline.py --derivatives
+
+With --changeset only the images a snapshot diff marked as added or modified are processed:
+    python image_pipeline.py --derivatives --changeset changes.json
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from snapshot_diff import load_changeset
+
+BASE_DIR = Path(__file__).parent
+DATA_IMAGES_DIR = BASE_DIR / "data" / "images"
+IMAGES_DIR = BASE_DIR / "static" / "images"
+DERIVATIVES_DIR = IMAGES_DIR / "_derivatives"
+DERIVATIVES_INDEX = "index.json"
+# Bumped when derivative filenames change, so older index entries are rebuilt
+DERIVATIVES_VERSION = 2
+
+# Fixed derivative widths; each is only generated if the source is wider than the previous one
+DERIVATIVE_SIZES = {
+    'thumb': 160,
+    'card': 400,
+    'full': 1200,
+}
+
+# Raster formats PIL can transcode; SVGs are copied through untouched by the callers
+RASTER_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+JPEG_QUALITY = 85
+STAGES = ('fetch', 'queue', 'decode', 'resize', 'encode')
+# Pool workers come from a clean server process (or a fresh interpreter) rather than a fork of
+# the caller, whose fetch threads may hold the requests session or stdout locks mid-fork
+POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+def output_format(output_path):
+    """Pick the PIL save format from an output filename"""
+    suffix = Path(output_path).suffix.lower()
+    if suffix == '.png':
+        return 'PNG'
+    if suffix == '.webp':
+        return 'WEBP'
+    return 'JPEG'
+
+def transcode_image(source, output_path, max_width=800, max_height=600, fmt=None):
+    """Decode, resize and encode one image; runs inside a worker process
+
+    ``source`` is either raw bytes or a path on disk. Returns a dict of per-stage timings.
+    """
+    # Deferred so the viewer can import the derivative index helpers without loading PIL
+    from PIL import Image
+
+    fmt = fmt or output_format(output_path)
+    timings = {}
+
+    started = time.perf_counter()
+    with Image.open(io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source) as image:
+        if image.format == 'JPEG':
+            # Let libjpeg decode at a reduced DCT scale that still covers the target box
+            image.draft('RGB', (max_width, max_height))
+        image.load()
+        timings['decode'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        # Convert to RGB if the target format cannot carry alpha/palette
+        if fmt == 'JPEG' and image.mode != 'RGB':
+            image = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+            image = image.convert('RGBA')
+        image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+        timings['resize'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Never write through the existing file: after blob_store.py dedupe it is a hardlink shared
+        # with the blob and every other copy, so the new bytes get a new inode via os.replace
+        tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+        try:
+            if fmt == 'JPEG':
+                image.save(tmp_path, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+            elif fmt == 'WEBP':
+                image.save(tmp_path, 'WEBP', quality=JPEG_QUALITY, method=4)
+            else:
+                image.save(tmp_path, fmt, optimize=True)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        timings['encode'] = time.perf_counter() - started
+
+    return {
+        'output': str(output_path),
+        'width': image.size[0],
+        'height': image.size[1],
+        'output_bytes': output_path.stat().st_size,
+        'timings': timings,
+    }
+
+def has_alpha(path):
+    """Whether an image carries transparency (decides the fallback format)"""
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+
+def derivative_plan(source, width, height, root=IMAGES_DIR, out_dir=DERIVATIVES_DIR):
+    """List (name, max_width, webp_path, fallback_path) for the derivatives a source needs"""
+    source = Path(source)
+    rel = source.relative_to(root)
+    fallback_suffix = '.png' if has_alpha(source) else '.jpg'
+    plan = []
+    for name, max_width in DERIVATIVE_SIZES.items():
+        # Built by string: with_suffix() would swap the size name out, and keeping the source
+        # suffix stops cert_ai.jpg and cert_ai.png from sharing derivatives
+        base = f"{rel.name}.{name}"
+        plan.append((name, max_width, out_dir / rel.parent / f"{base}.webp",
+                     out_dir / rel.parent / f"{base}{fallback_suffix}"))
+        if width <= max_width:
+            # Larger sizes would just repeat this one; thumbnail() never upscales
+            break
+    return plan
+
+def build_source_derivatives(source, root=IMAGES_DIR, out_dir=DERIVATIVES_DIR):
+    """Generate every derivative for one source image; runs inside a worker process"""
+    from PIL import Image
+
+    source, root, out_dir = Path(source), Path(root), Path(out_dir)
+    with Image.open(source) as image:
+        width, height = image.size
+    variants = []
+    timings = new_stage_totals()
+    for name, max_width, webp_path, fallback_path in derivative_plan(source, width, height, root, out_dir):
+        # Height is unconstrained; the derivative is chosen by display width
+        webp = transcode_image(str(source), webp_path, max_width, max_width * 10, 'WEBP')
+        fallback = transcode_image(str(source), fallback_path, max_width, max_width * 10)
+        add_stage_timings(timings, webp['timings'])
+        add_stage_timings(timings, fallback['timings'])
+        variants.append({
+            'name': name,
+            'width': webp['width'],
+            'height': webp['height'],
+            'webp': webp_path.relative_to(out_dir).as_posix(),
+            'webp_bytes': webp['output_bytes'],
+            'fallback': fallback_path.relative_to(out_dir).as_posix(),
+            'fallback_bytes': fallback['output_bytes'],
+        })
+    stat = source.stat()
+    return {
+        'version': DERIVATIVES_VERSION,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'source_bytes': stat.st_size,
+        'width': width,
+        'height': height,
+        'variants': variants,
+        'timings': timings,
+    }
+
+def load_derivative_index(out_dir=DERIVATIVES_DIR):
+    """Load the derivative index ({source relpath: entry})"""
+    try:
+        with open(Path(out_dir) / DERIVATIVES_INDEX, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_derivative_index(index, out_dir=DERIVATIVES_DIR):
+    """Atomically write the derivative index"""
+    path = Path(out_dir) / DERIVATIVES_INDEX
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def derivatives_current(entry, source, out_dir=DERIVATIVES_DIR):
+    """Whether a cached index entry still matches its source and files on disk"""
+    if not entry or entry.get('version') != DERIVATIVES_VERSION:
+        return False
+    stat = source.stat()
+    if entry.get('source_mtime_ns') != stat.st_mtime_ns or entry.get('source_bytes') != stat.st_size:
+        return False
+    return all((out_dir / v['webp']).exists() and (out_dir / v['fallback']).exists()
+               for v in entry.get('variants', []))
+
+def build_derivatives(sources=None, root=IMAGES_DIR, out_dir=DERIVATIVES_DIR, processes=None, force=False):
+    """Build missing or stale derivatives for raster images under ``root``"""
+    root, out_dir = Path(root), Path(out_dir)
+    index = load_derivative_index(out_dir)
+    if sources is None:
+        sources = [p for p in find_local_images(root) if out_dir not in p.parents]
+    stale = []
+    for src in map(Path, sources):
+        if not src.exists() or src.stat().st_size == 0:
+            continue
+        key = src.relative_to(root).as_posix()
+        if force or not derivatives_current(index.get(key), src, out_dir):
+            stale.append((key, src))
+    totals = new_stage_totals()
+    built = 0
+    started = time.perf_counter()
+    if stale:
+        with process_pool(processes) as pool:
+            futures = {pool.submit(build_source_derivatives, str(src), str(root), str(out_dir)): key
+                       for key, src in stale}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    entry = future.result()
+                    add_stage_timings(totals, entry.pop('timings'))
+                    index[key] = entry
+                    built += 1
+                    sizes = ", ".join(f"{v['name']} {v['width']}px" for v in entry['variants'])
+                    print(f"✅ {key} → {sizes}")
+                except Exception as e:
+                    print(f"❌ Failed to build derivatives for {key}: {str(e)}")
+    save_derivative_index(index, out_dir)
+    removed = prune_derivatives(index, out_dir)
+    elapsed = time.perf_counter() - started
+    print(f"\n🧩 Derivatives: {built} rebuilt, {len(index) - built} cached, {removed} stale files removed")
+    if built:
+        print_stage_timings(totals, built, elapsed)
+    return index
+
+def prune_derivatives(index, out_dir=DERIVATIVES_DIR):
+    """Delete derivative files the index no longer references (renamed or superseded sizes)"""
+    out_dir = Path(out_dir)
+    keep = {out_dir / DERIVATIVES_INDEX}
+    for entry in index.values():
+        for v in entry.get('variants', []):
+            keep.update((out_dir / v['webp'], out_dir / v['fallback']))
+    removed = 0
+    for path in out_dir.rglob("*"):
+        if path.is_file() and path not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+def select_derivative(index, rel_path, display_width, prefer_webp=True):
+    """Smallest derivative whose width covers ``display_width``, as a path relative to the derivatives dir
+
+    Falls back to the largest derivative when none is wide enough, and to ``None`` when the
+    source has no derivatives (SVGs, images not built yet).
+    """
+    entry = index.get(rel_path)
+    if not entry or not entry.get('variants'):
+        return None
+    variants = sorted(entry['variants'], key=lambda v: v['width'])
+    chosen = next((v for v in variants if v['width'] >= display_width), variants[-1])
+    return chosen['webp'] if prefer_webp else chosen['fallback']
+
+def default_processes():
+    """Use every core by default"""
+    return os.cpu_count() or 1
+
+def process_pool(processes=None):
+    """Process pool for transcoding jobs, started with POOL_START_METHOD"""
+    return ProcessPoolExecutor(max_workers=processes or default_processes(),
+                               mp_context=multiprocessing.get_context(POOL_START_METHOD))
+
+def new_stage_totals():
+    """Empty accumulator for stage-level timing"""
+    return {stage: 0.0 for stage in STAGES}
+
+def add_stage_timings(totals, timings):
+    """Accumulate one job's stage timings into the totals"""
+    for stage, seconds in timings.items():
+        totals[stage] = totals.get(stage, 0.0) + seconds
+
+def print_stage_timings(totals, count, elapsed):
+    """Print cumulative time spent in each pipeline stage"""
+    print(f"\n🧮 Stage timings ({count} images, {elapsed:.2f}s wall):")
+    for stage in STAGES:
+        seconds = totals.get(stage, 0.0)
+        if seconds:
+            avg_ms = seconds / count * 1000 if count else 0.0
+            print(f"  - {stage:<7} {seconds:8.2f}s total  {avg_ms:8.1f}ms/image")
+
+def find_local_images(root):
+    """List raster images under a scraped images tree"""
+    root = Path(root)
+    return sorted(p for p in root.rglob("*")
+                  if p.is_file() and p.suffix.lower() in RASTER_SUFFIXES)
+
+def changed_sources(changeset, root):
+    """Raster images under ``root`` that a snapshot change set marks as added or modified
+
+    Matches both the snapshot's own paths (data/images/<snapshot>/...) and the published
+    static/images names, so a change set works against either tree.
+    """
+    root = Path(root)
+    resolved_root = root.resolve()
+    sources = []
+    names = changeset.get('changed_image_paths', []) + changeset.get('changed_published_paths', [])
+    for name in dict.fromkeys(names):
+        path = (BASE_DIR / name).resolve()
+        if resolved_root in path.parents and path.suffix.lower() in RASTER_SUFFIXES and path.is_file():
+            sources.append(root / path.relative_to(resolved_root))
+    return sources
+
+def changeset_sources(path, root):
+    """changed_sources() of a change set file, refusing one that changes images none of which are under ``root``"""
+    changeset = load_changeset(path)
+    sources = changed_sources(changeset, root)
+    if changeset.get('changed_image_paths') and not sources:
+        raise SystemExit(f"❌ {path} lists {len(changeset['changed_image_paths'])} changed images, "
+                         f"but none of them are raster images under {root}")
+    return sources
+
+def process_local_corpus(root, output_dir, max_width=800, max_height=600, processes=None, sources=None):
+    """Re-process an already-scraped images tree offline, mirroring its layout"""
+    root, output_dir = Path(root), Path(output_dir)
+    if sources is None:
+        sources = find_local_images(root)
+    totals = new_stage_totals()
+    results = []
+    started = time.perf_counter()
+    with process_pool(processes) as pool:
+        futures = {
+            pool.submit(transcode_image, str(src), output_dir / src.relative_to(root),
+                        max_width, max_height): src
+            for src in sources
+        }
+        for future in as_completed(futures):
+            src = futures[future]
+            try:
+                result = future.result()
+                add_stage_timings(totals, result['timings'])
+                result['source'] = str(src)
+                result['ok'] = True
+                print(f"✅ {src.relative_to(root)} → {result['width']}x{result['height']}")
+            except Exception as e:
+                result = {'source': str(src), 'ok': False, 'error': str(e)}
+                print(f"❌ Failed to process {src.relative_to(root)}: {str(e)}")
+            results.append(result)
+    elapsed = time.perf_counter() - started
+    print_stage_timings(totals, sum(1 for r in results if r['ok']), elapsed)
+    return results
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Bulk re-process a local scraped images corpus")
+    parser.add_argument("root", nargs="?", type=Path, default=None,
+                        help="images tree to process (default: data/images, or static/images with --derivatives)")
+    parser.add_argument("--output-dir", type=Path, default=None,
+                        help="where to write processed images (layout mirrors the source tree)")
+    parser.add_argument("--derivatives", action="store_true",
+                        help="build thumb/card/full derivatives into static/images/_derivatives")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild derivatives even if the cache is current")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--changeset", type=Path, default=None,
+                        help="only process images added or modified in this snapshot_diff.py change set")
+    parser.add_argument("--max-width", type=int, default=800)
+    parser.add_argument("--max-height", type=int, default=600)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.derivatives:
+        root = args.root or IMAGES_DIR
+        out_dir = args.output_dir or DERIVATIVES_DIR
+        print(f"🧩 Building responsive derivatives for {root}")
+        print("=" * 60)
+        sources = changeset_sources(args.changeset, root) if args.changeset else None
+        build_derivatives(sources, root=root, out_dir=out_dir, processes=args.processes, force=args.force)
+        return
+    args.root = args.root or DATA_IMAGES_DIR
+    if not args.output_dir:
+        raise SystemExit("--output-dir is required when re-processing a corpus")
+    print(f"🛠️  Processing images under {args.root}")
+    print("=" * 60)
+    sources = changeset_sources(args.changeset, args.root) if args.changeset else None
+    results = process_local_corpus(args.root, args.output_dir, args.max_width, args.max_height,
+                                   args.processes, sources)
+    ok = sum(1 for r in results if r['ok'])
+    print(f"\n🎉 Processed {ok}/{len(results)} images into {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
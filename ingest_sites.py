@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Ingest scraped site snapshots into a partitioned content store
+
+Snapshot folders are named <host>-<epoch ms> (e.g. data/images/kafaat.etoolabs.com-1760537950319).
+Each one is ingested in parallel into data/sites/<host>/<epoch ms>/ holding the three content
+JSON files plus images.json, which maps image filenames to the content-addressed blob store.
+A cross-site index (data/sites/index.json) lists every site and snapshot for the viewer.
+
+    python ingest_sites.py                         # every snapshot under data/images
+    python ingest_sites.py path/to/host-1760000000000 --workers 4
+
+HTML for a snapshot is taken from <snapshot>/*.html, then <raw dir>/<snapshot name>.html,
+then <raw dir>/<host>.html, and for the primary site from <raw dir>/homepage.html. Snapshots
+without HTML get an image inventory built from their files.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from blob_store import load_blob_index, logical_name, save_blob_index, store_file
+from extract_content import (
+    DEFAULT_BASE_URL,
+    IMAGE_CATEGORIES,
+    extract_file,
+    image_category,
+    write_documents,
+)
+
+BASE_DIR = Path(__file__).parent
+SNAPSHOTS_DIR = BASE_DIR / "data" / "images"
+RAW_DIR = BASE_DIR / "data" / "raw"
+SITES_DIR = BASE_DIR / "data" / "sites"
+SITE_INDEX_PATH = SITES_DIR / "index.json"
+PRIMARY_HOST = urlsplit(DEFAULT_BASE_URL).netloc
+
+SNAPSHOT_NAME_RE = re.compile(r'^(?P<host>[a-z0-9.-]+\.[a-z]{2,})-(?P<timestamp>\d{10,13})$', re.IGNORECASE)
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg')
+
+def parse_snapshot_name(name):
+    """(host, epoch ms) for a snapshot folder name, or None"""
+    match = SNAPSHOT_NAME_RE.match(name)
+    if not match:
+        return None
+    return match.group('host').lower(), match.group('timestamp')
+
+def snapshot_label(timestamp):
+    """Human-readable UTC time for an epoch-ms snapshot id"""
+    return datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+
+def find_snapshots(root=SNAPSHOTS_DIR):
+    """Snapshot folders directly under ``root``"""
+    root = Path(root)
+    if not root.exists():
+        return []
+    return sorted(p for p in root.iterdir() if p.is_dir() and parse_snapshot_name(p.name))
+
+def find_snapshot_html(snapshot, host, raw_dir=RAW_DIR):
+    """The HTML page for a snapshot, or None"""
+    snapshot, raw_dir = Path(snapshot), Path(raw_dir)
+    pages = sorted(snapshot.glob("*.html"))
+    if pages:
+        index = snapshot / "index.html"
+        return index if index in pages else pages[0]
+    candidates = [raw_dir / f"{snapshot.name}.html", raw_dir / f"{host}.html"]
+    if host == PRIMARY_HOST:
+        candidates.append(raw_dir / "homepage.html")
+    return next((c for c in candidates if c.exists()), None)
+
+def partition_dir(host, timestamp, sites_dir=SITES_DIR):
+    """Where one snapshot's content lives"""
+    return Path(sites_dir) / host / timestamp
+
+def inventory_from_files(images):
+    """Build images_inventory.json from a snapshot's files when there is no HTML"""
+    inventory = {category: [] for category in IMAGE_CATEGORIES}
+    for path in images:
+        inventory[image_category(path.name, '', '')].append({
+            'filename': path.name.lower(),
+            'alt': '',
+            'original_url': '',
+            'classes': '',
+        })
+    return inventory
+
+def ingest_snapshot(snapshot, sites_dir=SITES_DIR, raw_dir=RAW_DIR):
+    """Ingest one snapshot folder into its partition; runs inside a worker process
+
+    Returns the partition summary plus the blob index entries for its images, which the parent
+    merges so only one process ever writes the blob index.
+    """
+    snapshot = Path(snapshot)
+    host, timestamp = parse_snapshot_name(snapshot.name)
+    started = time.perf_counter()
+    out_dir = partition_dir(host, timestamp, sites_dir)
+    images = sorted(p for p in snapshot.rglob("*")
+                    if p.is_file() and p.suffix.lower() in IMAGE_SUFFIXES and p.stat().st_size > 0)
+
+    html = find_snapshot_html(snapshot, host, raw_dir)
+    if html:
+        documents = extract_file(html, f"https://{host}/")
+    else:
+        documents = (
+            {'page_title': host, 'meta_description': '', 'headings': [], 'services': [],
+             'testimonials': [], 'faqs': [], 'contact_info': {'phones': [], 'emails': []},
+             'all_text_blocks': []},
+            {'social_media': [], 'internal': [], 'external': []},
+            inventory_from_files(images),
+        )
+    write_documents(documents, out_dir)
+
+    # Image bytes stay in the blob store; the partition only records names and hashes
+    blob_entries = {}
+    image_map = {}
+    # Inventory entries name images by filename alone, so that stays the key (for the shallowest
+    # copy); the same name in another folder is kept under its snapshot-relative path instead
+    for path in sorted(images, key=lambda p: (len(p.relative_to(snapshot).parts), p)):
+        name = logical_name(path)
+        store_file(path, name, blob_entries)
+        key = path.name.lower()
+        if key in image_map:
+            print(f"⚠️  {snapshot.name}: {path.relative_to(snapshot)} shares its name with "
+                  f"{image_map[key]['name']}; recorded under its relative path")
+            key = path.relative_to(snapshot).as_posix().lower()
+        image_map[key] = {'name': name, **blob_entries[name]}
+    with open(out_dir / "images.json", 'w', encoding='utf-8') as f:
+        json.dump(image_map, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    homepage_content, links, inventory = documents
+    summary = {
+        'host': host,
+        'timestamp': timestamp,
+        'label': snapshot_label(timestamp),
+        'source': logical_name(snapshot),
+        'html': logical_name(html) if html else None,
+        'page_title': homepage_content['page_title'],
+        'headings': len(homepage_content['headings']),
+        'links': sum(len(v) for v in links.values()),
+        'inventory': sum(len(v) for v in inventory.values()),
+        'images': len(image_map),
+        'image_bytes': sum(entry['bytes'] for entry in image_map.values()),
+        'ingested_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'seconds': time.perf_counter() - started,
+    }
+    with open(out_dir / "snapshot.json", 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    return summary, blob_entries
+
+def load_site_index(index_path=SITE_INDEX_PATH):
+    """Load the cross-site index ({'sites': {host: {...}}, 'images': {sha256: [...]}})"""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'sites': {}, 'images': {}}
+
+def build_site_index(sites_dir=SITES_DIR):
+    """Rebuild the cross-site index from the partitions on disk
+
+    Lists each site's snapshots newest first and maps every image hash to the partitions that
+    contain it, which shows assets shared across sites and across scrapes.
+    """
+    sites_dir = Path(sites_dir)
+    sites = {}
+    images = {}
+    for meta_path in sorted(sites_dir.glob("*/*/snapshot.json")):
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        host, timestamp = meta['host'], meta['timestamp']
+        site = sites.setdefault(host, {'snapshots': {}})
+        site['snapshots'][timestamp] = {
+            key: meta[key] for key in ('label', 'page_title', 'headings', 'links', 'inventory', 'images', 'image_bytes')
+        }
+        try:
+            with open(meta_path.parent / "images.json", 'r', encoding='utf-8') as f:
+                image_map = json.load(f)
+        except (OSError, ValueError):
+            image_map = {}
+        for filename, entry in image_map.items():
+            images.setdefault(entry['sha256'], []).append(f"{host}/{timestamp}/{filename}")
+    for site in sites.values():
+        site['latest'] = max(site['snapshots'], key=int)
+    index = {'sites': dict(sorted(sites.items())), 'images': images}
+    tmp_path = sites_dir / "index.json.tmp"
+    sites_dir.mkdir(parents=True, exist_ok=True)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, sites_dir / "index.json")
+    return index
+
+def ingest_all(snapshots, sites_dir=SITES_DIR, raw_dir=RAW_DIR, workers=None):
+    """Ingest many snapshots in parallel and rebuild the cross-site index"""
+    blob_index = load_blob_index()
+    summaries = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = {pool.submit(ingest_snapshot, str(s), str(sites_dir), str(raw_dir)): s for s in snapshots}
+        for future in as_completed(futures):
+            snapshot = futures[future]
+            try:
+                summary, blob_entries = future.result()
+            except Exception as e:
+                print(f"❌ Failed to ingest {snapshot.name}: {str(e)}")
+                continue
+            blob_index.update(blob_entries)
+            summaries.append(summary)
+            source = "HTML" if summary['html'] else "files only"
+            print(f"✅ {summary['host']} @ {summary['label']}: {summary['images']} images, "
+                  f"{summary['inventory']} inventory entries ({source}, {summary['seconds']:.2f}s)")
+    save_blob_index(blob_index)
+    index = build_site_index(sites_dir)
+    return summaries, index
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Ingest scraped site snapshots into data/sites")
+    parser.add_argument("snapshots", nargs="*", type=Path,
+                        help="snapshot folders named <host>-<epoch ms> (default: all under data/images)")
+    parser.add_argument("--raw-dir", type=Path, default=RAW_DIR,
+                        help="where to look for snapshot HTML (default: data/raw)")
+    parser.add_argument("--sites-dir", type=Path, default=SITES_DIR,
+                        help="partitioned output store (default: data/sites)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    snapshots = args.snapshots or find_snapshots()
+    invalid = [s for s in snapshots if not parse_snapshot_name(Path(s).name)]
+    if invalid:
+        raise SystemExit(f"Not a <host>-<epoch ms> snapshot folder: {', '.join(map(str, invalid))}")
+    print(f"🌐 Ingesting {len(snapshots)} site snapshots into {args.sites_dir}")
+    print("=" * 60)
+    started = time.perf_counter()
+    summaries, index = ingest_all(snapshots, args.sites_dir, args.raw_dir, args.workers)
+    print(f"\n📊 {len(summaries)}/{len(snapshots)} snapshots ingested in {time.perf_counter() - started:.2f}s")
+    for host, site in index['sites'].items():
+        print(f"  - {host}: {len(site['snapshots'])} snapshot(s), latest {site['snapshots'][site['latest']]['label']}")
+    shared = sum(1 for refs in index['images'].values() if len(refs) > 1)
+    print(f"  - {len(index['images'])} distinct images, {shared} shared across partitions")
+
+if __name__ == "__main__":
+    main()
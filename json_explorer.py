@@ -0,0 +1,190 @@
+"""
+Windowed access to large JSON documents for the Raw Data page
+
+Instead of shipping a whole document to the browser, the page shows one node at a time: a
+paginated list of its children with short previews, and the full value only for small
+subtrees. Queries use a JSONPath subset and are evaluated server-side:
+    $.headings[0:5]            $..url                $.logos[*].filename
+    $['social_media'][-1]      $.*[?(@.alt =~ 'logo')]   $.headings[?(@.level == 'h2')].text
+"""
+
+import ast
+import json
+import re
+from collections.abc import Mapping
+from itertools import islice
+
+from lazy_json import LazyDocument
+
+# Subtrees whose JSON encoding is at most this many bytes are rendered in full
+INLINE_SUBTREE_BYTES = 4096
+PREVIEW_CHARS = 80
+
+class JsonPathError(ValueError):
+    """Raised for JSONPath expressions outside the supported subset"""
+
+TOKEN_RE = re.compile(r"""
+    (?P<descend>\.\.(?P<descend_name>[A-Za-z_][\w-]*|\*))
+  | \.(?P<name>[A-Za-z_][\w-]*|\*)
+  | \[\s*(?:
+        (?P<quoted>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<slice>-?\d*\s*:\s*-?\d*)
+      | (?P<index>-?\d+)
+      | (?P<star>\*)
+      | \?\(\s*@(?P<filter_path>(?:\.[A-Za-z_][\w-]*)*)\s*
+            (?:(?P<op>==|!=|=~|<=|>=|<|>)\s*(?P<operand>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?|true|false|null))?
+        \s*\)
+    )\s*\]
+""", re.VERBOSE)
+
+IDENTIFIER_RE = re.compile(r'^[A-Za-z_][\w]*$')
+
+def parse_path(expression):
+    """Compile a JSONPath expression into a list of (kind, argument) steps"""
+    expression = expression.strip()
+    if expression.startswith('$'):
+        expression = expression[1:]
+    steps = []
+    position = 0
+    while position < len(expression):
+        match = TOKEN_RE.match(expression, position)
+        if not match:
+            raise JsonPathError(f"unexpected {expression[position:position + 20]!r} at offset {position + 1}")
+        position = match.end()
+        if match.group('descend'):
+            steps.append(('descend', match.group('descend_name')))
+        elif match.group('name'):
+            steps.append(('child', match.group('name')))
+        elif match.group('quoted'):
+            steps.append(('child', ast.literal_eval(match.group('quoted'))))
+        elif match.group('slice') is not None:
+            start, end = (int(part) if part.strip() else None for part in match.group('slice').split(':'))
+            steps.append(('slice', (start, end)))
+        elif match.group('index') is not None:
+            steps.append(('index', int(match.group('index'))))
+        elif match.group('star'):
+            steps.append(('child', '*'))
+        else:
+            fields = [f for f in match.group('filter_path').split('.') if f]
+            operand = match.group('operand')
+            if operand is not None:
+                operand = ast.literal_eval(operand) if operand[0] in '\'"' else json.loads(operand)
+            steps.append(('filter', (fields, match.group('op'), operand)))
+    return steps
+
+def children(value):
+    """(key, child) pairs of a container; nothing for scalars"""
+    if isinstance(value, Mapping):
+        return value.items()
+    if isinstance(value, list):
+        return enumerate(value)
+    return ()
+
+def walk(path, value):
+    """Every (path, node) at or below ``value``, depth first"""
+    yield path, value
+    for key, child in children(value):
+        yield from walk(path + (key,), child)
+
+def filter_matches(node, fields, op, operand):
+    """Evaluate a [?(@.a.b op operand)] filter against one node"""
+    for field in fields:
+        if not isinstance(node, Mapping) or field not in node:
+            return False
+        node = node[field]
+    if op is None:
+        return bool(node)
+    if op == '=~':
+        return isinstance(node, str) and str(operand).lower() in node.lower()
+    if op == '==':
+        return node == operand
+    if op == '!=':
+        return node != operand
+    try:
+        return {'<': node < operand, '<=': node <= operand, '>': node > operand, '>=': node >= operand}[op]
+    except TypeError:
+        return False
+
+def apply_step(step, matches):
+    """Advance (path, node) matches by one compiled step"""
+    kind, argument = step
+    for path, node in matches:
+        if kind == 'child':
+            if argument == '*':
+                for key, child in children(node):
+                    yield path + (key,), child
+            elif isinstance(node, Mapping) and argument in node:
+                yield path + (argument,), node[argument]
+        elif kind == 'index':
+            if isinstance(node, list) and -len(node) <= argument < len(node):
+                yield path + (argument % len(node),), node[argument]
+        elif kind == 'slice':
+            if isinstance(node, list):
+                for index in range(*slice(*argument).indices(len(node))):
+                    yield path + (index,), node[index]
+        elif kind == 'descend':
+            for sub_path, sub_node in walk(path, node):
+                if argument == '*':
+                    if sub_path != path:
+                        yield sub_path, sub_node
+                elif isinstance(sub_node, Mapping) and argument in sub_node:
+                    yield sub_path + (argument,), sub_node[argument]
+        else:
+            for key, child in children(node):
+                if filter_matches(child, *argument):
+                    yield path + (key,), child
+
+def query(document, expression, limit=None):
+    """(path, value) pairs matching ``expression``; lazily evaluated, so ``limit`` bounds the work"""
+    matches = iter([((), document)])
+    for step in parse_path(expression):
+        matches = apply_step(step, matches)
+    return list(islice(matches, limit))
+
+def resolve(document, path):
+    """The node at a path tuple, or raise KeyError/IndexError"""
+    node = document
+    for key in path:
+        node = node[key]
+    return node
+
+def format_path(path):
+    """JSONPath spelling of a path tuple"""
+    parts = ['$']
+    for key in path:
+        if isinstance(key, int):
+            parts.append(f"[{key}]")
+        elif IDENTIFIER_RE.match(key):
+            parts.append(f".{key}")
+        else:
+            parts.append(f"[{json.dumps(key, ensure_ascii=False)}]")
+    return ''.join(parts)
+
+def preview(value, max_chars=PREVIEW_CHARS):
+    """One-line summary of a node that never materialises large subtrees"""
+    if isinstance(value, Mapping):
+        keys = ', '.join(islice(map(str, value), 4))
+        return f"{{{len(value)} keys: {keys}{', …' if len(value) > 4 else ''}}}"
+    if isinstance(value, list):
+        return f"[{len(value)} items]"
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= max_chars else text[:max_chars - 1] + '…'
+
+def window(value, offset=0, limit=25):
+    """One page of a container's children as (key, child) pairs"""
+    return list(islice(children(value), offset, offset + limit))
+
+def fits_inline(value, budget=INLINE_SUBTREE_BYTES):
+    """Whether ``value`` encodes to at most ``budget`` bytes; stops encoding once it is over"""
+    if isinstance(value, LazyDocument):
+        # Sizes are known from the cache's table of contents, no decoding needed
+        return value.encoded_size() + 2 * len(value) <= budget
+    size = 0
+    for chunk in json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).iterencode(value):
+        size += len(chunk.encode('utf-8'))
+        if size > budget:
+            return False
+    return True
+
+def is_container(value):
+    return isinstance(value, (Mapping, list))
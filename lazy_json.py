@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Lazily parsed JSON documents backed by a memory-mapped sidecar cache
+
+The first open of a JSON object parses it once and writes <dir>/.cache/<name>.lzj: a small
+header (source mtime, size and sha256), a table of contents, and each top-level value encoded
+separately. Later opens read only the header and table of contents; a value is decoded from
+the memory-mapped file the first time its key is accessed, so pages that touch one key never
+materialise the rest. A cache whose source changed (by mtime/size, then by hash) is rebuilt:
+    python lazy_json.py data/content/*.json            # build or refresh caches
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+CACHE_DIRNAME = ".cache"
+CACHE_SUFFIX = ".lzj"
+MAGIC = b"LZJ1"
+# magic, source mtime_ns, source size, source sha256, table of contents length
+HEADER = struct.Struct("<4sQQ32sI")
+
+def cache_path(path):
+    """Where the sidecar cache for a JSON file lives"""
+    path = Path(path)
+    return path.parent / CACHE_DIRNAME / (path.name + CACHE_SUFFIX)
+
+def source_digest(path):
+    """sha256 of a source file, used when mtime/size alone cannot prove it unchanged"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.digest()
+
+def read_header(cache_file):
+    """(mtime_ns, size, sha256, toc_len) from a cache file, or None if absent or malformed"""
+    try:
+        with open(cache_file, 'rb') as f:
+            raw = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(raw) != HEADER.size:
+        return None
+    magic, mtime_ns, size, digest, toc_len = HEADER.unpack(raw)
+    return (mtime_ns, size, digest, toc_len) if magic == MAGIC else None
+
+def build_cache(path, cache_file=None, digest=None):
+    """Parse ``path`` once and write its sidecar cache; returns the cache path"""
+    path = Path(path)
+    cache_file = Path(cache_file or cache_path(path))
+    stat = path.stat()
+    with open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    if not isinstance(document, dict):
+        raise ValueError(f"{path.name}: lazy loading needs a top-level JSON object")
+    toc = []
+    chunks = []
+    offset = 0
+    for key, value in document.items():
+        encoded = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        count = len(value) if isinstance(value, (dict, list)) else None
+        toc.append([key, offset, len(encoded), count])
+        chunks.append(encoded)
+        offset += len(encoded)
+    toc_bytes = json.dumps(toc, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header = HEADER.pack(MAGIC, stat.st_mtime_ns, stat.st_size, digest or source_digest(path), len(toc_bytes))
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(toc_bytes)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, cache_file)
+    return cache_file
+
+def ensure_cache(path):
+    """Cache path for ``path``, rebuilding it only if the source really changed"""
+    path = Path(path)
+    cache_file = cache_path(path)
+    header = read_header(cache_file)
+    stat = path.stat()
+    if header and header[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cache_file
+    digest = source_digest(path)
+    if header and header[1] == stat.st_size and header[2] == digest:
+        # Touched but unchanged (e.g. a fresh checkout): refresh the header, keep the payload
+        with open(cache_file, 'r+b') as f:
+            f.write(HEADER.pack(MAGIC, stat.st_mtime_ns, stat.st_size, digest, header[3]))
+        return cache_file
+    return build_cache(path, cache_file, digest)
+
+class LazyDocument(Mapping):
+    """Read-only mapping over a JSON object whose top-level values are decoded on first access"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.cache_file = ensure_cache(self.path)
+        with open(self.cache_file, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        toc_len = HEADER.unpack(self._mmap[:HEADER.size])[4]
+        toc = json.loads(self._mmap[HEADER.size:HEADER.size + toc_len])
+        data_start = HEADER.size + toc_len
+        self._toc = {key: (data_start + offset, length, count) for key, offset, length, count in toc}
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        start, length, _ = self._toc[key]
+        value = json.loads(self._mmap[start:start + length])
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    def __iter__(self):
+        return iter(self._toc)
+
+    def __len__(self):
+        return len(self._toc)
+
+    def __contains__(self, key):
+        return key in self._toc
+
+    def count(self, key):
+        """Length of a list/object value without decoding it (None for scalars)"""
+        return self._toc[key][2]
+
+    def encoded_size(self, key=None):
+        """Bytes of compact JSON for one value, or for all of them"""
+        if key is not None:
+            return self._toc[key][1]
+        return sum(length for _, length, _ in self._toc.values())
+
+    def loaded_keys(self):
+        """Keys decoded so far"""
+        return list(self._values)
+
+    def materialize(self):
+        """The whole document as a plain dict"""
+        return {key: self[key] for key in self._toc}
+
+    def __repr__(self):
+        return f"LazyDocument({str(self.path)!r}, keys={list(self._toc)}, loaded={self.loaded_keys()})"
+
+def open_document(path):
+    """Open a JSON object lazily, building or refreshing its cache if needed
+
+    Falls back to an eagerly parsed dict when the cache cannot be written (read-only deploys).
+    """
+    try:
+        return LazyDocument(path)
+    except OSError:
+        # EROFS, EACCES, ENOSPC...; a missing source file raises again from the open() below
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Build lazy-loading caches for JSON content files")
+    parser.add_argument("files", nargs="+", type=Path, help="JSON files whose top level is an object")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    for path in args.files:
+        try:
+            document = open_document(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ {path}: {str(e)}")
+            continue
+        if not isinstance(document, LazyDocument):
+            print(f"⚠️  {path}: cache directory is not writable, loaded eagerly")
+            continue
+        print(f"✅ {path} → {document.cache_file} ({len(document)} keys, {document.encoded_size():,} bytes)")
+
+if __name__ == "__main__":
+    main()
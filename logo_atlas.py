@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Sprite atlases for the partner and client logo grids
+
+Each logo set is packed into one palette-quantised, lossless WebP (equal cells, every logo
+fitted and centred, drawn at 2x for high-density screens) plus a coordinate map, so a whole
+logo grid costs the browser one request instead of one per logo. Atlases are written to static/atlases/ under content-hashed
+names; the maps go to <content dir>/.cache/logo_atlases.json. A set is only repacked when one
+of its logo files changes (by mtime and size) or the set's membership does, and atlases that no
+map references any more are deleted:
+    python logo_atlas.py                                   # build or refresh data/content's atlases
+    python logo_atlas.py --content-dir data/sites/<host>/<epoch ms> --rebuild
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import math
+import os
+import time
+from pathlib import Path
+
+from blob_store import BLOB_INDEX_PATH, load_blob_index, resolve_blob
+from ingest_sites import SITES_DIR
+from lazy_json import CACHE_DIRNAME
+from validate_images import is_displayable, open_image_report
+
+BASE_DIR = Path(__file__).parent
+CONTENT_DIR = BASE_DIR / "data" / "content"
+ATLAS_DIR = BASE_DIR / "static" / "atlases"
+MAP_FILENAME = "logo_atlases.json"
+ATLAS_VERSION = 1
+
+# Logo sets: inventory filename prefix in the 'logos' category
+LOGO_SETS = {
+    'partners': "partners_logo-",
+    'clients': "client_logo-",
+}
+# Cell size in CSS pixels (the logo grids show logos 120px wide); atlases are drawn at SCALE x
+CELL_WIDTH = 120
+CELL_HEIGHT = 75
+SCALE = 2
+ATLAS_COLUMNS = 4
+# Logos are flat artwork: a 256-colour palette stored as lossless WebP is a fraction of the size
+# of lossy WebP at the same visual quality, and of the PNGs it is packed from
+PALETTE_COLORS = 256
+
+def map_path(content_dir=CONTENT_DIR):
+    """Where the coordinate maps for a content directory live"""
+    return Path(content_dir) / CACHE_DIRNAME / MAP_FILENAME
+
+def logo_set_members(report, set_name):
+    """Logical paths of the valid, non-duplicate logos of one set, in inventory order"""
+    prefix = LOGO_SETS[set_name]
+    return [entry['path'] for entry in report.get('inventory', {}).get('logos', [])
+            if entry['filename'].startswith(prefix) and is_displayable(entry)
+            and 'duplicate_of' not in entry]
+
+def logo_sources(names, blob_index):
+    """[[name, mtime_ns, size]] for a set's files, resolved through the blob store"""
+    sources = []
+    for name in names:
+        path = resolve_blob(blob_index, name) or BASE_DIR / name
+        try:
+            stat = path.stat()
+            sources.append([name, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            sources.append([name, 0, 0])
+    return sources
+
+def build_atlas(set_name, names, blob_index, output_dir=ATLAS_DIR):
+    """Pack one logo set into a WebP atlas; returns its coordinate map"""
+    # Imported here so the viewer can read atlas maps without loading PIL
+    from PIL import Image
+
+    cell_width, cell_height = CELL_WIDTH * SCALE, CELL_HEIGHT * SCALE
+    columns = min(ATLAS_COLUMNS, len(names))
+    rows = math.ceil(len(names) / columns)
+    atlas = Image.new('RGBA', (columns * cell_width, rows * cell_height), (0, 0, 0, 0))
+    tiles = {}
+    for position, name in enumerate(names):
+        path = resolve_blob(blob_index, name) or BASE_DIR / name
+        try:
+            with Image.open(path) as image:
+                logo = image.convert('RGBA')
+        except (OSError, ValueError):
+            continue
+        logo.thumbnail((cell_width, cell_height), Image.Resampling.LANCZOS)
+        left = (position % columns) * cell_width + (cell_width - logo.width) // 2
+        top = (position // columns) * cell_height + (cell_height - logo.height) // 2
+        atlas.alpha_composite(logo, (left, top))
+        # [x, y, width, height] of the logo itself, in atlas pixels
+        tiles[name] = [left, top, logo.width, logo.height]
+    buffer = io.BytesIO()
+    atlas = atlas.quantize(PALETTE_COLORS, method=Image.Quantize.FASTOCTREE).convert('RGBA')
+    atlas.save(buffer, 'WEBP', lossless=True, method=6)
+    data = buffer.getvalue()
+    filename = f"{set_name}.{hashlib.sha256(data).hexdigest()[:10]}.webp"
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if not (output_dir / filename).exists():
+        tmp_path = output_dir / f"{filename}.{os.getpid()}.tmp"
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, output_dir / filename)
+    return {
+        'image': filename,
+        'width': atlas.width,
+        'height': atlas.height,
+        'bytes': len(data),
+        'scale': SCALE,
+        'tiles': tiles,
+    }
+
+def load_maps(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            maps = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return maps.get('sets', {}) if maps.get('version') == ATLAS_VERSION else {}
+
+def save_maps(sets, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': ATLAS_VERSION, 'sets': sets}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def prune_atlases(sets, output_dir=ATLAS_DIR):
+    """Delete atlases that no saved map references any more; returns how many were removed
+
+    The atlas directory is shared by data/content and every site partition, so an atlas stays
+    while any of their maps, or ``sets`` (just built), still names it.
+    """
+    keep = {atlas['image'] for atlas in sets.values()}
+    for path in [map_path(CONTENT_DIR), *SITES_DIR.glob(f"*/*/{CACHE_DIRNAME}/{MAP_FILENAME}")]:
+        keep.update(atlas['image'] for atlas in load_maps(path).values())
+    removed = 0
+    for set_name in LOGO_SETS:
+        for path in Path(output_dir).glob(f"{set_name}.*.webp"):
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
+                removed += 1
+    return removed
+
+def update_atlases(report, previous=None, output_dir=ATLAS_DIR):
+    """({set: map}, [repacked set names]); sets whose logos are unchanged keep their atlas"""
+    previous = previous or {}
+    blob_index = load_blob_index(BLOB_INDEX_PATH)
+    sets = {}
+    rebuilt = []
+    for set_name in LOGO_SETS:
+        names = logo_set_members(report, set_name)
+        if not names:
+            continue
+        sources = logo_sources(names, blob_index)
+        old = previous.get(set_name)
+        if old and old['sources'] == sources and (Path(output_dir) / old['image']).exists():
+            sets[set_name] = old
+            continue
+        sets[set_name] = dict(build_atlas(set_name, names, blob_index, output_dir), sources=sources)
+        rebuilt.append(set_name)
+    return sets, rebuilt
+
+def open_logo_atlases(content_dir=CONTENT_DIR, report=None, rebuild=False):
+    """Coordinate maps for a content directory's logo sets, repacking any set whose logos changed"""
+    path = map_path(content_dir)
+    previous = {} if rebuild else load_maps(path)
+    try:
+        sets, rebuilt = update_atlases(report if report is not None else open_image_report(content_dir), previous)
+    except ImportError:
+        # Without Pillow only the atlases already built can be used
+        return previous
+    if rebuilt or set(sets) != set(previous):
+        try:
+            save_maps(sets, path)
+            prune_atlases(sets)
+        except OSError:
+            # Read-only deploys still get in-memory maps
+            pass
+    return sets
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Pack the partner and client logos into sprite atlases")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR,
+                        help="content directory or site partition (default: data/content)")
+    parser.add_argument("--rebuild", action="store_true", help="repack every set, even if its logos are unchanged")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    report = open_image_report(args.content_dir)
+    previous = {} if args.rebuild else load_maps(map_path(args.content_dir))
+    sets, rebuilt = update_atlases(report, previous)
+    save_maps(sets, map_path(args.content_dir))
+    removed = prune_atlases(sets)
+    print(f"🧩 Logo atlases for {args.content_dir} ({time.perf_counter() - started:.2f}s)")
+    print("=" * 60)
+    for set_name, atlas in sets.items():
+        status = "packed" if set_name in rebuilt else "unchanged"
+        source_bytes = sum(size for _, _, size in atlas['sources'])
+        print(f"✅ {set_name:<10} {len(atlas['tiles']):>3} logos → {atlas['image']} "
+              f"({atlas['width']}x{atlas['height']}, {atlas['bytes'] / 1024:.1f} KB from "
+              f"{source_bytes / 1024:.1f} KB of logos, {status})")
+    print(f"💾 Coordinate maps written to {map_path(args.content_dir)}")
+    if removed:
+        print(f"🗑️  Removed {removed} superseded atlases from {ATLAS_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Export the content store to Odoo 18
+
+Services become slide.tag records, testimonials blog.post records in an "I-Solutions
+Testimonials" blog, and courses slide.channel records tagged with their category. Every record
+carries a stable external id (i_solutions_content.<kind>_<id>), so re-running an export
+updates records instead of duplicating them. Records are streamed in batches; course images
+are base64-encoded chunk by chunk straight into the output:
+    python odoo_export.py --format csv                  # CSV files for Odoo's import dialog
+    python odoo_export.py --format xml                  # an installable data module
+    python odoo_export.py --format xmlrpc --url https://odoo.example.com --db prod --user admin
+    python odoo_export.py --format xmlrpc --mock        # against a local in-memory mock server
+The XML-RPC password is read from $ODOO_PASSWORD.
+"""
+
+import argparse
+import base64
+import csv
+import io
+import itertools
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import xmlrpc.client
+from dataclasses import dataclass, field
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+from xmlrpc.server import MultiPathXMLRPCServer, SimpleXMLRPCDispatcher, SimpleXMLRPCRequestHandler
+
+from blob_store import BLOB_INDEX_PATH, load_blob_index, resolve_blob
+from content_store import CATALOG_PATH, ContentValidationError, load_content_store
+from image_pipeline import DERIVATIVES_DIR, load_derivative_index, select_derivative
+from validate_images import is_displayable, open_image_report
+
+BASE_DIR = Path(__file__).parent
+EXPORT_DIR = BASE_DIR / "odoo_export"
+MODULE = "i_solutions_content"
+DEFAULT_BATCH_SIZE = 200
+# Multiple of 3 so the base64 of consecutive chunks concatenates into valid base64
+BASE64_CHUNK_BYTES = 3 * 64 * 1024
+# Odoo keeps image_1920 at most 1920px wide; the 'full' derivative is plenty for course cards
+COURSE_IMAGE_WIDTH = 1200
+MOCK_HOST = "127.0.0.1"
+
+MODULE_DEPENDS = ['website_slides', 'website_blog']
+
+@dataclass(frozen=True, slots=True)
+class OdooRecord:
+    model: str
+    xml_id: str
+    values: dict
+    # field -> external id (many2one) or list of external ids (many2many)
+    refs: dict = field(default_factory=dict)
+    image: Path = None
+
+def slug(value):
+    return re.sub(r'[^a-z0-9]+', '_', value.lower()).strip('_')
+
+def support_records(store):
+    """Blog and course-category tags the content records point at"""
+    yield OdooRecord('slide.channel.tag.group', 'tag_group_category', {'name': "Category"})
+    for category in store.categories():
+        yield OdooRecord('slide.channel.tag', f"tag_category_{slug(category)}", {'name': category},
+                         {'group_id': 'tag_group_category'})
+    yield OdooRecord('blog.blog', 'blog_testimonials', {'name': "I-Solutions Testimonials"})
+
+def service_records(store):
+    for service in store.services:
+        yield OdooRecord('slide.tag', f"service_{slug(service.id)}", {'name': service.name})
+
+def testimonial_records(store):
+    for testimonial in store.testimonials:
+        yield OdooRecord('blog.post', f"testimonial_{slug(testimonial.id)}", {
+            'name': f"{testimonial.client}: {testimonial.project}",
+            'subtitle': f"{testimonial.author}, {testimonial.position}",
+            'content': f"<blockquote><p>{escape(testimonial.quote)}</p></blockquote>"
+                       f"<p><strong>{escape(testimonial.author)}</strong><br/><em>{escape(testimonial.position)}</em></p>",
+            'is_published': True,
+        }, {'blog_id': 'blog_testimonials'})
+
+def course_image(course, derivatives, blob_index, report):
+    """Best file to upload for a course image, or None when validation found no real image"""
+    check = report.get('catalog', {}).get(course.image)
+    if not is_displayable(check):
+        return None
+    rel_path = Path(course.image).as_posix()
+    derivative = select_derivative(derivatives, rel_path, COURSE_IMAGE_WIDTH, prefer_webp=False)
+    if derivative:
+        return DERIVATIVES_DIR / derivative
+    return resolve_blob(blob_index, check['path']) or BASE_DIR / check['path']
+
+def course_records(store, derivatives, blob_index, report):
+    for course in store.courses:
+        yield OdooRecord('slide.channel', f"course_{slug(course.id)}", {
+            'name': course.title,
+            'description_short': f"<p>{escape(course.description)}</p>",
+            'description': f"<p>{escape(course.description)}</p>"
+                           f"<p><strong>Certification:</strong> {escape(course.certification)}<br/>"
+                           f"<strong>Price:</strong> {escape(course.price)}</p>",
+            'is_published': True,
+        }, {'tag_ids': [f"tag_category_{slug(course.category)}"]},
+            course_image(course, derivatives, blob_index, report))
+
+def export_records(store, derivatives=None, blob_index=None, report=None):
+    """Every record to export, lazily, in load order"""
+    derivatives = load_derivative_index(DERIVATIVES_DIR) if derivatives is None else derivatives
+    blob_index = load_blob_index(BLOB_INDEX_PATH) if blob_index is None else blob_index
+    report = open_image_report() if report is None else report
+    # Referenced records (category tags, the blog) come before the records pointing at them
+    yield from support_records(store)
+    yield from service_records(store)
+    yield from testimonial_records(store)
+    yield from course_records(store, derivatives, blob_index, report)
+
+def batched(records, batch_size):
+    """(model, [records]) batches of at most ``batch_size`` consecutive same-model records"""
+    for model, group in itertools.groupby(records, key=lambda r: r.model):
+        while batch := list(itertools.islice(group, batch_size)):
+            yield model, batch
+
+def base64_chunks(path, chunk_bytes=BASE64_CHUNK_BYTES):
+    """Base64 text of a file, one chunk at a time"""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_bytes), b''):
+            yield base64.b64encode(chunk).decode('ascii')
+
+def qualified(xml_id):
+    return f"{MODULE}.{xml_id}"
+
+def csv_columns(batch):
+    columns = ['id'] + list(batch[0].values)
+    columns += [f"{name}/id" for name in batch[0].refs]
+    return columns + (['image_1920'] if batch[0].model == 'slide.channel' else [])
+
+def csv_cell(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return value
+
+def csv_row(record):
+    """Import row for a record in csv_columns() order, without the image column"""
+    row = [qualified(record.xml_id)] + [csv_cell(v) for v in record.values.values()]
+    row += [
+        ",".join(qualified(x) for x in ref) if isinstance(ref, list) else qualified(ref)
+        for ref in record.refs.values()
+    ]
+    return row
+
+def write_csv_batch(path, batch):
+    """One CSV file for Odoo's import dialog; the image column is streamed last"""
+    columns = csv_columns(batch)
+    has_image = columns[-1] == 'image_1920'
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerow(columns)
+        for record in batch:
+            row = csv_row(record)
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(row)
+            line = buffer.getvalue().rstrip('\r\n')
+            if not has_image:
+                f.write(line + '\r\n')
+                continue
+            # Base64 never needs CSV quoting, so the cell can be written chunk by chunk
+            f.write(line + ',')
+            if record.image:
+                for chunk in base64_chunks(record.image):
+                    f.write(chunk)
+            f.write('\r\n')
+
+def xml_field(name, value):
+    if isinstance(value, bool):
+        return f'        <field name="{name}" eval="{value}"/>\n'
+    return f'        <field name="{name}">{escape(value)}</field>\n'
+
+def write_xml_batch(path, batch):
+    """One Odoo data file; <record id> makes module updates upsert"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<odoo>\n')
+        for record in batch:
+            f.write(f'    <record id={quoteattr(record.xml_id)} model={quoteattr(record.model)}>\n')
+            for name, value in record.values.items():
+                f.write(xml_field(name, value))
+            for name, ref in record.refs.items():
+                if isinstance(ref, list):
+                    refs = ", ".join(f"ref('{x}')" for x in ref)
+                    f.write(f'        <field name="{name}" eval="[Command.set([{refs}])]"/>\n')
+                else:
+                    f.write(f'        <field name="{name}" ref={quoteattr(ref)}/>\n')
+            if record.image:
+                f.write('        <field name="image_1920">')
+                for chunk in base64_chunks(record.image):
+                    f.write(chunk)
+                f.write('</field>\n')
+            f.write('    </record>\n')
+        f.write('</odoo>\n')
+
+def write_manifest(out_dir, data_files):
+    manifest = {
+        'name': "I-Solutions Content",
+        'version': "18.0.1.0.0",
+        'summary': "Courses, services and testimonials exported from the content viewer",
+        'depends': MODULE_DEPENDS,
+        'data': data_files,
+        'license': "LGPL-3",
+    }
+    (out_dir / "__init__.py").write_text("", encoding='utf-8')
+    (out_dir / "__manifest__.py").write_text(repr(manifest) + "\n", encoding='utf-8')
+
+def export_files(records, out_dir, fmt, batch_size=DEFAULT_BATCH_SIZE):
+    """Write CSV files or an XML data module; returns {model: record count}"""
+    out_dir = Path(out_dir)
+    if fmt == 'xml':
+        out_dir = out_dir / MODULE
+        shutil.rmtree(out_dir / "data", ignore_errors=True)
+        data_dir = out_dir / "data"
+    else:
+        shutil.rmtree(out_dir / "csv", ignore_errors=True)
+        data_dir = out_dir / "csv"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    write_batch = write_xml_batch if fmt == 'xml' else write_csv_batch
+    counts = {}
+    data_files = []
+    for number, (model, batch) in enumerate(batched(records, batch_size), 1):
+        # Numbered so the files sort into load order
+        path = data_dir / f"{number:04d}_{model}.{fmt}"
+        write_batch(path, batch)
+        data_files.append(path.relative_to(out_dir).as_posix())
+        counts[model] = counts.get(model, 0) + len(batch)
+    if fmt == 'xml':
+        write_manifest(out_dir, data_files)
+    return counts
+
+class OdooRpc:
+    """Batched upserts over Odoo's external XML-RPC API"""
+
+    def __init__(self, url, db, user, password):
+        self.db = db
+        self.password = password
+        common = xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/common", allow_none=True)
+        self.uid = common.authenticate(db, user, password, {})
+        if not self.uid:
+            raise PermissionError(f"Odoo login failed for {user!r} on {db!r}")
+        self.models = xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/object", allow_none=True)
+        self.ids = {}   # external id -> database id, filled as batches resolve or create them
+        self.calls = 0
+
+    def execute(self, model, method, *args, **kwargs):
+        self.calls += 1
+        return self.models.execute_kw(self.db, self.uid, self.password, model, method, list(args), kwargs)
+
+    def resolve(self, xml_ids):
+        """Look up external ids not seen yet in one call"""
+        missing = sorted({x for x in xml_ids if x not in self.ids})
+        if missing:
+            rows = self.execute('ir.model.data', 'search_read',
+                                [('module', '=', MODULE), ('name', 'in', missing)], fields=['name', 'res_id'])
+            self.ids.update((row['name'], row['res_id']) for row in rows)
+        return self.ids
+
+    def upsert(self, model, batch):
+        """Create or update one batch with a single model.load() call; returns (created, updated)
+
+        load() takes the same columns as the CSV import and matches rows on their external id,
+        so records that already exist are updated in the same round trip that creates new ones.
+        """
+        known = self.resolve([r.xml_id for r in batch])
+        existing = sum(1 for r in batch if r.xml_id in known)
+        columns = csv_columns(batch)
+        rows = []
+        for record in batch:
+            row = csv_row(record)
+            if columns[-1] == 'image_1920':
+                row.append("".join(base64_chunks(record.image)) if record.image else "")
+            rows.append(row)
+        result = self.execute(model, 'load', columns, rows)
+        if not result.get('ids'):
+            errors = "; ".join(m.get('message', str(m)) for m in result.get('messages', []))
+            raise RuntimeError(f"Odoo rejected the {model} batch: {errors or 'no records loaded'}")
+        self.ids.update((r.xml_id, res_id) for r, res_id in zip(batch, result['ids']))
+        return len(batch) - existing, existing
+
+def export_rpc(records, rpc, batch_size=DEFAULT_BATCH_SIZE):
+    """Upsert every record; returns {model: {'created': n, 'updated': n}}"""
+    counts = {}
+    for model, batch in batched(records, batch_size):
+        created, updated = rpc.upsert(model, batch)
+        model_counts = counts.setdefault(model, {'created': 0, 'updated': 0})
+        model_counts['created'] += created
+        model_counts['updated'] += updated
+    return counts
+
+class MockOdoo:
+    """In-memory stand-in for the parts of Odoo's external API the exporter uses"""
+
+    def __init__(self):
+        self.tables = {}
+        self.next_id = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def version(self):
+        return {'server_version': "18.0", 'server_serie': "18.0", 'protocol_version': 1}
+
+    def authenticate(self, db, login, password, user_agent_env):
+        return 2
+
+    @staticmethod
+    def matches(row, domain):
+        for name, operator, value in domain:
+            if operator == '=' and row.get(name) != value:
+                return False
+            if operator == 'in' and row.get(name) not in value:
+                return False
+        return True
+
+    def execute_kw(self, db, uid, password, model, method, args, kwargs=None):
+        kwargs = kwargs or {}
+        with self.lock:
+            table = self.tables.setdefault(model, {})
+            if method == 'create':
+                rows = args[0] if isinstance(args[0], list) else [args[0]]
+                ids = []
+                for values in rows:
+                    record_id = next(self.next_id)
+                    table[record_id] = dict(values, id=record_id)
+                    ids.append(record_id)
+                return ids if isinstance(args[0], list) else ids[0]
+            if method == 'write':
+                for record_id in args[0]:
+                    table[record_id].update(args[1])
+                return True
+            if method == 'load':
+                return self.load(model, table, *args)
+            if method in ('search_read', 'search_count'):
+                rows = [row for row in table.values() if self.matches(row, args[0])]
+                if method == 'search_count':
+                    return len(rows)
+                names = (kwargs.get('fields') or list(rows[0])) if rows else []
+                return [{name: row.get(name) for name in set(names) | {'id'}} for row in rows]
+            raise xmlrpc.client.Fault(1, f"{model}.{method} is not supported by the mock")
+
+    def xml_id_record(self, xml_id):
+        module, name = xml_id.split('.', 1)
+        data = self.tables.setdefault('ir.model.data', {})
+        return next((row for row in data.values() if row['module'] == module and row['name'] == name), None)
+
+    def load(self, model, table, fields, rows):
+        """Upsert rows keyed by their 'id' external id, resolving '<field>/id' references"""
+        ids = []
+        for row in rows:
+            values = {}
+            for name, cell in zip(fields, row):
+                if name.endswith('/id'):
+                    refs = [self.xml_id_record(x)['res_id'] for x in cell.split(',')]
+                    values[name[:-3]] = refs if name.endswith('_ids/id') else refs[0]
+                elif name != 'id':
+                    values[name] = cell
+            data = self.xml_id_record(row[fields.index('id')])
+            if data:
+                table[data['res_id']].update(values)
+                ids.append(data['res_id'])
+                continue
+            record_id = next(self.next_id)
+            table[record_id] = dict(values, id=record_id)
+            module, name = row[fields.index('id')].split('.', 1)
+            data_id = next(self.next_id)
+            self.tables['ir.model.data'][data_id] = {
+                'id': data_id, 'module': module, 'name': name, 'model': model, 'res_id': record_id}
+            ids.append(record_id)
+        return {'ids': ids, 'messages': []}
+
+class MockRequestHandler(SimpleXMLRPCRequestHandler):
+    rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+
+def start_mock_server(mock=None, port=0):
+    """Serve a MockOdoo on localhost in a daemon thread; returns (url, mock, server)"""
+    mock = mock or MockOdoo()
+    server = MultiPathXMLRPCServer((MOCK_HOST, port), MockRequestHandler, logRequests=False, allow_none=True)
+    for path, functions in (("/xmlrpc/2/common", (mock.version, mock.authenticate)),
+                            ("/xmlrpc/2/object", (mock.execute_kw,))):
+        dispatcher = SimpleXMLRPCDispatcher(allow_none=True)
+        for function in functions:
+            dispatcher.register_function(function)
+        server.add_dispatcher(path, dispatcher)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://{MOCK_HOST}:{server.server_address[1]}", mock, server
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Export courses, services and testimonials to Odoo 18")
+    parser.add_argument("--format", choices=("csv", "xml", "xmlrpc"), default="csv",
+                        help="CSV import files, an XML data module, or live XML-RPC upserts (default: csv)")
+    parser.add_argument("--catalog", type=Path, default=CATALOG_PATH, help="catalog.json to export")
+    parser.add_argument("--output-dir", type=Path, default=EXPORT_DIR, help="where csv/xml output goes (default: odoo_export/)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"records per file or per load call (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--url", default="http://localhost:8069", help="Odoo base URL for --format xmlrpc")
+    parser.add_argument("--db", default="odoo", help="Odoo database for --format xmlrpc")
+    parser.add_argument("--user", default="admin", help="Odoo login for --format xmlrpc")
+    parser.add_argument("--mock", action="store_true", help="run against a local mock server (twice, to show upserts)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        store = load_content_store(args.catalog)
+    except ContentValidationError as e:
+        print(f"❌ {args.catalog.name} is invalid: {e}")
+        return
+    print(f"📤 Exporting {', '.join(f'{n} {s}' for s, n in store.summary().items() if s != 'faqs')} to Odoo ({args.format})")
+    print("=" * 60)
+    started = time.perf_counter()
+    report = open_image_report(catalog_path=args.catalog)
+    if args.format != 'xmlrpc':
+        counts = export_files(export_records(store, report=report), args.output_dir, args.format, args.batch_size)
+        for model, count in counts.items():
+            print(f"✅ {model}: {count}")
+        target = args.output_dir / (MODULE if args.format == 'xml' else "csv")
+        print(f"\n🎉 Wrote {sum(counts.values())} records to {target} in {time.perf_counter() - started:.2f}s")
+        return
+    runs = 2 if args.mock else 1
+    if args.mock:
+        url, mock, server = start_mock_server()
+        print(f"🧪 Mock Odoo at {url}")
+    else:
+        url = args.url
+    for run in range(1, runs + 1):
+        rpc = OdooRpc(url, args.db, args.user, os.environ.get("ODOO_PASSWORD", ""))
+        counts = export_rpc(export_records(store, report=report), rpc, args.batch_size)
+        for model, model_counts in counts.items():
+            print(f"✅ {model}: {model_counts['created']} created, {model_counts['updated']} updated")
+        print(f"🔁 Run {run}: {rpc.calls} XML-RPC calls in {time.perf_counter() - started:.2f}s\n")
+        started = time.perf_counter()
+    if args.mock:
+        server.shutdown()
+        print(json.dumps({model: len(rows) for model, rows in mock.tables.items()}, indent=2))
+
+if __name__ == "__main__":
+    main()
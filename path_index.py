@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Index of every image on disk, keyed by Unicode-normalised logical name
+
+Scraped filenames arrive in whatever form the site or the phone that took them used: Arabic
+names may be composed (NFC) or decomposed (NFD), and WhatsApp/macOS names put U+202F or U+00A0
+where a space is expected. Lookup keys are NFC with every Unicode space folded to ' ', and map
+to the name as spelled on disk plus the file to read (the blob store's copy when it has one),
+so resolving an image is one dictionary hit rather than a stat() per image per rerun.
+The index is saved to data/.cache/path_index.json and refreshed by comparing directory mtimes
+(a directory's mtime changes whenever an entry is added, removed or renamed):
+    python path_index.py                                  # refresh, list unresolved inventory entries
+    python path_index.py --content-dir data/sites/<host>/<epoch ms>
+    python path_index.py --resolve "static/images/misc/whatsapp-icon.svg"
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+from blob_store import BLOB_INDEX_PATH, EXCLUDED_DIRS, IMAGE_ROOTS, OBJECTS_DIR, load_blob_index
+
+BASE_DIR = Path(__file__).parent
+CONTENT_DIR = BASE_DIR / "data" / "content"
+INDEX_PATH = BASE_DIR / "data" / ".cache" / "path_index.json"
+INDEX_VERSION = 1
+
+def normalise_name(name):
+    """Lookup key for a path: NFC, with every Unicode space separator as a plain space"""
+    name = unicodedata.normalize('NFC', str(name))
+    return ''.join(' ' if unicodedata.category(ch) == 'Zs' else ch for ch in name)
+
+def mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+class PathIndex:
+    """Normalised logical name -> (name on disk, file to read), refreshed from directory mtimes"""
+
+    def __init__(self, files=None, dirs=None, blob_index_mtime_ns=0, roots=IMAGE_ROOTS):
+        self.files = files or {}        # key -> [logical name on disk, repo-relative file to read]
+        self.dirs = dirs or {}          # scanned directory (repo-relative) -> mtime_ns
+        self.blob_index_mtime_ns = blob_index_mtime_ns
+        self.roots = tuple(map(Path, roots))
+        self.checked = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.files)
+
+    def canonical(self, name):
+        """The logical name as spelled on disk, or None if no file matches"""
+        entry = self.files.get(normalise_name(name))
+        return entry[0] if entry else None
+
+    def resolve(self, name):
+        """Absolute path of the file to read for a logical name, or None if no file matches"""
+        entry = self.files.get(normalise_name(name))
+        return BASE_DIR / entry[1] if entry else None
+
+    def stale(self):
+        """Whether any scanned directory or the blob index changed since the last scan"""
+        if mtime_ns(BLOB_INDEX_PATH) != self.blob_index_mtime_ns:
+            return True
+        return any(mtime_ns(BASE_DIR / directory) != mtime for directory, mtime in self.dirs.items())
+
+    def scan(self):
+        """Rebuild the index from the image trees and the blob store"""
+        files = {}
+        dirs = {}
+        blob_index_mtime_ns = mtime_ns(BLOB_INDEX_PATH)
+        blob_index = load_blob_index(BLOB_INDEX_PATH)
+        blobs = set()
+        for root in self.roots + (OBJECTS_DIR,):
+            for directory, subdirs, filenames in os.walk(root):
+                subdirs[:] = [d for d in subdirs if d not in EXCLUDED_DIRS]
+                directory = Path(directory)
+                dirs[directory.relative_to(BASE_DIR).as_posix()] = mtime_ns(directory)
+                for filename in filenames:
+                    name = (directory / filename).relative_to(BASE_DIR).as_posix()
+                    if root == OBJECTS_DIR:
+                        blobs.add(name)
+                    else:
+                        files[normalise_name(name)] = [name, name]
+        objects = OBJECTS_DIR.relative_to(BASE_DIR).as_posix()
+        for entry in files.values():
+            blob = blob_index.get(entry[0])
+            if blob and f"{objects}/{blob['blob']}" in blobs:
+                entry[1] = f"{objects}/{blob['blob']}"
+        with self._lock:
+            self.files, self.dirs, self.blob_index_mtime_ns = files, dirs, blob_index_mtime_ns
+            self.checked = time.monotonic()
+
+    def refresh(self, max_age=0.0):
+        """Rescan if the trees changed; directories are only re-checked once ``max_age`` seconds pass
+
+        Returns True when the index was rebuilt.
+        """
+        with self._lock:
+            if time.monotonic() - self.checked < max_age:
+                return False
+            self.checked = time.monotonic()
+        if not self.stale():
+            return False
+        self.scan()
+        return True
+
+    def to_dict(self):
+        return {'version': INDEX_VERSION, 'blob_index_mtime_ns': self.blob_index_mtime_ns,
+                'dirs': self.dirs, 'files': self.files}
+
+def load_index(path=INDEX_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return PathIndex()
+    if data.get('version') != INDEX_VERSION:
+        return PathIndex()
+    return PathIndex(data['files'], data['dirs'], data['blob_index_mtime_ns'])
+
+def save_index(index, path=INDEX_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def open_path_index(path=INDEX_PATH, rebuild=False):
+    """Load the persisted index, rescanning (and saving) it if the image trees changed"""
+    index = PathIndex() if rebuild else load_index(path)
+    if rebuild or not index.dirs or index.stale():
+        index.scan()
+        try:
+            save_index(index, path)
+        except OSError:
+            # Read-only deploys still get an in-memory index
+            pass
+    return index
+
+def refresh_path_index(index, max_age=0.0, path=INDEX_PATH):
+    """Refresh a long-lived index (see PathIndex.refresh), saving it when it was rebuilt"""
+    if index.refresh(max_age):
+        try:
+            save_index(index, path)
+        except OSError:
+            pass
+    return index
+
+def unresolved_entries(inventory, index, site_images=None):
+    """[(category, filename, logical name)] for inventory entries no file on disk matches"""
+    site_images = site_images or {}
+    missing = []
+    for category, items in inventory.items():
+        for item in items:
+            site_image = site_images.get(item['filename'])
+            name = site_image['name'] if site_image else f"static/images/{category}/{item['filename']}"
+            if index.canonical(name) is None:
+                missing.append((category, item['filename'], name))
+    return missing
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Index image files by Unicode-normalised name")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR,
+                        help="content directory or site partition to check (default: data/content)")
+    parser.add_argument("--resolve", default=None, help="print the file a logical name resolves to")
+    parser.add_argument("--rebuild", action="store_true", help="rescan even if no directory changed")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    index = open_path_index(rebuild=args.rebuild)
+    print(f"🗂️  {len(index)} files in {len(index.dirs)} directories indexed ({time.perf_counter() - started:.2f}s)")
+    if args.resolve:
+        target = index.resolve(args.resolve)
+        print(f"{'✅' if target else '❌'} {args.resolve} → {target or 'no matching file'}")
+        return
+    try:
+        with open(args.content_dir / "images_inventory.json", 'r', encoding='utf-8') as f:
+            inventory = json.load(f)
+    except (OSError, ValueError):
+        print(f"⚠️  No images_inventory.json in {args.content_dir}")
+        return
+    try:
+        with open(args.content_dir / "images.json", 'r', encoding='utf-8') as f:
+            site_images = json.load(f)
+    except (OSError, ValueError):
+        site_images = {}
+    missing = unresolved_entries(inventory, index, site_images)
+    for category, filename, name in missing:
+        print(f"⚠️  unresolved  {category}/{filename} ({name})")
+    total = sum(len(items) for items in inventory.values())
+    print(f"{'✅' if not missing else '❌'} {total - len(missing)} of {total} inventory entries resolve to a file")
+
+if __name__ == "__main__":
+    main()
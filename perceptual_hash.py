@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Perceptual-hash index for finding near-duplicate images
+
+Every raster image under data/images and static/images gets three 64-bit hashes (aHash,
+dHash, pHash) computed with NumPy over downscaled grayscale arrays, a whole batch at a time.
+Hashes are saved to data/.cache/perceptual_hashes.json and only recomputed for files whose
+mtime or size changed. Near-duplicates are images whose pHash and dHash are both within a
+small Hamming distance, e.g. the same logo resized to -300x300:
+    python perceptual_hash.py                                  # update the index, list groups
+    python perceptual_hash.py --query static/images/cert_ai.jpg --max-distance 12
+    python perceptual_hash.py --json near_duplicates.json
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from blob_store import IMAGE_ROOTS, iter_image_files, logical_name
+
+BASE_DIR = Path(__file__).parent
+INDEX_PATH = BASE_DIR / "data" / ".cache" / "perceptual_hashes.json"
+INDEX_VERSION = 2
+
+HASH_KINDS = ('ahash', 'dhash', 'phash')
+# Images are reduced to this size for pHash; aHash averages it down to 8x8 blocks
+PHASH_SIZE = 32
+HASH_SIZE = 8
+# Both pHash and dHash must be this close for two images to count as near-duplicates
+DEFAULT_MAX_DISTANCE = 6
+# Rows of the pairwise distance matrix computed at once
+PAIR_CHUNK = 1024
+RASTER_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+def dct_matrix(size):
+    """Orthonormal DCT-II basis, so coefficients = M @ block @ M.T"""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * n + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix.astype(np.float32)
+
+DCT = dct_matrix(PHASH_SIZE)
+
+def grayscale_arrays(path):
+    """(32x32, 8x9) grayscale float arrays for one image, transparency flattened onto white"""
+    # Imported here so the viewer can load the index without loading PIL
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.draft('L', (PHASH_SIZE * 2, PHASH_SIZE * 2))
+        if image.mode in ('P', 'LA', 'RGBA', 'PA') or 'transparency' in image.info:
+            rgba = image.convert('RGBA')
+            image = Image.new('RGBA', rgba.size, (255, 255, 255, 255))
+            image.alpha_composite(rgba)
+        gray = image.convert('L')
+        square = gray.resize((PHASH_SIZE, PHASH_SIZE), Image.Resampling.LANCZOS)
+        gradient = gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.LANCZOS)
+        size = gray.size
+    return np.asarray(square, dtype=np.float32), np.asarray(gradient, dtype=np.float32), size
+
+def pack_bits(bits):
+    """(N, 64) booleans -> (N,) uint64"""
+    return np.packbits(bits.reshape(len(bits), -1), axis=1).view('>u8').ravel().astype(np.uint64)
+
+def compute_hashes(squares, gradients):
+    """{kind: (N,) uint64} for a batch of (N, 32, 32) and (N, 8, 9) arrays, plus a (N,) flatness mask"""
+    count = len(squares)
+    blocks = squares.reshape(count, HASH_SIZE, PHASH_SIZE // HASH_SIZE, HASH_SIZE, PHASH_SIZE // HASH_SIZE).mean(axis=(2, 4))
+    ahash = blocks > blocks.mean(axis=(1, 2), keepdims=True)
+    dhash = gradients[:, :, 1:] > gradients[:, :, :-1]
+    low = (DCT @ squares @ DCT.T)[:, :HASH_SIZE, :HASH_SIZE].reshape(count, -1)
+    # The DC term only encodes overall brightness, so it is left out of the median
+    phash = low > np.median(low[:, 1:], axis=1, keepdims=True)
+    return {'ahash': pack_bits(ahash), 'dhash': pack_bits(dhash), 'phash': pack_bits(phash),
+            'flat': np.ptp(squares.reshape(count, -1), axis=1) == 0}
+
+class PerceptualIndex:
+    """Hashes for every indexed image, as parallel NumPy arrays for fast Hamming queries"""
+
+    def __init__(self, entries=None):
+        self.entries = entries or {}    # logical name -> {mtime_ns, size, width, height, ahash, dhash, phash}
+        self.names = sorted(self.entries)
+        self.hashes = {
+            kind: np.array([int(self.entries[name][kind], 16) for name in self.names], dtype=np.uint64)
+            for kind in HASH_KINDS
+        }
+
+    def __len__(self):
+        return len(self.names)
+
+    def distances(self, value, kind='phash'):
+        """Hamming distance from a 64-bit hash to every indexed image"""
+        return np.bitwise_count(self.hashes[kind] ^ np.uint64(value))
+
+    def query(self, name, max_distance=DEFAULT_MAX_DISTANCE, kind='phash'):
+        """[(distance, name)] of images within ``max_distance`` of an indexed image, nearest first"""
+        distances = self.distances(int(self.entries[name][kind], 16), kind)
+        hits = np.flatnonzero(distances <= max_distance)
+        return sorted((int(distances[i]), self.names[i]) for i in hits if self.names[i] != name)
+
+    def near_duplicate_groups(self, max_distance=DEFAULT_MAX_DISTANCE):
+        """Groups of names whose pHash and dHash are both within ``max_distance``, best image first"""
+        parent = list(range(len(self)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        phash, dhash = self.hashes['phash'], self.hashes['dhash']
+        # Single-colour placeholders all hash to the same value; they are not duplicates of each other
+        flat = np.array([self.entries[name]['flat'] for name in self.names], dtype=bool)
+        for start in range(0, len(self), PAIR_CHUNK):
+            rows = slice(start, start + PAIR_CHUNK)
+            close = ((np.bitwise_count(phash[rows, None] ^ phash[None, :]) <= max_distance)
+                     & (np.bitwise_count(dhash[rows, None] ^ dhash[None, :]) <= max_distance)
+                     & ~flat[rows, None] & ~flat[None, :])
+            for i, j in zip(*np.nonzero(close)):
+                i += start
+                if i < j:
+                    parent[find(i)] = find(j)
+        groups = {}
+        for i, name in enumerate(self.names):
+            groups.setdefault(find(i), []).append(name)
+        # Keep the largest rendition (then the largest file) as the representative
+        rank = lambda name: (-self.entries[name]['width'] * self.entries[name]['height'], -self.entries[name]['size'], name)
+        return sorted((sorted(group, key=rank) for group in groups.values() if len(group) > 1), key=lambda g: g[0])
+
+    def to_dict(self):
+        return {'version': INDEX_VERSION, 'entries': self.entries}
+
+def load_index(path=INDEX_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return PerceptualIndex()
+    return PerceptualIndex(data['entries'] if data.get('version') == INDEX_VERSION else {})
+
+def save_index(index, path=INDEX_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def update_index(index, roots=IMAGE_ROOTS, workers=None, files=None):
+    """New index with hashes for changed files recomputed; returns (index, hashed, failed)
+
+    ``files`` ({logical name: file to read}) limits the update to those images, keeping every
+    other entry as it is; by default every image under ``roots`` is indexed.
+    """
+    if files is None:
+        entries = {}
+        files = {logical_name(path): path for path in iter_image_files(roots)}
+    else:
+        entries = dict(index.entries)
+    pending = []
+    for name, path in files.items():
+        path = Path(path)
+        if path.suffix.lower() not in RASTER_SUFFIXES:
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            entries.pop(name, None)
+            continue
+        old = index.entries.get(name)
+        if old and (old['mtime_ns'], old['size']) == (stat.st_mtime_ns, stat.st_size):
+            entries[name] = old
+        else:
+            pending.append((name, path, stat))
+
+    def load(job):
+        try:
+            return grayscale_arrays(job[1])
+        except (OSError, ValueError):
+            return None
+
+    # Decoding and resampling release the GIL, so threads keep every core busy
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        loaded = list(pool.map(load, pending))
+    ok = [(job, arrays) for job, arrays in zip(pending, loaded) if arrays is not None]
+    if ok:
+        hashes = compute_hashes(np.stack([a[0] for _, a in ok]), np.stack([a[1] for _, a in ok]))
+        for position, ((name, path, stat), arrays) in enumerate(ok):
+            entries[name] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'width': arrays[2][0],
+                'height': arrays[2][1],
+                **{kind: f"{int(hashes[kind][position]):016x}" for kind in HASH_KINDS},
+                'flat': bool(hashes['flat'][position]),
+            }
+    return PerceptualIndex(entries), len(ok), len(pending) - len(ok)
+
+def open_perceptual_index(path=INDEX_PATH, roots=IMAGE_ROOTS, rebuild=False, files=None):
+    """Load the persisted index and bring it up to date with the image trees (or just ``files``)"""
+    previous = PerceptualIndex() if rebuild else load_index(path)
+    index, hashed, failed = update_index(previous, roots, files=files)
+    if hashed or set(index.entries) != set(previous.entries):
+        try:
+            save_index(index, path)
+        except OSError:
+            pass
+    return index
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Find near-duplicate images with perceptual hashes")
+    parser.add_argument("--query", type=Path, default=None, help="list images near this one instead of all groups")
+    parser.add_argument("--max-distance", type=int, default=DEFAULT_MAX_DISTANCE,
+                        help=f"Hamming distance (out of 64) still counted as a match (default: {DEFAULT_MAX_DISTANCE})")
+    parser.add_argument("--workers", type=int, default=None, help="parallel decodes (default: one per core)")
+    parser.add_argument("--rebuild", action="store_true", help="rehash every image")
+    parser.add_argument("--json", type=Path, default=None, help="also write the near-duplicate groups here")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    previous = PerceptualIndex() if args.rebuild else load_index()
+    index, hashed, failed = update_index(previous, workers=args.workers)
+    save_index(index)
+    print(f"🧬 {len(index)} images indexed ({hashed} hashed, {failed} undecodable) in {time.perf_counter() - started:.2f}s")
+    if args.query:
+        name = logical_name(args.query.resolve())
+        if name not in index.entries:
+            print(f"❌ {name} is not in the index")
+            return
+        started = time.perf_counter()
+        matches = index.query(name, args.max_distance)
+        print(f"🔍 {len(matches)} images within {args.max_distance} bits of {name} "
+              f"({(time.perf_counter() - started) * 1000:.2f}ms)")
+        for distance, match in matches:
+            print(f"  {distance:2d}  {match}")
+        return
+    started = time.perf_counter()
+    groups = index.near_duplicate_groups(args.max_distance)
+    print(f"🔍 {len(groups)} near-duplicate groups ({(time.perf_counter() - started) * 1000:.1f}ms)")
+    redundant_bytes = 0
+    for group in groups:
+        print(f"\n  ✅ {group[0]}")
+        for name in group[1:]:
+            redundant_bytes += index.entries[name]['size']
+            print(f"     ≈ {name}")
+    print(f"\n💾 {redundant_bytes / 1024:.0f} KB in near-duplicates that could be collapsed")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(groups, f, indent=2, ensure_ascii=False)
+        print(f"💾 Groups written to {args.json}")
+
+if __name__ == "__main__":
+    main()
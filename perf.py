@@ -0,0 +1,134 @@
+"""
+Lightweight timers and counters for the viewer's hot paths
+
+Every rerun gets a trace: the page it rendered, its wall time, and the time and call count of
+each named span (JSON loads, image loads, image emission, page render). Streamlit runs each
+session's script on its own thread, so spans attach to the calling thread's current trace.
+Finished traces are kept in memory for the sidebar panel and can be exported:
+    VIEWER_PERF_LOG=perf.jsonl streamlit run app.py          # one JSON line per rerun
+    VIEWER_PERF_PROM=/var/lib/node_exporter/viewer.prom ...   # Prometheus text file, rewritten
+views.common.perf_recorder() holds a single Recorder per process, shared by every visitor session.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_HISTORY = 50
+# The Prometheus file is rewritten at most this often
+PROM_WRITE_INTERVAL = 5.0
+
+class Recorder:
+    """Thread-safe per-rerun traces plus process-lifetime totals"""
+
+    def __init__(self, history=DEFAULT_HISTORY, jsonl_path=None, prom_path=None):
+        self.traces = deque(maxlen=history)
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.prom_path = Path(prom_path) if prom_path else None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._prom_written = 0.0
+        # Totals since start: {page: [seconds, reruns]}, {span: [seconds, calls]}
+        self.page_totals = {}
+        self.span_totals = {}
+        self.gauges = {}
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        """Recorder exporting to $VIEWER_PERF_LOG / $VIEWER_PERF_PROM when they are set"""
+        return cls(int(environ.get("VIEWER_PERF_HISTORY", DEFAULT_HISTORY)),
+                   environ.get("VIEWER_PERF_LOG"), environ.get("VIEWER_PERF_PROM"))
+
+    def begin(self):
+        """Start tracing a script run on this thread; spans recorded until end() belong to it"""
+        self._local.trace = {'ts': time.time(), 'page': None, 'spans': {}, 'started': time.perf_counter()}
+
+    def end(self, page):
+        """Finish this thread's trace, labelled with the page it rendered"""
+        trace = getattr(self._local, 'trace', None)
+        if trace is None:
+            return
+        self._local.trace = None
+        trace['total_ms'] = (time.perf_counter() - trace.pop('started')) * 1000
+        trace['page'] = page
+        self.finish(trace)
+
+    @contextmanager
+    def timer(self, name):
+        """Time a block into the current run's trace (a no-op outside one)"""
+        trace = getattr(self._local, 'trace', None)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if trace is not None:
+                elapsed = (time.perf_counter() - started) * 1000
+                span = trace['spans'].setdefault(name, [0.0, 0])
+                span[0] += elapsed
+                span[1] += 1
+
+    def set_gauges(self, prefix, values):
+        """Publish point-in-time numbers (e.g. ImageCache.stats()) with the next export"""
+        with self._lock:
+            self.gauges.update({f"{prefix}_{key}": value for key, value in values.items()
+                                if isinstance(value, (int, float))})
+
+    def finish(self, trace):
+        with self._lock:
+            self.traces.append(trace)
+            page = self.page_totals.setdefault(trace['page'], [0.0, 0])
+            page[0] += trace['total_ms'] / 1000
+            page[1] += 1
+            for name, (ms, calls) in trace['spans'].items():
+                total = self.span_totals.setdefault(name, [0.0, 0])
+                total[0] += ms / 1000
+                total[1] += calls
+            write_prom = self.prom_path and time.monotonic() - self._prom_written >= PROM_WRITE_INTERVAL
+            if write_prom:
+                self._prom_written = time.monotonic()
+                prom_text = self.prometheus_text()
+        if self.jsonl_path:
+            line = json.dumps({**trace, 'spans': {k: {'ms': round(v[0], 3), 'calls': v[1]}
+                                                  for k, v in trace['spans'].items()}},
+                              ensure_ascii=False)
+            with self._lock, open(self.jsonl_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+        if write_prom:
+            tmp_path = self.prom_path.with_name(f"{self.prom_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(prom_text, encoding='utf-8')
+            os.replace(tmp_path, self.prom_path)
+
+    def recent(self, limit=None):
+        """Newest-first copies of the last ``limit`` traces"""
+        with self._lock:
+            traces = list(self.traces)
+        return traces[::-1][:limit]
+
+    def prometheus_text(self):
+        """Totals in the Prometheus text exposition format (call with the lock held)"""
+        lines = [
+            "# HELP viewer_rerun_seconds Script run wall time by page",
+            "# TYPE viewer_rerun_seconds summary",
+        ]
+        for page, (seconds, reruns) in sorted(self.page_totals.items()):
+            lines.append(f'viewer_rerun_seconds_sum{{page="{label_value(page)}"}} {seconds:.6f}')
+            lines.append(f'viewer_rerun_seconds_count{{page="{label_value(page)}"}} {reruns}')
+        lines += [
+            "# HELP viewer_span_seconds Time inside instrumented hot paths",
+            "# TYPE viewer_span_seconds summary",
+        ]
+        for span, (seconds, calls) in sorted(self.span_totals.items()):
+            lines.append(f'viewer_span_seconds_sum{{span="{label_value(span)}"}} {seconds:.6f}')
+            lines.append(f'viewer_span_seconds_count{{span="{label_value(span)}"}} {calls}')
+        for name, value in sorted(self.gauges.items()):
+            lines.append(f"# TYPE viewer_{name} gauge")
+            lines.append(f"viewer_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+def label_value(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
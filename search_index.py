@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Full-text search over courses, services, testimonials, FAQs, headings and image alt text
+
+An in-process inverted index with Arabic/English tokenisation, BM25 ranking, prefix and
+one-edit fuzzy matching. It is persisted to <content dir>/.cache/search_index.json and
+updated incrementally: only records whose text changed are re-tokenised.
+    python search_index.py "project managment"       # update the index if needed, then query
+    python search_index.py تدريب --content-dir data/sites/<host>/<epoch ms>
+    python search_index.py --rebuild
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import math
+import os
+import re
+import time
+import unicodedata
+from pathlib import Path
+
+from content_store import CATALOG_PATH, load_content_store
+from lazy_json import CACHE_DIRNAME, open_document
+
+BASE_DIR = Path(__file__).parent
+CONTENT_DIR = BASE_DIR / "data" / "content"
+INDEX_FILENAME = "search_index.json"
+INDEX_VERSION = 1
+
+# Title tokens count this many times more than body tokens
+TITLE_WEIGHT = 3
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Score multipliers for inexact term matches, and how far a prefix may expand
+PREFIX_MATCH = 0.7
+FUZZY_MATCH = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+FUZZY_MIN_LENGTH = 4
+SNIPPET_CHARS = 160
+
+TOKEN_RE = re.compile(r'\w+')
+# Harakat, Quranic marks and tatweel carry no meaning for search
+ARABIC_MARKS_RE = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+ARABIC_FOLD = str.maketrans({'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ة': 'ه', 'ى': 'ي', 'ؤ': 'و', 'ئ': 'ي'})
+# Conjunction/preposition + definite article prefixes, longest first
+ARABIC_PREFIXES = ('وال', 'بال', 'كال', 'فال', 'لل', 'ال')
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it', 'of', 'on',
+    'or', 'our', 'the', 'to', 'we', 'with', 'you', 'your',
+    'في', 'من', 'علي', 'الي', 'عن', 'مع', 'او', 'ان', 'هذا', 'هذه', 'التي', 'الذي', 'و',
+})
+
+def normalize(text):
+    """Case-fold and fold Arabic letter variants so spellings match"""
+    text = unicodedata.normalize('NFKC', text).casefold()
+    return ARABIC_MARKS_RE.sub('', text).translate(ARABIC_FOLD)
+
+def is_arabic(token):
+    return '\u0600' <= token[0] <= '\u06ff'
+
+def stem(token):
+    """Light stemming: Arabic article/prefix stripping, English plural stripping"""
+    if is_arabic(token):
+        for prefix in ARABIC_PREFIXES:
+            if token.startswith(prefix) and len(token) - len(prefix) >= 2:
+                return token[len(prefix):]
+        return token
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+def tokenize(text):
+    """Search terms for a piece of Arabic and/or English text"""
+    terms = []
+    for token in TOKEN_RE.findall(normalize(text)):
+        if token in STOPWORDS or (len(token) < 2 and not token.isdigit()):
+            continue
+        terms.append(stem(token))
+    return terms
+
+def deletes(term):
+    """Every string one deletion away from ``term`` (symmetric-delete fuzzy matching)"""
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+def within_one_edit(a, b):
+    """Whether two terms differ by at most one insertion, deletion, substitution or transposition"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diffs = [i for i in range(len(a)) if a[i] != b[i]]
+        return len(diffs) == 1 or (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+                                   and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]])
+    short, long_ = (a, b) if len(a) < len(b) else (b, a)
+    i = 0
+    while i < len(short) and short[i] == long_[i]:
+        i += 1
+    return short[i:] == long_[i + 1:]
+
+def document_hash(doc):
+    return hashlib.sha1(f"{doc['title']}\x00{doc['body']}".encode('utf-8')).hexdigest()[:16]
+
+def content_documents(store, homepage_content=None, images_inventory=None):
+    """Searchable records (id, kind, title, body, ref) for the catalogue and one content directory"""
+    for course in store.courses:
+        yield {'id': f"course:{course.id}", 'kind': 'course', 'title': course.title, 'ref': course.id,
+               'body': f"{course.category} {course.certification} {course.description}"}
+    for service in store.services:
+        yield {'id': f"service:{service.id}", 'kind': 'service', 'title': service.name, 'ref': service.id,
+               'body': service.description}
+    for testimonial in store.testimonials:
+        yield {'id': f"testimonial:{testimonial.id}", 'kind': 'testimonial', 'title': testimonial.client,
+               'ref': testimonial.id,
+               'body': f"{testimonial.quote} {testimonial.author} {testimonial.position} {testimonial.project}"}
+    for faq in store.faqs:
+        yield {'id': f"faq:{faq.id}", 'kind': 'faq', 'title': faq.question, 'ref': faq.id, 'body': faq.answer}
+    for heading in (homepage_content or {}).get('headings', []):
+        yield {'id': f"heading:{heading['level']}:{heading['text']}", 'kind': 'heading',
+               'title': heading['text'], 'ref': heading['level'], 'body': ''}
+    for category, entries in (images_inventory or {}).items():
+        for entry in entries:
+            yield {'id': f"image:{category}/{entry['filename']}", 'kind': 'image',
+                   'title': entry.get('alt') or entry['filename'], 'ref': f"{category}/{entry['filename']}",
+                   'body': f"{entry['filename'].rsplit('.', 1)[0].replace('-', ' ').replace('_', ' ')} {category}"}
+
+class SearchIndex:
+    """Inverted index of weighted term frequencies with BM25 ranking"""
+
+    def __init__(self):
+        self.docs = {}          # id -> {kind, title, ref, snippet, hash, length, terms}
+        self.postings = {}      # term -> {id: weighted term frequency}
+        self.sources = {}       # source file -> [mtime_ns, size] the index was built from
+        self._terms = None      # sorted terms for prefix lookups, built on demand
+        self._deletes = None    # one-deletion variant -> terms, built on demand
+        self._average_length = None
+
+    def _invalidate(self):
+        self._terms = None
+        self._deletes = None
+        self._average_length = None
+
+    def _remove(self, doc_id):
+        doc = self.docs.pop(doc_id)
+        for term in doc['terms']:
+            posting = self.postings[term]
+            del posting[doc_id]
+            if not posting:
+                del self.postings[term]
+
+    def _add(self, doc, digest):
+        terms = {}
+        for term in tokenize(doc['title']):
+            terms[term] = terms.get(term, 0) + TITLE_WEIGHT
+        for term in tokenize(doc['body']):
+            terms[term] = terms.get(term, 0) + 1
+        body = ' '.join(doc['body'].split())
+        self.docs[doc['id']] = {
+            'kind': doc['kind'],
+            'title': doc['title'],
+            'ref': doc['ref'],
+            'snippet': body if len(body) <= SNIPPET_CHARS else body[:SNIPPET_CHARS - 1] + '…',
+            'hash': digest,
+            'length': sum(terms.values()),
+            'terms': terms,
+        }
+        for term, weight in terms.items():
+            self.postings.setdefault(term, {})[doc['id']] = weight
+
+    def update(self, documents):
+        """Bring the index in line with ``documents``; returns (added, changed, removed) counts"""
+        seen = set()
+        added = changed = 0
+        for doc in documents:
+            if doc['id'] in seen:
+                continue
+            seen.add(doc['id'])
+            digest = document_hash(doc)
+            current = self.docs.get(doc['id'])
+            if current and current['hash'] == digest:
+                continue
+            if current:
+                self._remove(doc['id'])
+                changed += 1
+            else:
+                added += 1
+            self._add(doc, digest)
+        stale = [doc_id for doc_id in self.docs if doc_id not in seen]
+        for doc_id in stale:
+            self._remove(doc_id)
+        if added or changed or stale:
+            self._invalidate()
+        return added, changed, len(stale)
+
+    def _expansions(self, token):
+        """[(term, match multiplier)] that a query token matches"""
+        matches = {}
+        if token in self.postings:
+            matches[token] = 1.0
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        start = bisect.bisect_left(self._terms, token)
+        for term in self._terms[start:start + MAX_PREFIX_EXPANSIONS + 1]:
+            if not term.startswith(token):
+                break
+            matches.setdefault(term, PREFIX_MATCH)
+        if not matches and len(token) >= FUZZY_MIN_LENGTH:
+            variants = self._deletes
+            if variants is None:
+                # Built locally and published in one assignment: the index is shared by every
+                # session, so a concurrent query must never see a half-filled map
+                variants = {}
+                for term in self.postings:
+                    for variant in deletes(term) | {term}:
+                        variants.setdefault(variant, []).append(term)
+                self._deletes = variants
+            for variant in deletes(token) | {token}:
+                for term in variants.get(variant, ()):
+                    if within_one_edit(token, term):
+                        matches.setdefault(term, FUZZY_MATCH)
+        return matches.items()
+
+    def search(self, query, limit=10, kinds=None):
+        """Ranked [(score, id, doc)] for a free-text query"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self.docs:
+            return []
+        count = len(self.docs)
+        if self._average_length is None:
+            self._average_length = sum(doc['length'] for doc in self.docs.values()) / count
+        average_length = self._average_length
+        scores = {}
+        matched = {}
+        for token in tokens:
+            # A document scores once per query token, through its best-matching expansion
+            best = {}
+            for term, multiplier in self._expansions(token):
+                posting = self.postings[term]
+                idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for doc_id, weight in posting.items():
+                    length = self.docs[doc_id]['length']
+                    tf = weight * (BM25_K1 + 1) / (weight + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length))
+                    score = multiplier * idf * tf
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+        ranked = []
+        for doc_id, score in scores.items():
+            doc = self.docs[doc_id]
+            if kinds and doc['kind'] not in kinds:
+                continue
+            # Favour documents that match every query word
+            ranked.append((score * matched[doc_id] / len(tokens), doc_id, doc))
+        ranked.sort(key=lambda r: (-r[0], r[1]))
+        return ranked[:limit]
+
+    def stats(self):
+        return {'documents': len(self.docs), 'terms': len(self.postings)}
+
+    def to_dict(self):
+        return {'version': INDEX_VERSION, 'sources': self.sources, 'docs': self.docs, 'postings': self.postings}
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        if data.get('version') == INDEX_VERSION:
+            index.sources = data['sources']
+            index.docs = data['docs']
+            index.postings = data['postings']
+        return index
+
+def index_path(content_dir=CONTENT_DIR):
+    """Where the persisted index for a content directory lives"""
+    return Path(content_dir) / CACHE_DIRNAME / INDEX_FILENAME
+
+def source_files(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH):
+    return [Path(catalog_path), Path(content_dir) / "homepage_content.json",
+            Path(content_dir) / "images_inventory.json"]
+
+def source_signature(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH):
+    """{path: [mtime_ns, size]} of the files an index is built from (missing files are [0, 0])"""
+    signature = {}
+    for path in source_files(content_dir, catalog_path):
+        try:
+            stat = path.stat()
+            signature[str(path)] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            signature[str(path)] = [0, 0]
+    return signature
+
+def load_index(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return SearchIndex.from_dict(json.load(f))
+    except (OSError, ValueError):
+        return SearchIndex()
+
+def save_index(index, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def open_search_index(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH, rebuild=False):
+    """Load the persisted index for a content directory, updating it first if its sources changed
+
+    Returns (index, (added, changed, removed)).
+    """
+    path = index_path(content_dir)
+    index = SearchIndex() if rebuild else load_index(path)
+    signature = source_signature(content_dir, catalog_path)
+    if index.sources == signature and index.docs:
+        return index, (0, 0, 0)
+    homepage_file, inventory_file = source_files(content_dir, catalog_path)[1:]
+    documents = content_documents(
+        load_content_store(catalog_path),
+        open_document(homepage_file) if homepage_file.exists() else None,
+        open_document(inventory_file) if inventory_file.exists() else None,
+    )
+    counts = index.update(documents)
+    index.sources = signature
+    try:
+        save_index(index, path)
+    except OSError:
+        # Read-only deploys still get an in-memory index
+        pass
+    return index, counts
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Search the scraped content")
+    parser.add_argument("query", nargs="?", default="", help="free-text query (Arabic or English)")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR,
+                        help="content directory or site partition (default: data/content)")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--rebuild", action="store_true", help="discard the persisted index and rebuild it")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    index, (added, changed, removed) = open_search_index(args.content_dir, rebuild=args.rebuild)
+    stats = index.stats()
+    print(f"📚 {stats['documents']} documents, {stats['terms']} terms "
+          f"({added} added, {changed} changed, {removed} removed in {time.perf_counter() - started:.2f}s)")
+    if not args.query:
+        return
+    started = time.perf_counter()
+    results = index.search(args.query, args.limit)
+    print(f"🔍 {len(results)} results for {args.query!r} in {(time.perf_counter() - started) * 1000:.2f}ms")
+    for score, doc_id, doc in results:
+        print(f"  {score:6.2f}  [{doc['kind']}] {doc['title']}")
+
+if __name__ == "__main__":
+    main()
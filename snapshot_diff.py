@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Diff two content snapshots and emit a compact change set
+
+Compares homepage_content.json, links.json, images_inventory.json and the snapshot images
+record by record (keyed by identity, compared by content hash), so image processing only
+re-processes what changed. Changed images are listed both where the snapshot keeps them and
+under the static/images/<category>/ name the viewer publishes them as:
+    python snapshot_diff.py data/sites/<host>/<old> data/sites/<host>/<new> --output changes.json
+    python snapshot_diff.py --latest academy.tharwah.net
+    python snapshot_diff.py data/content /tmp/extracted --images-a static/images --images-b /tmp/images
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from blob_store import file_digest
+from ingest_sites import SITES_DIR, load_site_index, partition_dir
+
+CONTENT_FILES = ('homepage_content.json', 'links.json', 'images_inventory.json')
+CHANGESET_VERSION = 1
+
+def record_hash(value):
+    """Stable short hash of a JSON value"""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:16]
+
+def load_document(directory, filename):
+    """(decoded JSON or {}, sha256 of the raw file or None)"""
+    path = Path(directory) / filename
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return {}, None
+    return json.loads(raw), hashlib.sha256(raw).hexdigest()
+
+def keyed(records, key_fn):
+    """{identity: record} (last one wins for duplicate identities)"""
+    return {key_fn(record): record for record in records}
+
+def diff_keyed(old, new):
+    """Added / removed / modified identities between two {identity: record} maps"""
+    added = sorted(new.keys() - old.keys())
+    removed = sorted(old.keys() - new.keys())
+    modified = sorted(k for k in old.keys() & new.keys() if record_hash(old[k]) != record_hash(new[k]))
+    return {'added': added, 'removed': removed, 'modified': modified}
+
+def section_records(document_name, document):
+    """Split a content document into named sections of {identity: record}"""
+    if document_name == 'homepage_content.json':
+        contact = document.get('contact_info', {})
+        return {
+            'page': {field: document.get(field, '') for field in ('page_title', 'meta_description')},
+            'headings': keyed(document.get('headings', []), lambda h: f"{h['level']}:{h['text']}"),
+            'text_blocks': keyed(document.get('all_text_blocks', []), record_hash),
+            'services': keyed(document.get('services', []), record_hash),
+            'testimonials': keyed(document.get('testimonials', []), record_hash),
+            'faqs': keyed(document.get('faqs', []), record_hash),
+            'phones': keyed(contact.get('phones', []), str),
+            'emails': keyed(contact.get('emails', []), str),
+        }
+    if document_name == 'links.json':
+        return {kind: keyed(document.get(kind, []), lambda l: l['url'])
+                for kind in ('social_media', 'internal', 'external')}
+    # images_inventory.json
+    return {'inventory': {f"{category}/{entry['filename']}": entry
+                          for category, entries in document.items() for entry in entries}}
+
+def image_hashes(directory, images_dir=None):
+    """{filename: {'sha256', 'name'}} for a snapshot's images
+
+    Partitions carry images.json with hashes already computed; plain folders are hashed.
+    """
+    if images_dir is None:
+        try:
+            with open(Path(directory) / "images.json", 'r', encoding='utf-8') as f:
+                return {name: {'sha256': e['sha256'], 'name': e.get('name')} for name, e in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
+    root = Path(images_dir)
+    hashes = {}
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.stat().st_size > 0 and '_derivatives' not in path.parts:
+            hashes[path.relative_to(root).as_posix()] = {'sha256': file_digest(path), 'name': str(path)}
+    return hashes
+
+def diff_snapshots(old_dir, new_dir, old_images=None, new_images=None):
+    """Compact change set between two content snapshots"""
+    changes = {}
+    for filename in CONTENT_FILES:
+        old_doc, old_digest = load_document(old_dir, filename)
+        new_doc, new_digest = load_document(new_dir, filename)
+        if old_digest and old_digest == new_digest:
+            # Byte-identical documents cannot contain changes
+            continue
+        old_sections = section_records(filename, old_doc)
+        new_sections = section_records(filename, new_doc)
+        for section in sorted(old_sections.keys() | new_sections.keys()):
+            old_records = old_sections.get(section, {})
+            new_records = new_sections.get(section, {})
+            if section == 'page':
+                delta = {'added': [], 'removed': [],
+                         'modified': sorted(f for f in new_records if old_records.get(f) != new_records[f])}
+            else:
+                delta = diff_keyed(old_records, new_records)
+            if any(delta.values()):
+                changes[f"{filename.rsplit('.', 1)[0]}.{section}"] = delta
+
+    old_hashes = image_hashes(old_dir, old_images)
+    new_hashes = image_hashes(new_dir, new_images)
+    delta = diff_keyed({k: v['sha256'] for k, v in old_hashes.items()},
+                       {k: v['sha256'] for k, v in new_hashes.items()})
+    if any(delta.values()):
+        changes['images'] = delta
+
+    summary = {section: {kind: len(keys) for kind, keys in delta.items()} for section, delta in changes.items()}
+    return {
+        'version': CHANGESET_VERSION,
+        'from': str(old_dir),
+        'to': str(new_dir),
+        'changed': bool(changes),
+        'summary': summary,
+        'changes': changes,
+        # Paths of new/modified images in the newer snapshot, for image re-processing
+        'changed_image_paths': sorted(
+            new_hashes[name]['name'] for name in delta['added'] + delta['modified'] if new_hashes[name].get('name')
+        ),
+        # The same images under their published static/images names
+        'changed_published_paths': published_paths(new_dir, delta['added'] + delta['modified']),
+    }
+
+def published_paths(directory, names):
+    """static/images/<category>/<filename> for each image name the snapshot's inventory lists"""
+    inventory, _ = load_document(directory, 'images_inventory.json')
+    categories = {entry['filename']: category for category, entries in inventory.items() for entry in entries}
+    return sorted(f"static/images/{categories[Path(name).name]}/{Path(name).name}"
+                  for name in names if Path(name).name in categories)
+
+def load_changeset(path):
+    """Read a change set written by this module"""
+    with open(path, 'r', encoding='utf-8') as f:
+        changeset = json.load(f)
+    if changeset.get('version') != CHANGESET_VERSION:
+        raise ValueError(f"unsupported change set version {changeset.get('version')!r}")
+    return changeset
+
+def latest_pair(host, sites_dir=SITES_DIR):
+    """Partition dirs of a site's two most recent snapshots"""
+    site = load_site_index(Path(sites_dir) / "index.json")['sites'].get(host)
+    if not site or len(site['snapshots']) < 2:
+        raise SystemExit(f"{host} needs at least two ingested snapshots to diff")
+    old, new = sorted(site['snapshots'], key=int)[-2:]
+    return partition_dir(host, old, sites_dir), partition_dir(host, new, sites_dir)
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Diff two content snapshots")
+    parser.add_argument("old", nargs="?", type=Path, help="older snapshot content directory")
+    parser.add_argument("new", nargs="?", type=Path, help="newer snapshot content directory")
+    parser.add_argument("--latest", metavar="HOST", help="diff a site's two latest ingested snapshots")
+    parser.add_argument("--images-a", type=Path, default=None, help="image folder for the older snapshot")
+    parser.add_argument("--images-b", type=Path, default=None, help="image folder for the newer snapshot")
+    parser.add_argument("--output", type=Path, default=None, help="write the change set JSON here")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.latest:
+        old_dir, new_dir = latest_pair(args.latest)
+    elif args.old and args.new:
+        old_dir, new_dir = args.old, args.new
+    else:
+        raise SystemExit("Give two snapshot directories or --latest HOST")
+    changeset = diff_snapshots(old_dir, new_dir, args.images_a, args.images_b)
+    print(f"🔍 {old_dir} → {new_dir}")
+    if not changeset['changed']:
+        print("✅ No changes")
+    for section, counts in sorted(changeset['summary'].items()):
+        parts = ", ".join(f"{n} {kind}" for kind, n in counts.items() if n)
+        print(f"  - {section}: {parts}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(changeset, f, indent=2, ensure_ascii=False)
+        print(f"💾 Change set written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Tests for image_pipeline's responsive derivatives"""
+
+from PIL import Image
+
+from image_pipeline import build_source_derivatives
+
+
+def test_derivative_sizes_map_to_distinct_files(tmp_path):
+    root, out_dir = tmp_path / "images", tmp_path / "_derivatives"
+    root.mkdir()
+    Image.new('RGB', (1600, 800), 'navy').save(root / "cert_ai.jpg")
+    Image.new('RGBA', (1600, 800), 'teal').save(root / "cert_ai.png")
+
+    entries = [build_source_derivatives(root / name, root, out_dir) for name in ("cert_ai.jpg", "cert_ai.png")]
+
+    for entry in entries:
+        assert [v['name'] for v in entry['variants']] == ['thumb', 'card', 'full']
+        assert len({v['webp'] for v in entry['variants']}) == 3
+        assert len({v['fallback'] for v in entry['variants']}) == 3
+        for v in entry['variants']:
+            for key in ('webp', 'fallback'):
+                with Image.open(out_dir / v[key]) as image:
+                    assert image.width == v['width']
+        assert [v['width'] for v in entry['variants']] == [160, 400, 1200]
+    # Sources sharing a stem keep separate derivatives
+    jpg_files = {v[k] for v in entries[0]['variants'] for k in ('webp', 'fallback')}
+    png_files = {v[k] for v in entries[1]['variants'] for k in ('webp', 'fallback')}
+    assert not jpg_files & png_files
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Validate every image the content references and write an enriched inventory
+
+Each unique file referenced by images_inventory.json or a catalogue course is checked in
+parallel: it must exist, decode, match the format its suffix promises and not be a placeholder
+(zero bytes, tiny, or one flat colour). Filenames are matched through the Unicode-normalised
+path index (path_index.py), and entries that match no file are marked unresolved. Byte-identical
+files are marked duplicate_of and perceptually near-identical ones near_duplicate_of (see
+perceptual_hash.py). The results, with width, height, bytes and sha256, are saved to
+<content dir>/.cache/images_validated.json so the viewer renders from them instead of probing
+files. Files unchanged since the last run (by mtime and size) are not re-checked:
+    python validate_images.py                              # validate data/content
+    python validate_images.py --content-dir data/sites/<host>/<epoch ms> --workers 8
+    python validate_images.py --rebuild
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from blob_store import BLOB_INDEX_PATH
+from content_store import CATALOG_PATH, load_content_store
+from lazy_json import CACHE_DIRNAME
+from path_index import INDEX_PATH as PATH_INDEX_PATH, open_path_index
+
+BASE_DIR = Path(__file__).parent
+CONTENT_DIR = BASE_DIR / "data" / "content"
+REPORT_FILENAME = "images_validated.json"
+REPORT_VERSION = 4
+
+SUFFIX_FORMATS = {
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.png': 'PNG',
+    '.webp': 'WEBP',
+    '.gif': 'GIF',
+    '.svg': 'SVG',
+}
+# Anything smaller on either side is a spacer or tracking pixel, not content
+MIN_DIMENSION = 16
+# Flatness is judged on a thumbnail this size
+FLATNESS_SAMPLE = 64
+
+# Check outcomes, worst first; the viewer shows images whose status is displayable
+STATUSES = ('missing', 'empty', 'corrupt', 'placeholder', 'wrong_format', 'ok')
+DISPLAYABLE_STATUSES = ('ok', 'wrong_format')
+
+def report_path(content_dir=CONTENT_DIR):
+    """Where the enriched inventory for a content directory lives"""
+    return Path(content_dir) / CACHE_DIRNAME / REPORT_FILENAME
+
+def source_files(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH):
+    """The data files (inventory, catalogue, indexes) a report is built from"""
+    return [Path(catalog_path), Path(content_dir) / "images_inventory.json",
+            Path(content_dir) / "images.json", BLOB_INDEX_PATH, PATH_INDEX_PATH]
+
+# report path -> (report mtime_ns, files it checked); the viewer takes a signature every rerun
+_checked_files = {}
+
+def checked_files(content_dir=CONTENT_DIR):
+    """The image files the saved report for a content directory checked"""
+    path = report_path(content_dir)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return []
+    cached = _checked_files.get(str(path))
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, list(load_report(path).get('paths', {}).values()))
+        _checked_files[str(path)] = cached
+    return cached[1]
+
+def stat_signature(paths):
+    """{path: [mtime_ns, size]} of ``paths`` (missing files are [0, 0])"""
+    signature = {}
+    for path in map(Path, paths):
+        try:
+            stat = path.stat()
+            signature[str(path)] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            signature[str(path)] = [0, 0]
+    return signature
+
+def source_signature(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH, files=None):
+    """{path: [mtime_ns, size]} of the files a report is built from (missing files are [0, 0])
+
+    Besides the inventory, catalogue and indexes this covers every image file the report
+    checked (``files``, by default those of the saved report), so an image edited in place
+    under the same name still invalidates it.
+    """
+    files = checked_files(content_dir) if files is None else files
+    return stat_signature(source_files(content_dir, catalog_path) + list(files))
+
+# report path -> (files, monotonic time they were statted, their signature); see report_signature()
+_image_signatures = {}
+
+def report_signature(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH, max_age=0.0):
+    """Hashable source_signature() for keying a cached report, cheap enough to take every rerun
+
+    The inventory, catalogue and indexes are statted on every call, but the image files the
+    report checked only once ``max_age`` seconds have passed since they were last statted, so an
+    image edited in place is picked up within ``max_age`` seconds without probing every file.
+    """
+    signature = tuple(map(tuple, stat_signature(source_files(content_dir, catalog_path)).values()))
+    key = str(report_path(content_dir))
+    files = checked_files(content_dir)
+    cached = _image_signatures.get(key)
+    if cached is None or cached[0] is not files or time.monotonic() - cached[1] >= max_age:
+        cached = (files, time.monotonic(), tuple(map(tuple, stat_signature(files).values())))
+        _image_signatures[key] = cached
+    return signature + cached[2]
+
+def load_json_file(path, default):
+    """Decoded JSON from ``path``, or ``default`` if it is missing or invalid"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+def svg_size(data):
+    """(width, height) of an SVG from its attributes or viewBox; raises ValueError if it is not SVG"""
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError as e:
+        raise ValueError(f"not valid SVG: {e}") from e
+    if not root.tag.endswith('svg'):
+        raise ValueError(f"root element is <{root.tag}>, not <svg>")
+    try:
+        width = float(root.get('width', '').rstrip('px'))
+        height = float(root.get('height', '').rstrip('px'))
+    except ValueError:
+        view_box = (root.get('viewBox') or '').replace(',', ' ').split()
+        if len(view_box) != 4:
+            return 0, 0
+        width, height = float(view_box[2]), float(view_box[3])
+    return round(width), round(height)
+
+def check_image(path):
+    """Validate one file; returns its status and metadata"""
+    path = Path(path)
+    result = {'status': 'ok', 'format': None, 'width': 0, 'height': 0, 'bytes': 0, 'sha256': None}
+    try:
+        stat = path.stat()
+        data = path.read_bytes()
+    except OSError:
+        return dict(result, status='missing')
+    result.update(bytes=len(data), mtime_ns=stat.st_mtime_ns)
+    if not data:
+        return dict(result, status='empty')
+    result['sha256'] = hashlib.sha256(data).hexdigest()
+    expected = SUFFIX_FORMATS.get(path.suffix.lower())
+    if expected == 'SVG':
+        try:
+            result['width'], result['height'] = svg_size(data)
+        except ValueError as e:
+            return dict(result, status='corrupt', error=str(e))
+        result['format'] = 'SVG'
+        return result
+    # Imported here so the viewer can load reports without loading PIL
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            result['format'] = image.format
+            result['width'], result['height'] = image.size
+            image.draft('RGB', (FLATNESS_SAMPLE, FLATNESS_SAMPLE))
+            image.load()
+            sample = image.convert('RGBA' if image.mode in ('P', 'LA', 'RGBA') else 'RGB')
+            sample.thumbnail((FLATNESS_SAMPLE, FLATNESS_SAMPLE))
+            flat = all(low == high for low, high in sample.getextrema())
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        return dict(result, status='corrupt', error=str(e))
+    if min(result['width'], result['height']) < MIN_DIMENSION or flat:
+        result['status'] = 'placeholder'
+    elif expected and result['format'] != expected:
+        result['status'] = 'wrong_format'
+    return result
+
+def referenced_images(content_dir, catalog_path, index):
+    """(unique inventory entries with their logical path, {course image: logical path}, duplicate count)
+
+    Site partitions map filenames to their snapshot's files through images.json. Names are
+    matched against the path index, so they take the on-disk spelling; entries no file matches
+    are marked ``unresolved``.
+    """
+    inventory = load_json_file(Path(content_dir) / "images_inventory.json", {})
+    site_images = load_json_file(Path(content_dir) / "images.json", {})
+    entries = {}
+    for category, items in inventory.items():
+        for item in items:
+            site_image = site_images.get(item['filename'])
+            name = site_image['name'] if site_image else f"static/images/{category}/{item['filename']}"
+            on_disk = index.canonical(name)
+            entry = dict(item, category=category, path=on_disk or name)
+            if on_disk is None:
+                entry['unresolved'] = True
+            entries.setdefault((category, item['filename']), entry)
+    try:
+        courses = load_content_store(catalog_path).courses
+    except (OSError, ValueError):
+        courses = ()
+    catalog = {}
+    for course in courses:
+        name = f"static/images/{Path(course.image).as_posix()}"
+        catalog[course.image] = index.canonical(name) or name
+    duplicates = sum(len(items) for items in inventory.values()) - len(entries)
+    return list(entries.values()), catalog, duplicates
+
+def validate_images(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH, workers=None, previous=None):
+    """Check every referenced image; returns the report"""
+    index = open_path_index()
+    entries, catalog, duplicate_entries = referenced_images(content_dir, catalog_path, index)
+    names = sorted({entry['path'] for entry in entries} | set(catalog.values()))
+    files = {name: index.resolve(name) or BASE_DIR / name for name in names}
+    previous = previous or {}
+    results = {}
+    pending = []
+    for name, path in files.items():
+        old = previous.get(name)
+        try:
+            stat = path.stat()
+        except OSError:
+            results[name] = check_image(path)
+            continue
+        if old and old.get('mtime_ns') == stat.st_mtime_ns and old['bytes'] == stat.st_size:
+            results[name] = old
+        else:
+            pending.append(name)
+    # Decoding and hashing release the GIL, so threads keep every core busy
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        results.update(zip(pending, pool.map(check_image, [files[name] for name in pending])))
+    first_by_hash = {}
+    inventory = {}
+    for entry in entries:
+        check = results[entry['path']]
+        enriched = dict(entry, **{k: v for k, v in check.items() if k != 'mtime_ns'})
+        original = first_by_hash.setdefault(check['sha256'], entry['path']) if check['sha256'] else entry['path']
+        if original != entry['path']:
+            enriched['duplicate_of'] = original
+        inventory.setdefault(entry['category'], []).append(enriched)
+    near_duplicates = mark_near_duplicates(inventory, files)
+    summary = {status: 0 for status in STATUSES}
+    for check in results.values():
+        summary[check['status']] += 1
+    return {
+        'version': REPORT_VERSION,
+        'files': results,
+        'inventory': inventory,
+        'catalog': {image: dict(results[name], path=name) for image, name in catalog.items()},
+        # Logical name -> the file actually read (e.g. its blob), for source_signature()
+        'paths': {name: str(path) for name, path in files.items()},
+        'summary': dict(summary, checked=len(pending), duplicate_entries=duplicate_entries,
+                        near_duplicates=near_duplicates,
+                        unresolved=sum(1 for entry in entries if entry.get('unresolved'))),
+    }
+
+def mark_near_duplicates(inventory, files):
+    """Point visually near-identical entries (e.g. one logo at several sizes) at the best rendition
+
+    Only the entries' own files are hashed, and only when new or changed since the persisted
+    perceptual index last saw them. Returns how many entries were marked with ``near_duplicate_of``.
+    """
+    entries = [entry for items in inventory.values() for entry in items
+               if 'duplicate_of' not in entry and is_displayable(entry)]
+    if len(entries) < 2:
+        return 0
+    # Imported here so the viewer only loads NumPy when a report is actually rebuilt
+    from perceptual_hash import PerceptualIndex, open_perceptual_index
+
+    index = open_perceptual_index(files={e['path']: files[e['path']] for e in entries})
+    candidates = PerceptualIndex({e['path']: index.entries[e['path']] for e in entries if e['path'] in index.entries})
+    best = {name: group[0] for group in candidates.near_duplicate_groups() for name in group[1:]}
+    for entry in entries:
+        if entry['path'] in best:
+            entry['near_duplicate_of'] = best[entry['path']]
+    return sum(entry['path'] in best for entry in entries)
+
+def load_report(path):
+    """A saved report, or {} if it is missing or from another REPORT_VERSION"""
+    report = load_json_file(path, {})
+    return report if report.get('version') == REPORT_VERSION else {}
+
+def save_report(report, path):
+    """Atomically write a report"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def open_image_report(content_dir=CONTENT_DIR, catalog_path=CATALOG_PATH, rebuild=False, workers=None):
+    """Load the enriched inventory for a content directory, re-validating first if its sources changed"""
+    path = report_path(content_dir)
+    report = {} if rebuild else load_report(path)
+    signature = source_signature(content_dir, catalog_path)
+    if report.get('sources') == signature:
+        return report
+    report = validate_images(content_dir, catalog_path, workers, report.get('files'))
+    # Taken again: validating may have refreshed the path index, and the files checked may differ
+    report['sources'] = source_signature(content_dir, catalog_path, report['paths'].values())
+    try:
+        save_report(report, path)
+    except OSError:
+        # Read-only deploys still get an in-memory report
+        pass
+    return report
+
+def is_displayable(check):
+    """Whether a check result (or enriched entry) is good enough to show"""
+    return bool(check) and check['status'] in DISPLAYABLE_STATUSES
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Validate referenced images and write an enriched inventory")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR,
+                        help="content directory or site partition (default: data/content)")
+    parser.add_argument("--workers", type=int, default=None, help="parallel checks (default: one per core)")
+    parser.add_argument("--rebuild", action="store_true", help="re-check every file, ignoring the previous report")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"🔍 Validating images for {args.content_dir}")
+    print("=" * 60)
+    started = time.perf_counter()
+    path = report_path(args.content_dir)
+    previous = {} if args.rebuild else load_report(path)
+    report = validate_images(args.content_dir, workers=args.workers, previous=previous.get('files'))
+    report['sources'] = source_signature(args.content_dir, files=report['paths'].values())
+    save_report(report, path)
+    summary = report['summary']
+    for name, check in sorted(report['files'].items()):
+        if check['status'] != 'ok':
+            detail = f" ({check['error']})" if check.get('error') else ""
+            print(f"⚠️  {check['status']:<13} {name}{detail}")
+    print(f"\n✅ {summary['ok']} ok of {len(report['files'])} files "
+          f"({summary['checked']} checked in {time.perf_counter() - started:.2f}s, "
+          f"{summary['duplicate_entries']} duplicate inventory entries, "
+          f"{summary['unresolved']} matching no file on disk)")
+    print(f"💾 Enriched inventory written to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Page registry for the viewer
+
+Each page lives in its own module exposing LABEL, DATA (the data it reads) and render(data).
+Modules are imported on first navigation, so a session only pays for the pages it opens.
+"""
+
+import importlib
+
+# Sidebar order: label -> module
+PAGES = {
+    "📊 Overview": "views.overview",
+    "📝 Services": "views.services",
+    "⭐ Testimonials": "views.testimonials",
+    "❓ FAQs": "views.faqs",
+    "🖼️ Images Gallery": "views.gallery",
+    "📞 Contact & Social": "views.contact",
+    "📋 Raw Data": "views.raw_data",
+}
+
+def load_page(label):
+    """Page module for a sidebar label (imported once per process)"""
+    return importlib.import_module(PAGES[label])
@@ -0,0 +1,308 @@
+"""
+Shared paths, cached loaders and image helpers for the viewer pages
+
+Page modules in this package import from here; nothing in this module renders on import.
+"""
+
+import base64
+import mimetypes
+import os
+import re
+from pathlib import Path
+from urllib.parse import quote
+
+import streamlit as st
+
+from asset_server import ASSETS_DIR, MANIFEST_FILENAME, load_manifest
+from content_store import CATALOG_PATH, ContentValidationError, ContentStore, load_content_store
+from image_cache import CachedImage, ImageCache
+from image_pipeline import DERIVATIVES_DIR, DERIVATIVES_INDEX, load_derivative_index, select_derivative
+from ingest_sites import SITE_INDEX_PATH, load_site_index, partition_dir
+from lazy_json import open_document
+from logo_atlas import ATLAS_DIR, open_logo_atlases
+from path_index import open_path_index, refresh_path_index
+from perf import Recorder
+from search_index import open_search_index, source_signature
+from validate_images import open_image_report, report_signature
+
+# Paths
+BASE_DIR = Path(__file__).resolve().parent.parent
+SCRAPED_DIR = BASE_DIR / "data"
+CONTENT_DIR = SCRAPED_DIR / "content"
+STATIC_DIR = BASE_DIR / "static"
+IMAGES_DIR = STATIC_DIR / "images"
+CSS_PATH = BASE_DIR / "static" / "css" / "app.css"
+
+# Display widths used when picking a responsive derivative
+GALLERY_CARD_WIDTH = 400
+
+# Shared cache of encoded image bytes (per server process)
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get("IMAGE_CACHE_MAX_MB", "64")) * 1024 * 1024
+
+# Base URL of asset_server.py; when set, images are referenced by URL instead of being sent
+# through Streamlit's media manager
+ASSET_BASE_URL = os.environ.get("VIEWER_ASSET_URL", "").rstrip("/")
+
+# How logo grids are drawn: 'sprites' (one atlas per logo set, see logo_atlas.py) or 'images'
+# (one st.image per logo)
+LOGO_RENDERING = os.environ.get("VIEWER_LOGO_RENDERING", "sprites")
+
+# How often the path index re-checks directory mtimes for added, removed or renamed images
+PATH_INDEX_REFRESH_SECONDS = 5.0
+
+# How often the image report re-stats the files it checked, to catch images edited in place
+IMAGE_REPORT_REFRESH_SECONDS = 30.0
+
+# Reruns listed in the hidden performance panel
+PERF_PANEL_RERUNS = 10
+
+# Sidebar label for the content in data/content (as opposed to an ingested site partition)
+PRIMARY_SITE_LABEL = "Primary site (data/content)"
+
+@st.cache_resource
+def shared_json_documents():
+    """{path: (mtime_ns, lazy document)} shared by every session
+
+    Holds only the newest version of each file: a rewrite replaces the entry, so the old
+    document's memory map is released once no session still uses it.
+    """
+    return {}
+
+def open_json(filepath, mtime_ns):
+    """The lazy document for one version of a file, replacing any older version's"""
+    documents = shared_json_documents()
+    cached = documents.get(filepath)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, open_document(filepath))
+        documents[filepath] = cached
+    return cached[1]
+
+def load_json(filename, content_dir=str(CONTENT_DIR)):
+    """Open a JSON file lazily; top-level values are decoded only when a page touches them"""
+    filepath = Path(content_dir) / filename
+    try:
+        with perf_recorder().timer("load_json"):
+            return open_json(str(filepath), filepath.stat().st_mtime_ns)
+    except Exception as e:
+        st.error(f"Error loading {filename}: {e}")
+        return None
+
+@st.cache_data
+def load_derivative_index_cached(index_mtime_ns):
+    """Load the responsive derivative index; keyed by mtime so a rebuild is picked up"""
+    return load_derivative_index(DERIVATIVES_DIR)
+
+@st.cache_resource
+def shared_path_index():
+    """One path index per server process, loaded (or rebuilt) at startup"""
+    return open_path_index()
+
+def resolve_image(image_path):
+    """Resolve an image's logical path through the path index, falling back to the file itself"""
+    try:
+        name = Path(image_path).relative_to(BASE_DIR).as_posix()
+    except ValueError:
+        return Path(image_path)
+    index = refresh_path_index(shared_path_index(), PATH_INDEX_REFRESH_SECONDS)
+    return index.resolve(name) or Path(image_path)
+
+def sized_image(image_path, display_width):
+    """Path to the smallest derivative covering ``display_width``, or the original image"""
+    try:
+        index_mtime_ns = (DERIVATIVES_DIR / DERIVATIVES_INDEX).stat().st_mtime_ns
+        rel_path = Path(image_path).relative_to(IMAGES_DIR).as_posix()
+    except (OSError, ValueError):
+        return str(resolve_image(image_path))
+    index = load_derivative_index_cached(index_mtime_ns)
+    derivative = select_derivative(index, rel_path, display_width)
+    return str(DERIVATIVES_DIR / derivative) if derivative else str(resolve_image(image_path))
+
+@st.cache_data
+def load_asset_manifest_cached(manifest_mtime_ns):
+    """Load asset_server.py's manifest; keyed by mtime so a rebuild is picked up"""
+    return load_manifest(ASSETS_DIR)
+
+def asset_url(path):
+    """URL of a file's fingerprinted copy on the asset server, or None outside static-asset mode"""
+    if not ASSET_BASE_URL:
+        return None
+    try:
+        manifest_mtime_ns = (ASSETS_DIR / MANIFEST_FILENAME).stat().st_mtime_ns
+        key = Path(path).relative_to(BASE_DIR).as_posix()
+    except (OSError, ValueError):
+        return None
+    entry = load_asset_manifest_cached(manifest_mtime_ns).get(key)
+    return f"{ASSET_BASE_URL}/{quote(entry['name'])}" if entry else None
+
+@st.cache_resource
+def perf_recorder():
+    """One recorder per server process, exporting wherever $VIEWER_PERF_LOG/$VIEWER_PERF_PROM point"""
+    return Recorder.from_env()
+
+@st.cache_resource
+def shared_image_cache():
+    """One image cache per server process, shared by every visitor session"""
+    return ImageCache(IMAGE_CACHE_MAX_BYTES)
+
+def cached_image(image_path, display_width):
+    """Ready-to-serve bytes for the best derivative at ``display_width``, or None if missing"""
+    with perf_recorder().timer("image.load"):
+        path = sized_image(image_path, display_width)
+        url = asset_url(path)
+        if url:
+            # The browser fetches (and keeps) the file itself; nothing is decoded or uploaded here
+            return CachedImage(url, None, mimetypes.guess_type(path)[0] or '', 0, 0, 0)
+        return shared_image_cache().get(path, display_width)
+
+def show_image(cached, **kwargs):
+    """st.image for a cached image; vector files and asset URLs are handed over by path"""
+    with perf_recorder().timer("image.emit"):
+        st.image(cached.data if cached.data is not None else cached.path, **kwargs)
+
+@st.cache_resource
+def load_content(catalog_mtime_ns):
+    """Load catalog.json once per process (and again only when it changes)"""
+    try:
+        return load_content_store(CATALOG_PATH)
+    except (OSError, ValueError) as e:
+        problems = e.problems if isinstance(e, ContentValidationError) else [str(e)]
+        st.error(f"Error loading {CATALOG_PATH.name}: " + "; ".join(problems))
+        return ContentStore()
+
+def catalog_mtime():
+    try:
+        return CATALOG_PATH.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+@st.cache_data
+def load_site_index_cached(index_mtime_ns):
+    """Load the cross-site index written by ingest_sites.py"""
+    return load_site_index(SITE_INDEX_PATH)
+
+def select_content_dir():
+    """Sidebar site/snapshot pickers; returns the content directory to show"""
+    try:
+        sites = load_site_index_cached(SITE_INDEX_PATH.stat().st_mtime_ns)['sites']
+    except OSError:
+        return CONTENT_DIR
+    if not sites:
+        return CONTENT_DIR
+    site = st.sidebar.selectbox("🌐 Site", [PRIMARY_SITE_LABEL] + list(sites))
+    if site == PRIMARY_SITE_LABEL:
+        return CONTENT_DIR
+    snapshots = sites[site]['snapshots']
+    timestamp = st.sidebar.selectbox(
+        "🕒 Snapshot",
+        sorted(snapshots, key=int, reverse=True),
+        format_func=lambda ts: snapshots[ts]['label'],
+    )
+    return partition_dir(site, timestamp)
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{}:;,>])\s*', r'\1', css).replace(';}', '}').strip()
+
+@st.cache_resource
+def page_css(css_mtime_ns):
+    """app.css minified into a <style> tag, read once per process (and again only when it changes)"""
+    return f"<style>{minify_css(CSS_PATH.read_text(encoding='utf-8'))}</style>"
+
+def inject_css():
+    """Emit the shared stylesheet
+
+    Streamlit drops any element a rerun does not re-emit, so the tag is sent every rerun; only
+    the file read and minification happen once.
+    """
+    st.markdown(page_css(CSS_PATH.stat().st_mtime_ns), unsafe_allow_html=True)
+
+@st.cache_resource
+def load_search_index(content_dir, signature):
+    """Search index for the catalogue plus a site's headings and alt text, updated when sources change"""
+    return open_search_index(content_dir)[0]
+
+def image_report_signature(content_dir):
+    """Hashable (mtime_ns, size) pairs of the files an image report is built from
+
+    Image files are only re-statted every IMAGE_REPORT_REFRESH_SECONDS; the data files every rerun.
+    """
+    return report_signature(content_dir, max_age=IMAGE_REPORT_REFRESH_SECONDS)
+
+@st.cache_resource
+def load_image_report(content_dir, signature):
+    """Validated, enriched image inventory for a content directory, re-validated when sources change"""
+    return open_image_report(content_dir)
+
+@st.cache_resource
+def load_logo_atlases(content_dir, signature):
+    """Logo atlas maps for a content directory; sets are repacked only if their logos changed"""
+    return open_logo_atlases(content_dir, load_image_report(content_dir, signature))
+
+@st.cache_resource
+def atlas_data_uri(path):
+    return f"data:image/webp;base64,{base64.b64encode(Path(path).read_bytes()).decode('ascii')}"
+
+def logo_atlas_url(atlas):
+    """Where the browser fetches an atlas: the asset server, Streamlit's static route, or inline"""
+    path = ATLAS_DIR / atlas['image']
+    url = asset_url(path)
+    if url:
+        return url
+    if st.get_option("server.enableStaticServing"):
+        return f"app/static/{path.relative_to(STATIC_DIR).as_posix()}"
+    return atlas_data_uri(str(path))
+
+# Data a page can declare in its DATA tuple, and how to load it for the selected site/snapshot
+DATA_LOADERS = {
+    'content': lambda content_dir: load_content(catalog_mtime()),
+    'homepage_content': lambda content_dir: load_json('homepage_content.json', str(content_dir)),
+    'links': lambda content_dir: load_json('links.json', str(content_dir)),
+    'images_inventory': lambda content_dir: load_json('images_inventory.json', str(content_dir)),
+    'search_index': lambda content_dir: load_search_index(
+        str(content_dir), tuple(map(tuple, source_signature(content_dir).values()))),
+    'image_report': lambda content_dir: load_image_report(str(content_dir), image_report_signature(content_dir)),
+    'logo_atlases': lambda content_dir: (load_logo_atlases(str(content_dir), image_report_signature(content_dir))
+                                         if LOGO_RENDERING == 'sprites' else {}),
+}
+
+def load_page_data(names, content_dir):
+    """Load only the data a page declared, plus the content directory it came from"""
+    recorder = perf_recorder()
+    data = {'content_dir': content_dir}
+    for name in names:
+        with recorder.timer(f"data.{name}"):
+            data[name] = DATA_LOADERS[name](content_dir)
+    return data
+
+def perf_panel_enabled():
+    """The performance panel is hidden unless the URL has ?perf=1 or $VIEWER_PERF_PANEL is set"""
+    return st.query_params.get("perf") == "1" or bool(os.environ.get("VIEWER_PERF_PANEL"))
+
+def render_perf_panel(recorder, limit=PERF_PANEL_RERUNS):
+    """Sidebar breakdown of the last reruns plus image cache hit rates"""
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        rows = []
+        for trace in recorder.recent(limit):
+            spans = {name: ms for name, (ms, calls) in trace['spans'].items()}
+            images = spans.get('image.load', 0.0) + spans.get('image.emit', 0.0)
+            render = spans.get('page.render', 0.0)
+            rows.append({
+                'page': trace['page'],
+                'total ms': round(trace['total_ms'], 1),
+                'data ms': round(sum(ms for name, ms in spans.items() if name.startswith('data.')), 1),
+                'json ms': round(spans.get('load_json', 0.0), 1),
+                'images ms': round(images, 1),
+                # Whatever rendering time is not image work: markdown, widgets, layout
+                'markup ms': round(max(render - images, 0.0), 1),
+                'images': trace['spans'].get('image.emit', (0, 0))[1],
+            })
+        if rows:
+            st.dataframe(rows, hide_index=True)
+        else:
+            st.caption("No reruns recorded yet")
+        stats = shared_image_cache().stats()
+        st.caption(f"🖼️ Image cache: {stats['hit_rate']:.0%} hits ({stats['hits']}/{stats['hits'] + stats['misses']}), "
+                   f"{stats['entries']} entries, {stats['bytes'] / 1024 / 1024:.1f}/{stats['max_bytes'] / 1024 / 1024:.0f} MB, "
+                   f"{stats['evictions']} evictions")
@@ -0,0 +1,54 @@
+"""
+Contact & Social page
+"""
+
+import streamlit as st
+
+from views.fragments import main_header_html
+
+LABEL = "📞 Contact & Social"
+# Data this page reads; the app loads only these for it
+DATA = ('links',)
+
+def render(data):
+    """Render the Contact & Social page"""
+    links = data['links']
+    st.markdown(main_header_html("Contact & Social Media"), unsafe_allow_html=True)
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📞 Contact Information")
+        st.write("**Phone:**")
+        st.info("9200-19-590")
+        
+        st.write("**Registration Number:**")
+        st.info("1010929460")
+        
+        st.write("**Messaging:**")
+        st.write("- WhatsApp")
+        st.write("- Instagram DM")
+        st.write("- Telegram")
+    
+    with col2:
+        st.subheader("🌐 Social Media Links")
+        
+        if links and links.get('social_media'):
+            # Deduplicate social media links
+            social_dict = {}
+            for social in links['social_media']:
+                social_dict[social['platform']] = social['url']
+            
+            for platform, url in social_dict.items():
+                if platform == 'linkedin':
+                    st.markdown(f"**LinkedIn**: [View Profile]({url})")
+                elif platform == 'twitter':
+                    st.markdown(f"**Twitter/X**: [View Profile]({url})")
+                elif platform == 'instagram':
+                    st.markdown(f"**Instagram**: [View Profile]({url})")
+                elif platform == 'youtube':
+                    st.markdown(f"**YouTube**: [View Channel]({url})")
+    
+    st.markdown("---")
+    st.success("✅ All contact and social media information extracted successfully!")
@@ -0,0 +1,25 @@
+"""
+FAQs page
+"""
+
+import streamlit as st
+
+from views.fragments import main_header_html
+
+LABEL = "❓ FAQs"
+# Data this page reads; the app loads only these for it
+DATA = ('content',)
+
+def render(data):
+    """Render the FAQs page"""
+    content = data['content']
+    st.markdown(main_header_html("Frequently Asked Questions"), unsafe_allow_html=True)
+    st.markdown("---")
+    
+    faqs = content.faqs
+    
+    for idx, faq in enumerate(faqs, 1):
+        with st.expander(f"**{idx}. {faq.question}**"):
+            st.write(faq.answer)
+    
+    st.info("💡 **For Odoo Integration**: FAQs can be added to website pages or help content")
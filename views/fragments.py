@@ -0,0 +1,150 @@
+"""
+HTML fragments shared by the Streamlit pages and the static-site export
+
+Content values are interpolated as-is, exactly as the pages always have.
+"""
+
+import html
+
+HERO_HTML = """
+    <div class="hero-section">
+        <div class="hero-title">🎓 Transform Your Career with World-Class Training Programs</div>
+        <div class="hero-subtitle">Join thousands of professionals who accelerated their growth with our expert-led courses and internationally recognized certifications.</div>
+        <a href="#" class="btn-primary">Find Your Perfect Course</a>
+        <a href="#" class="btn-secondary">View Training Schedule</a>
+    </div>
+    """
+
+NAV_BAR_HTML = """
+    <div class="nav-bar">
+        <div class="nav-links">
+            <a href="#" class="nav-link">For Organizations</a>
+            <a href="#" class="nav-link">Training Courses</a>
+            <a href="#" class="nav-link">Diplomas</a>
+            <a href="#" class="nav-link">About Us</a>
+            <a href="#" class="nav-link">Blog</a>
+            <a href="#" class="nav-link">Contact</a>
+        </div>
+    </div>
+    """
+
+STATS_HTML = """
+    <div class="stats-section">
+        <div class="stats-title">📊 I-Solutions in Numbers</div>
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-number">12+</div>
+                <div class="stat-label">Years of Experience</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">9,500+</div>
+                <div class="stat-label">People Trained</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">350</div>
+                <div class="stat-label">Clients Served</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">94%</div>
+                <div class="stat-label">Client Satisfaction</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">650+</div>
+                <div class="stat-label">Coaching Hours</div>
+            </div>
+        </div>
+    </div>
+    """
+
+FOOTER_CTA_HTML = """
+    <div class="footer-section">
+        <div class="footer-title">Ready to Transform Your Career?</div>
+        <p style="text-align: center; font-size: 1.1rem; margin: 2rem 0;">
+            Join thousands of professionals who have accelerated their growth with our programs.
+        </p>
+        <div style="text-align: center;">
+            <a href="#" class="btn-primary">Get Started Today</a>
+            <a href="#" class="btn-secondary">Contact Our Experts</a>
+        </div>
+    </div>
+    """
+
+ABOUT_TEXT = (
+    "I-Solutions is a leading training and development company, offering specialized learning experiences "
+    "designed to empower individuals and organizations. We provide world-class training programs that help "
+    "professionals transform their careers and achieve sustainable success."
+)
+
+MISSION_TEXT = (
+    "We aim to unleash the potential of individuals and organizations to achieve outstanding performance "
+    "and attain remarkable outcomes through expert-led training and internationally recognized certifications."
+)
+
+SITE_FOOTER_HTML = """
+<div style="text-align: center; color: #5f6368; padding: 1rem;">
+    <p><strong>I-Solutions Content Viewer</strong></p>
+    <p>Content scraped from https://academy.tharwah.net/</p>
+    <p>For Odoo 18 E-Learning Module Integration</p>
+    <p style="font-size: 0.8rem;">© 2025 I-Solutions. All rights reserved.</p>
+</div>
+"""
+
+def main_header_html(title):
+    return f'<div class="main-header">{title}</div>'
+
+def course_card_html(course):
+    return f"""
+                    <div class="course-card">
+                        <div class="course-header">
+                            <div class="course-title">{course.title}</div>
+                            <div class="course-price">{course.price}</div>
+                        </div>
+                        <div class="course-body">
+                            <div class="course-description">{course.description}</div>
+                            <button class="enroll-btn">ENROLL NOW</button>
+                        </div>
+                    </div>
+                    """
+
+def service_card_html(service):
+    return f"""
+        <div class="service-card">
+            <h2>{service.icon} Service {service.number} - {service.name}</h2>
+            <p style="font-size: 1.1rem; line-height: 1.6;">{service.description}</p>
+        </div>
+        """
+
+def testimonial_card_html(testimonial):
+    return f"""
+        <div class="testimonial-card">
+            <h3>💼 {testimonial.client}</h3>
+            <p><strong>Project:</strong> {testimonial.project}</p>
+            <hr>
+            <p style="font-size: 1.1rem; line-height: 1.8; font-style: italic;">
+            "{testimonial.quote}"
+            </p>
+            <hr>
+            <p><strong>{testimonial.author}</strong><br>
+            <em>{testimonial.position}</em></p>
+        </div>
+        """
+
+def sprite_style_html(set_name, url):
+    """Point a logo set's sprite class at its atlas; emitted once, however many tiles use it"""
+    return f'<style>.logo-atlas-{set_name}{{background-image:url("{url}")}}</style>'
+
+def sprite_tile_html(set_name, atlas, name, label=""):
+    """One logo cut out of its atlas (see logo_atlas.py), at CSS-pixel size"""
+    x, y, width, height = atlas['tiles'][name]
+    scale = atlas['scale']
+    return (f'<div class="logo-sprite logo-atlas-{set_name}" role="img" aria-label="{html.escape(label)}" '
+            f'style="width:{width / scale:g}px;height:{height / scale:g}px;'
+            f'background-size:{atlas["width"] / scale:g}px {atlas["height"] / scale:g}px;'
+            f'background-position:{-x / scale + 0:g}px {-y / scale + 0:g}px"></div>')
+
+def sprite_grid_html(set_name, atlas, url, names, columns):
+    """A whole logo grid drawn from one atlas"""
+    tiles = "".join(sprite_tile_html(set_name, atlas, name, name.rsplit('/', 1)[-1].rsplit('.', 1)[0])
+                    for name in names)
+    return (sprite_style_html(set_name, url)
+            + f'<div class="logo-sprites" style="grid-template-columns:repeat({columns}, 1fr)">{tiles}</div>')
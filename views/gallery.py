@@ -0,0 +1,164 @@
+"""
+Images Gallery page: paginated, searchable thumbnails plus inventory statistics
+"""
+
+import math
+from pathlib import Path
+
+import streamlit as st
+
+from validate_images import STATUSES, is_displayable
+from views.common import (
+    BASE_DIR,
+    GALLERY_CARD_WIDTH,
+    SCRAPED_DIR,
+    cached_image,
+    image_report_signature,
+    load_image_report,
+    logo_atlas_url,
+    show_image,
+)
+from views.fragments import main_header_html, sprite_style_html, sprite_tile_html
+
+# Images Gallery pagination
+GALLERY_PAGE_SIZES = [12, 24, 48, 96]
+GALLERY_COLUMNS = 4
+
+# Warning shown for each image validate_images.py could not vouch for
+STATUS_LABELS = {
+    'missing': "Missing",
+    'empty': "Empty file",
+    'corrupt': "Could not decode",
+    'placeholder': "Placeholder image",
+}
+
+LABEL = "🖼️ Images Gallery"
+# Data this page reads; the app loads only these for it
+DATA = ('images_inventory', 'image_report', 'logo_atlases')
+
+def collect_gallery_items(report):
+    """Flatten the enriched inventory into unique gallery entries
+
+    validate_images.py has already dropped repeated category/filename entries and marked files
+    whose content (or appearance) duplicates another one, so each image is rendered once.
+    """
+    items = []
+    seen = set()
+    for category, entries in report.get('inventory', {}).items():
+        for entry in entries:
+            if 'duplicate_of' in entry or 'near_duplicate_of' in entry or entry['path'] in seen:
+                continue
+            seen.add(entry['path'])
+            alt = entry.get('alt', '')
+            items.append({
+                'category': category,
+                'filename': entry['filename'],
+                'path': entry['path'],
+                'alt': alt,
+                'status': entry['status'],
+                'search_text': f"{alt} {entry['filename']}".lower(),
+            })
+    return items
+
+@st.cache_data
+def gallery_items(content_dir, signature):
+    """Gallery entries for a content directory; keyed by the report's sources so re-scrapes are picked up"""
+    return collect_gallery_items(load_image_report(content_dir, signature))
+
+def filter_gallery_items(items, query, categories):
+    """Gallery entries in ``categories`` whose alt text or filename contains ``query``"""
+    query = (query or "").strip().lower()
+    categories = set(categories)
+    return [item for item in items
+            if item['category'] in categories and (not query or query in item['search_text'])]
+
+def render(data):
+    """Render the Images Gallery page"""
+    images_inventory = data['images_inventory']
+    content_dir = data['content_dir']
+    st.markdown(main_header_html("Images Gallery"), unsafe_allow_html=True)
+    st.markdown("---")
+    
+    if images_inventory:
+        tab1, tab2 = st.tabs(["🖼️ Browse Images", "📊 Statistics"])
+        
+        with tab1:
+            items = gallery_items(str(content_dir), image_report_signature(content_dir))
+            categories = sorted({item['category'] for item in items})
+            # Filters are kept per site/snapshot so switching partitions never carries stale choices
+            scope = Path(content_dir).relative_to(SCRAPED_DIR).as_posix()
+            
+            col1, col2, col3 = st.columns([3, 2, 1])
+            with col1:
+                query = st.text_input("🔎 Search alt text or filename", key=f"gallery_query:{scope}")
+            with col2:
+                selected = st.multiselect("Categories", categories, default=categories, key=f"gallery_categories:{scope}")
+            with col3:
+                page_size = st.selectbox("Per page", GALLERY_PAGE_SIZES, key=f"gallery_page_size:{scope}")
+            
+            matches = filter_gallery_items(items, query, selected)
+            page_count = max(1, math.ceil(len(matches) / page_size))
+            page_number = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                                          key=f"gallery_page:{scope}")
+            start = (page_number - 1) * page_size
+            visible = matches[start:start + page_size]
+            
+            total_entries = sum(len(v) for v in images_inventory.values())
+            st.caption(f"Showing {start + 1 if visible else 0}-{start + len(visible)} of {len(matches)} matching images "
+                       f"· page {page_number}/{page_count} · {total_entries - len(items)} duplicate entries hidden")
+            
+            # Logos packed into an atlas are drawn from it: one image request per logo set on the page
+            atlases = data['logo_atlases']
+            sprite_sets = {name: set_name for set_name, atlas in atlases.items() for name in atlas['tiles']}
+            visible_sets = sorted({sprite_sets[item['path']] for item in visible if item['path'] in sprite_sets})
+            if visible_sets:
+                st.markdown("".join(sprite_style_html(set_name, logo_atlas_url(atlases[set_name]))
+                                    for set_name in visible_sets), unsafe_allow_html=True)
+            
+            # Only the visible page touches the filesystem or the media manager
+            cols = st.columns(GALLERY_COLUMNS)
+            for idx, item in enumerate(visible):
+                with cols[idx % GALLERY_COLUMNS]:
+                    if not is_displayable(item):
+                        st.warning(f"{STATUS_LABELS[item['status']]}: {item['filename']}")
+                        continue
+                    if item['path'] in sprite_sets:
+                        set_name = sprite_sets[item['path']]
+                        st.markdown(sprite_tile_html(set_name, atlases[set_name], item['path'], item['alt']),
+                                    unsafe_allow_html=True)
+                        st.caption(item['filename'])
+                        if item['alt']:
+                            st.caption(f"Alt: {item['alt']}")
+                        continue
+                    image = cached_image(BASE_DIR / item['path'], GALLERY_CARD_WIDTH)
+                    if image:
+                        show_image(image, caption=item['filename'], use_container_width=True)
+                        if item['alt']:
+                            st.caption(f"Alt: {item['alt']}")
+                    else:
+                        st.warning(f"Missing: {item['filename']}")
+        
+        with tab2:
+            st.subheader("📊 Image Statistics")
+            
+            total_images = sum(len(images_inventory.get(cat, [])) for cat in ['logos', 'services', 'clients', 'accreditation', 'banners', 'misc'])
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("Total Images", total_images)
+            with col2:
+                st.metric("Logos", len(images_inventory.get('logos', [])))
+            with col3:
+                st.metric("Miscellaneous", len(images_inventory.get('misc', [])))
+            
+            # Show breakdown
+            st.write("**Category Breakdown:**")
+            for category, imgs in images_inventory.items():
+                if imgs:
+                    st.write(f"- **{category.capitalize()}**: {len(imgs)} images")
+            
+            summary = data['image_report'].get('summary', {})
+            st.write("**Validation:**")
+            st.write(" · ".join(f"{status.replace('_', ' ')}: {summary[status]}"
+                                for status in reversed(STATUSES) if summary.get(status)))
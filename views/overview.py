@@ -0,0 +1,147 @@
+"""
+Overview page: a homepage-style landing view with course cards and partner logos
+"""
+
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from logo_atlas import logo_set_members
+from validate_images import is_displayable
+from views.common import BASE_DIR, IMAGES_DIR, SCRAPED_DIR, cached_image, logo_atlas_url, show_image
+from views.fragments import (
+    ABOUT_TEXT,
+    FOOTER_CTA_HTML,
+    HERO_HTML,
+    MISSION_TEXT,
+    NAV_BAR_HTML,
+    STATS_HTML,
+    course_card_html,
+    sprite_grid_html,
+)
+
+LABEL = "📊 Overview"
+# Data this page reads; the app loads only these for it
+DATA = ('content', 'search_index', 'image_report', 'logo_atlases')
+
+PARTNER_LOGOS = 8
+PARTNER_LOGO_COLUMNS = 4
+SEARCH_RESULTS = 10
+SEARCH_KIND_LABELS = {
+    'course': "📚 Course",
+    'service': "📝 Service",
+    'testimonial': "⭐ Testimonial",
+    'faq': "❓ FAQ",
+    'heading': "📄 Page heading",
+    'image': "🖼️ Image",
+}
+
+def render_search(index, scope):
+    """Search box over the content index, with ranked results"""
+    query = st.text_input("Search", placeholder="Search for courses, certifications, or programs...",
+                          label_visibility="collapsed", key=f"overview_search:{scope}")
+    if not query.strip():
+        return
+    started = time.perf_counter()
+    results = index.search(query, SEARCH_RESULTS)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if not results:
+        st.info(f"No matches for “{query}”")
+        return
+    st.caption(f"{len(results)} results in {elapsed_ms:.1f}ms")
+    for score, doc_id, doc in results:
+        st.markdown(f"**{SEARCH_KIND_LABELS[doc['kind']]}** · {doc['title']}")
+        if doc['snippet']:
+            st.caption(doc['snippet'])
+
+def partner_logos(report, limit=PARTNER_LOGOS):
+    """Logical paths of the first valid partner logos in the enriched inventory"""
+    return logo_set_members(report, 'partners')[:limit]
+
+def render(data):
+    """Render the Overview page"""
+    content = data['content']
+    report = data['image_report']
+    # Hero Section - Like the actual website
+    st.markdown(HERO_HTML, unsafe_allow_html=True)
+    
+    # Logo Section
+    logo_path = IMAGES_DIR / "logos" / "shrm-logo.svg"
+    logo = cached_image(logo_path, 200)
+    if logo:
+        show_image(logo, width=200)
+    
+    # Navigation Bar
+    st.markdown(NAV_BAR_HTML, unsafe_allow_html=True)
+    
+    # Featured Programs Section
+    st.markdown("### 🏆 Featured Programs & Certifications")
+    st.markdown("---")
+    
+    # Course Cards Grid with actual images
+    courses = content.courses
+    
+    st.markdown('<div class="course-grid">', unsafe_allow_html=True)
+    
+    for i in range(0, len(courses), 3):
+        cols = st.columns(3)
+        for j, col in enumerate(cols):
+            if i + j < len(courses):
+                course = courses[i + j]
+                with col:
+                    # Display course image (validate_images.py has already ruled out empty or broken files)
+                    check = report.get('catalog', {}).get(course.image)
+                    image = cached_image(BASE_DIR / check['path'], 300) if is_displayable(check) else None
+                    if image:
+                        show_image(image, width=300, caption=course.title)
+                    else:
+                        st.info(f"📚 {course.title}")
+                    
+                    st.markdown(course_card_html(course), unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # I-Solutions in Numbers
+    st.markdown(STATS_HTML, unsafe_allow_html=True)
+    
+    # Partner Logos Section
+    st.markdown("### 🤝 Our Partners & Certifications")
+    st.markdown("---")
+    
+    # Display partner logos
+    logo_files = partner_logos(report)
+    atlas = data['logo_atlases'].get('partners')
+    if atlas and all(name in atlas['tiles'] for name in logo_files):
+        # The whole grid comes from one atlas image (logo_atlas.py)
+        st.markdown(sprite_grid_html('partners', atlas, logo_atlas_url(atlas), logo_files, PARTNER_LOGO_COLUMNS),
+                    unsafe_allow_html=True)
+    elif logo_files:
+        cols = st.columns(PARTNER_LOGO_COLUMNS)
+        for i, logo_file in enumerate(logo_files):
+            with cols[i % PARTNER_LOGO_COLUMNS]:
+                logo = cached_image(BASE_DIR / logo_file, 120)
+                if logo:
+                    show_image(logo, width=120, caption="")
+    
+    # Search Section
+    st.markdown("""
+    <div class="search-section">
+        <div class="search-title">🔍 Start Your Learning Journey Today</div>
+    </div>
+    """, unsafe_allow_html=True)
+    render_search(data['search_index'], Path(data['content_dir']).relative_to(SCRAPED_DIR).as_posix())
+    
+    # About Section
+    st.markdown("### About I-Solutions")
+    st.markdown(ABOUT_TEXT)
+    
+    # Mission
+    st.markdown("### 🎯 Our Mission")
+    st.markdown(f"> {MISSION_TEXT}")
+    
+    # Footer-like section
+    st.markdown(FOOTER_CTA_HTML, unsafe_allow_html=True)
+    
+    # Info box
+    st.info("💡 **For Odoo Integration**: This homepage layout will be recreated in Odoo using website templates, course catalogs, and e-commerce integration for I-Solutions")
@@ -0,0 +1,115 @@
+"""
+Raw Data page: a windowed explorer over the scraped JSON documents
+"""
+
+import math
+from pathlib import Path
+
+import streamlit as st
+
+from json_explorer import JsonPathError, fits_inline, format_path, is_container, preview, query, resolve, window
+from lazy_json import LazyDocument
+from views.common import SCRAPED_DIR
+from views.fragments import main_header_html
+
+# Raw Data explorer: children per page, and how many query matches are evaluated
+RAW_DATA_PAGE_SIZE = 25
+RAW_QUERY_LIMIT = 500
+
+LABEL = "📋 Raw Data"
+# Data this page reads; the app loads only these for it
+DATA = ('homepage_content', 'links', 'images_inventory')
+
+def open_json_node(state_key, path, query_key=None):
+    """Button callback: browse ``path`` (and leave query mode)"""
+    st.session_state[state_key] = list(path)
+    if query_key:
+        st.session_state[query_key] = ""
+
+def render_json_explorer(name, document, scope):
+    """Browse a JSON document one node at a time, or by JSONPath query, sending only what is shown"""
+    state_key = f"raw_path:{name}:{scope}"
+    query_key = f"raw_query:{name}:{scope}"
+    path = tuple(st.session_state.get(state_key, ()))
+    try:
+        node = resolve(document, path)
+    except (KeyError, IndexError, TypeError):
+        path, node = (), document
+
+    expression = st.text_input("JSONPath query", key=query_key,
+                               placeholder="$..url   ·   $.logos[*].filename   ·   $.headings[?(@.level == 'h2')]")
+    if expression.strip():
+        try:
+            matches = query(document, expression, RAW_QUERY_LIMIT + 1)
+        except JsonPathError as e:
+            st.error(f"Invalid query: {e}")
+            return
+        truncated = len(matches) > RAW_QUERY_LIMIT
+        matches = matches[:RAW_QUERY_LIMIT]
+        page_count = max(1, math.ceil(len(matches) / RAW_DATA_PAGE_SIZE))
+        page_number = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                                      key=f"raw_query_page:{name}:{scope}:{expression}")
+        start = (page_number - 1) * RAW_DATA_PAGE_SIZE
+        st.caption(f"{len(matches)}{'+' if truncated else ''} matches · page {page_number}/{page_count}")
+        for match_path, value in matches[start:start + RAW_DATA_PAGE_SIZE]:
+            col1, col2 = st.columns([5, 1])
+            col1.markdown(f"`{format_path(match_path)}` {preview(value)}")
+            col2.button("Open", key=f"raw_open:{name}:{scope}:{format_path(match_path)}",
+                        on_click=open_json_node, args=(state_key, match_path, query_key))
+        return
+
+    col1, col2 = st.columns([5, 1])
+    col1.code(format_path(path), language=None)
+    if path:
+        col2.button("⬆️ Up", key=f"raw_up:{name}:{scope}", on_click=open_json_node, args=(state_key, path[:-1]))
+    if not is_container(node) or fits_inline(node):
+        st.json(node.materialize() if isinstance(node, LazyDocument) else node)
+        return
+
+    total = len(node)
+    page_count = max(1, math.ceil(total / RAW_DATA_PAGE_SIZE))
+    page_number = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                                  key=f"raw_page:{name}:{scope}:{format_path(path)}")
+    start = (page_number - 1) * RAW_DATA_PAGE_SIZE
+    st.caption(f"{total} {'items' if isinstance(node, list) else 'keys'} · "
+               f"showing {start + 1}-{min(start + RAW_DATA_PAGE_SIZE, total)} · page {page_number}/{page_count}")
+    for key, child in window(node, start, RAW_DATA_PAGE_SIZE):
+        col1, col2 = st.columns([5, 1])
+        col1.markdown(f"**{key}**: {preview(child)}")
+        if is_container(child) or not fits_inline(child, 80):
+            col2.button("Open", key=f"raw_open:{name}:{scope}:{format_path(path + (key,))}",
+                        on_click=open_json_node, args=(state_key, path + (key,)))
+
+def render(data):
+    """Render the Raw Data page"""
+    homepage_content = data['homepage_content']
+    links = data['links']
+    images_inventory = data['images_inventory']
+    content_dir = data['content_dir']
+    st.markdown(main_header_html("Raw Scraped Data"), unsafe_allow_html=True)
+    st.markdown("---")
+    
+    tab1, tab2, tab3 = st.tabs(["📄 Homepage Content", "🔗 Links", "🖼️ Images Inventory"])
+    # Navigation is kept per site/snapshot, like the gallery filters
+    scope = Path(content_dir).relative_to(SCRAPED_DIR).as_posix()
+    
+    with tab1:
+        st.subheader("Homepage Content JSON")
+        if homepage_content:
+            render_json_explorer('homepage_content', homepage_content, scope)
+        else:
+            st.error("Failed to load homepage_content.json")
+    
+    with tab2:
+        st.subheader("Links JSON")
+        if links:
+            render_json_explorer('links', links, scope)
+        else:
+            st.error("Failed to load links.json")
+    
+    with tab3:
+        st.subheader("Images Inventory JSON")
+        if images_inventory:
+            render_json_explorer('images_inventory', images_inventory, scope)
+        else:
+            st.error("Failed to load images_inventory.json")
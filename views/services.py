@@ -0,0 +1,24 @@
+"""
+Services page
+"""
+
+import streamlit as st
+
+from views.fragments import main_header_html, service_card_html
+
+LABEL = "📝 Services"
+# Data this page reads; the app loads only these for it
+DATA = ('content',)
+
+def render(data):
+    """Render the Services page"""
+    content = data['content']
+    st.markdown(main_header_html("Our Services"), unsafe_allow_html=True)
+    st.markdown("---")
+    
+    services = content.services
+    
+    for service in services:
+        st.markdown(service_card_html(service), unsafe_allow_html=True)
+    
+    st.info("💡 **For Odoo Integration**: Each service will become a `slide.tag` (course category) for I-Solutions")
@@ -0,0 +1,24 @@
+"""
+Testimonials page
+"""
+
+import streamlit as st
+
+from views.fragments import main_header_html, testimonial_card_html
+
+LABEL = "⭐ Testimonials"
+# Data this page reads; the app loads only these for it
+DATA = ('content',)
+
+def render(data):
+    """Render the Testimonials page"""
+    content = data['content']
+    st.markdown(main_header_html("Client Testimonials"), unsafe_allow_html=True)
+    st.markdown("---")
+    
+    testimonials = content.testimonials
+    
+    for idx, testimonial in enumerate(testimonials, 1):
+        st.markdown(testimonial_card_html(testimonial), unsafe_allow_html=True)
+    
+    st.info("💡 **For Odoo Integration**: Testimonials will be created as `blog.post` records for I-Solutions")